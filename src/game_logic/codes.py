@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+# Integer encodings used by the bitboard side of the game logic. Squares are numbered 0-63 as row * 8 + col, so that
+# the coordinates (0, 0) map to square 0 (A1) and (7, 7) map to square 63 (H8)
+
+WHITE = 0
+BLACK = 1
+COLOURS = ["WHITE", "BLACK"]
+
+PAWN = 0
+KNIGHT = 1
+BISHOP = 2
+ROOK = 3
+QUEEN = 4
+KING = 5
+PIECE_TYPES = ["PAWN", "KNIGHT", "BISHOP", "ROOK", "QUEEN", "KING"]
+# Value of each piece type in the scores of the players, as per Chess.com, see Piece.value
+PIECE_SCORES = [1, 3, 3, 5, 9, 0]
+
+# Flags for compact moves, which are (source square, dest square, flag) tuples. For promotions, flag - 3 is the type
+# of piece promoted to
+QUIET = 0
+DOUBLE_PUSH = 1
+EN_PASSANT = 2
+CASTLE = 3
+PROMOTE_KNIGHT = 4
+PROMOTE_BISHOP = 5
+PROMOTE_ROOK = 6
+PROMOTE_QUEEN = 7
+
+# Bits of the castling rights int
+WHITE_KING_SIDE = 1
+WHITE_QUEEN_SIDE = 2
+BLACK_KING_SIDE = 4
+BLACK_QUEEN_SIDE = 8
+ALL_CASTLING = 15
+
+# Letters for pieces and castling rights in Forsyth-Edwards Notation, upper case for white and lower case for black
+PIECE_LETTERS = "PNBRQK"
+CASTLING_LETTERS = {"K": WHITE_KING_SIDE, "Q": WHITE_QUEEN_SIDE, "k": BLACK_KING_SIDE, "q": BLACK_QUEEN_SIDE}
+
+
+class CodeHelper:
+    """
+    Helper class to convert between the string and coordinate conventions used by Piece and Position objects and the
+    integer codes used by bitboards
+
+    A piece code packs the colour and type of a piece into one int, colour * 6 + type. So white pieces are 0-5 and
+    black pieces are 6-11
+    """
+
+    @staticmethod
+    def piece_code(colour: str, piece_type: str) -> int:
+        """
+        Finds the piece code for a piece of a given colour and type
+
+        :param colour: str for the colour of a piece, either 'WHITE' or 'BLACK'
+        :param piece_type: str for the type of a piece, as per Piece.type
+        :return: int for the piece code as described
+        """
+        return CodeHelper.colour_index(colour) * 6 + PIECE_TYPES.index(piece_type)
+
+    @staticmethod
+    def colour_index(colour: str) -> int:
+        """
+        Finds the index of a colour, WHITE is 0 and BLACK is 1
+
+        :param colour: str for the colour
+        :return: int as described
+        """
+        assert colour in COLOURS, "Colour must be either 'WHITE' or 'BLACK'"
+        return COLOURS.index(colour)
+
+    @staticmethod
+    def code_colour(code: int) -> str:
+        """
+        Finds the colour of the piece that a piece code represents
+
+        :param code: int for a piece code
+        :return: str for the colour as described
+        """
+        return COLOURS[code // 6]
+
+    @staticmethod
+    def code_type(code: int) -> str:
+        """
+        Finds the type of the piece that a piece code represents
+
+        :param code: int for a piece code
+        :return: str for the type of piece as described, as per Piece.type
+        """
+        return PIECE_TYPES[code % 6]
+
+    @staticmethod
+    def square(coords: tuple[int, int]) -> int:
+        """
+        Finds the square index of a coordinate pair
+
+        :param coords: tuple for coordinates on a chessboard
+        :return: int from 0-63 as described
+        """
+        return coords[0] * 8 + coords[1]
+
+    @staticmethod
+    def coords(square: int) -> tuple[int, int]:
+        """
+        Finds the coordinate pair of a square index
+
+        :param square: int from 0-63 for a square on a chessboard
+        :return: tuple for the coordinates as described
+        """
+        return square >> 3, square & 7
+
+    @staticmethod
+    def squares(bitboard: int) -> list[int]:
+        """
+        Finds the squares that are set in a bitboard, in ascending order
+
+        :param bitboard: int for a bitboard
+        :return: list of square indices as described
+        """
+        squares = []
+        while bitboard:
+            lowest = bitboard & -bitboard
+            squares.append(lowest.bit_length() - 1)
+            bitboard ^= lowest
+        return squares
+
+    @staticmethod
+    def piece_letter(colour: str, piece_type: str) -> str:
+        """
+        Finds the FEN letter of a piece, e.g. 'N' for a white knight and 'n' for a black knight
+
+        :param colour: str for the colour of the piece
+        :param piece_type: str for the type of the piece
+        :return: str as described
+        """
+        letter = PIECE_LETTERS[PIECE_TYPES.index(piece_type)]
+        return letter if colour == "WHITE" else letter.lower()
+
+    @staticmethod
+    def letter_piece(letter: str) -> tuple[str, str]:
+        """
+        Finds the colour and type of a piece from its FEN letter, the opposite of piece_letter()
+
+        :param letter: str for the FEN letter of the piece
+        :return: tuple of str for (colour, piece type)
+        """
+        if len(letter) != 1 or letter.upper() not in PIECE_LETTERS:
+            raise ValueError(f"Invalid FEN piece letter '{letter}'")
+        return "WHITE" if letter.isupper() else "BLACK", PIECE_TYPES[PIECE_LETTERS.index(letter.upper())]
+
+    @staticmethod
+    def square_name(square: int) -> str:
+        """
+        Finds the algebraic name of a square, e.g. 'e4'
+
+        :param square: int from 0-63 for a square on a chessboard
+        :return: str as described
+        """
+        return "abcdefgh"[square & 7] + str((square >> 3) + 1)
+
+    @staticmethod
+    def name_square(name: str) -> int:
+        """
+        Finds the square for an algebraic square name, the opposite of square_name()
+
+        :param name: str for the name of a square, e.g. 'e4'
+        :return: int from 0-63 for the square
+        """
+        assert len(name) == 2 and name[0] in "abcdefgh" and name[1] in "12345678", f"Invalid square name '{name}'"
+        return (int(name[1]) - 1) * 8 + "abcdefgh".index(name[0])
+
+    @staticmethod
+    def move_name(move: tuple[int, int, int]) -> str:
+        """
+        Finds the long algebraic name of a compact move, e.g. 'e2e4', or 'e7e8q' for a promotion
+
+        :param move: tuple for a compact move
+        :return: str as described
+        """
+        source, dest, flag = move
+        name = CodeHelper.square_name(source) + CodeHelper.square_name(dest)
+        if flag >= PROMOTE_KNIGHT:
+            name += "pnbrqk"[flag - 3]
+        return name
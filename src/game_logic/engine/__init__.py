@@ -0,0 +1,10 @@
+from src.game_logic.engine.evaluator import Evaluator
+from src.game_logic.engine.searchengine import SearchEngine
+from src.game_logic.engine.transpositiontable import TranspositionTable
+from src.game_logic.engine.analysispool import AnalysisPool
+from src.game_logic.engine.polyglotkeys import PolyglotKeys
+from src.game_logic.engine.openingbook import OpeningBook
+from src.game_logic.engine.tablebase import Tablebase
+from src.game_logic.engine.tablebasegenerator import TablebaseGenerator
+from src.game_logic.engine.moveorderer import MoveOrderer
+from src.game_logic.engine.staticexchange import StaticExchange
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING
+
+from src.game_logic.engine.searchengine import SearchEngine
+from src.game_logic.helpers import CoordsHelper
+from src.game_logic.mid_level.move_finders.legalmovegenerator import LegalMoveGenerator
+from src.game_logic.mid_level.support.bitboard import BitBoard
+
+if TYPE_CHECKING:
+    from src.game_logic.mid_level.support.boardsnapshot import BoardSnapshot
+
+
+class AnalysisPool:
+    """
+    Analyses positions with every root move searched in parallel by a pool of worker processes
+
+    The root moves of a position are split across the workers, and each worker searches the subtree under its move with
+    its own SearchEngine, which it keeps between moves and positions so that its transposition table stays warm.
+    Positions are sent to the workers as BoardSnapshots, so only the piece codes and game state are pickled, never the
+    Position, Piece or MoveFinder objects of a board. The scores of the moves are merged into a ranked list.
+
+    Searching in processes rather than threads lets the search use every core, since it is pure Python. Use as a
+    context manager, or call close() when done, so that the workers are shut down
+    """
+
+    # The engine of a worker process, made by _init_worker() when the process starts
+    _worker_engine: SearchEngine | None = None
+
+    def __init__(self, processes: int | None = None, table_size_mb: int = 16):
+        """
+        Constructor for an AnalysisPool
+
+        :param processes: int for the number of worker processes, leave as None for one per core. 0 searches in the
+        calling process instead, useful for debugging
+        :param table_size_mb: int for the most memory that the transposition table of each worker can use in megabytes,
+        default 16
+        """
+        assert processes is None or processes >= 0, "Number of processes can't be negative"
+        self.processes = processes
+        self.table_size_mb = table_size_mb
+        self.__executor = None
+        if processes != 0:
+            self.__executor = ProcessPoolExecutor(processes, initializer=AnalysisPool._init_worker,
+                                                  initargs=(table_size_mb,))
+        else:
+            AnalysisPool._init_worker(table_size_mb)
+
+    def __enter__(self) -> AnalysisPool:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Shuts down the worker processes of this pool, waiting for any searches still running
+
+        :return: None
+        """
+        if self.__executor is not None:
+            self.__executor.shutdown()
+            self.__executor = None
+
+    def analyse(self, board: 'BitBoard', time_budget: float,
+                max_depth: int = SearchEngine.MAX_DEPTH) -> list[tuple[tuple[int, int, int], int, int]]:
+        """
+        Searches every legal move of the side to move on a board, each in its own task
+
+        The board is left as it was found
+
+        :param board: BitBoard object with the position to analyse, must have a move generator
+        :param time_budget: float for the number of seconds that the search of each move can take
+        :param max_depth: int for the deepest that each move is searched, counting the move itself. Default
+        SearchEngine.MAX_DEPTH
+        :return: list of tuples of (compact move, score, depth) for each move, best first. Scores are in centipawns from
+        the point of view of the side to move, and depth is how deep the move was fully searched
+        """
+        assert max_depth >= 1, "Moves must be searched to a depth of at least 1"
+        snapshot = board.snapshot()
+        moves = board.move_generator.generate(board.side_to_move)
+        tasks = [(snapshot, move, time_budget, max_depth) for move in moves]
+        if self.__executor is None:
+            results = [AnalysisPool._search_root_move(task) for task in tasks]
+        else:
+            results = list(self.__executor.map(AnalysisPool._search_root_move, tasks))
+        ranked = [(move, score, depth) for move, (score, depth) in zip(moves, results)]
+        ranked.sort(key=lambda result: -result[1])
+        return ranked
+
+    @staticmethod
+    def _init_worker(table_size_mb: int) -> None:
+        """
+        Makes the SearchEngine of a worker process
+
+        :param table_size_mb: int for the most memory that the transposition table can use in megabytes
+        :return: None
+        """
+        AnalysisPool._worker_engine = SearchEngine(table_size_mb)
+
+    @staticmethod
+    def _search_root_move(task: tuple['BoardSnapshot', tuple[int, int, int], float, int]) -> tuple[int, int]:
+        """
+        Searches the subtree under a root move, run in a worker process
+
+        :param task: tuple of the snapshot of the root position, the root move, the time budget in seconds and the
+        deepest depth to search to, see analyse()
+        :return: tuple of the score of the move from the point of view of the side that plays it, and the depth that
+        the move was fully searched to
+        """
+        snapshot, move, time_budget, max_depth = task
+        engine = AnalysisPool._worker_engine
+        board = BitBoard.from_snapshot(snapshot, CoordsHelper())
+        board.move_generator = LegalMoveGenerator(board)
+        board.make_move(move)
+        side = board.side_to_move
+        if not board.move_generator.generate(side):
+            # Checkmate or stalemate straight after the root move
+            return (SearchEngine.MATE - 1 if board.side_in_check(side) else 0), 1
+        if max_depth == 1:
+            return -engine.evaluator.evaluate(board), 1
+        colour = "WHITE" if side == 0 else "BLACK"
+        engine.best_move(board, colour, time_budget, max_depth - 1)
+        if engine.depth == 0:
+            return -engine.evaluator.evaluate(board), 1  # Not even one ply was searched in time
+        score = -engine.score
+        # Mate scores count plies from the position after the root move, so add the root move to them
+        if score >= SearchEngine.MATE - SearchEngine.MAX_PLY:
+            score -= 1
+        elif score <= -SearchEngine.MATE + SearchEngine.MAX_PLY:
+            score += 1
+        return score, engine.depth + 1
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src.game_logic.codes import CodeHelper
+from src.game_logic.mid_level.support.piecesquaretables import PieceSquareTables
+
+if TYPE_CHECKING:
+    from src.game_logic.mid_level.support.bitboard import BitBoard
+
+
+class Evaluator:
+    """
+    Scores positions on a BitBoard by material and piece-square tables
+
+    A BitBoard keeps the middle game and end game sums of its pieces and the game phase up to date as moves are made
+    and unmade, so scoring a position is a blend of these sums rather than a scan of the pieces. The blend leans towards
+    the end game values as pieces come off the board, e.g. so that the king moves up once the queens are gone.
+    """
+
+    def evaluate(self, board: 'BitBoard') -> int:
+        """
+        Scores the position on a board
+
+        :param board: BitBoard object with the position to score
+        :return: int for the score in centipawns from the point of view of the side to move
+        """
+        phase = min(board.phase, PieceSquareTables.MAX_PHASE)
+        score = (board.middle_score * phase + board.end_score * (PieceSquareTables.MAX_PHASE - phase)) \
+            // PieceSquareTables.MAX_PHASE
+        return -score if board.side_to_move else score
+
+    def evaluate_colour(self, board: 'BitBoard', colour: str) -> int:
+        """
+        Scores the position on a board for a colour, whoever's turn it is
+
+        :param board: BitBoard object with the position to score
+        :param colour: str for the colour to score the position for
+        :return: int for the score in centipawns from the point of view of the colour
+        """
+        score = self.evaluate(board)
+        return score if CodeHelper.colour_index(colour) == board.side_to_move else -score
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterator
+
+from src.game_logic.codes import PAWN, KING, EN_PASSANT, PROMOTE_KNIGHT, PROMOTE_QUEEN, PIECE_SCORES
+
+if TYPE_CHECKING:
+    from src.game_logic.mid_level.support.bitboard import BitBoard
+
+
+class MoveOrderer:
+    """
+    Orders the moves of a position for a search, so that the moves most likely to cause a cutoff are searched first
+
+    Moves are yielded in stages:
+
+    - the hash move, ie the best move stored in the transposition table for the position
+    - captures and promotions to a queen, by MVV-LVA, ie the most valuable victim first and then the least valuable
+      attacker, with the values that Setup gives Piece.value, see PIECE_SCORES
+    - killer moves, quiet moves that caused a cutoff at the same ply elsewhere in the tree
+    - the other quiet moves, by their history score, which grows each time a move of the same piece to the same square
+      causes a cutoff
+
+    Each stage is only sorted once the stages before it have been searched, so a cutoff in an early stage saves the
+    sorting of the rest. The killers and history are kept between searches, see new_search()
+    """
+
+    KILLERS_PER_PLY = 2
+    # History scores are halved once any of them passes this, so that recent cutoffs count for more than old ones
+    MAX_HISTORY = 1 << 20
+    # The king counts as the most valuable attacker, since it can only take pieces that aren't defended. Attacker
+    # values must stay below 16, so that they never outweigh the value taken
+    KING_ATTACKER_VALUE = 10
+
+    def __init__(self, max_ply: int = 128):
+        """
+        Constructor for a MoveOrderer
+
+        :param max_ply: int for the deepest ply that killer moves are kept for, default 128
+        """
+        self.max_ply = max_ply
+        self.killers = [[None] * self.KILLERS_PER_PLY for _ in range(max_ply + 1)]
+        self.history = [[0] * 64 for _ in range(12)]
+
+    def new_search(self) -> None:
+        """
+        Moves this orderer on to a new search, forgetting the killer moves and halving the history scores, since the
+        positions of the new search are further on
+
+        :return: None
+        """
+        for killers in self.killers:
+            killers[:] = [None] * self.KILLERS_PER_PLY
+        self.__age_history()
+
+    def clear(self) -> None:
+        """
+        Forgets every killer move and history score, eg for a new game
+
+        :return: None
+        """
+        self.new_search()
+        self.history = [[0] * 64 for _ in range(12)]
+
+    def ordered(self, board: 'BitBoard', moves: list[tuple[int, int, int]], ply: int,
+                hash_move: tuple[int, int, int] | None = None) -> Iterator[tuple[int, int, int]]:
+        """
+        Yields the moves of a position in stages, see MoveOrderer
+
+        The board must be back in the position when the next move is asked for, ie any move made is unmade first
+
+        :param board: BitBoard object with the position
+        :param moves: list of compact moves of the position
+        :param ply: int for the number of plies from the root of the search
+        :param hash_move: compact move stored in the transposition table for the position, or None
+        :return: iterator of the compact moves as described
+        """
+        mailbox = board.mailbox
+        captures, quiets = [], []
+        for move in moves:
+            if move == hash_move:
+                continue
+            (captures if MoveOrderer.is_tactical(mailbox, move) else quiets).append(move)
+        if hash_move is not None and len(captures) + len(quiets) < len(moves):
+            yield hash_move
+
+        captures.sort(key=lambda capture: MoveOrderer.mvv_lva(mailbox, capture), reverse=True)
+        yield from captures
+
+        killers = self.killers[ply] if ply <= self.max_ply else []
+        for killer in killers:
+            if killer is not None and killer in quiets:
+                quiets.remove(killer)
+                yield killer
+
+        history = self.history
+        quiets.sort(key=lambda quiet: history[mailbox[quiet[0]]][quiet[1]], reverse=True)
+        yield from quiets
+
+    def record_cutoff(self, board: 'BitBoard', move: tuple[int, int, int], depth: int, ply: int) -> None:
+        """
+        Records a move that caused a cutoff, as a killer move of its ply and in the history, unless it is a capture or
+        promotion to a queen, which are ordered by MVV-LVA anyway
+
+        :param board: BitBoard object with the position the move was made from
+        :param move: compact move that caused the cutoff
+        :param depth: int for the number of plies that were left to search from the position
+        :param ply: int for the number of plies from the root of the search
+        :return: None
+        """
+        mailbox = board.mailbox
+        if MoveOrderer.is_tactical(mailbox, move):
+            return
+        if ply <= self.max_ply:
+            killers = self.killers[ply]
+            if killers[0] != move:
+                killers[1:] = killers[:-1]
+                killers[0] = move
+        row = self.history[mailbox[move[0]]]
+        row[move[1]] += depth * depth
+        if row[move[1]] > self.MAX_HISTORY:
+            self.__age_history()
+
+    @staticmethod
+    def is_tactical(mailbox: list[int | None], move: tuple[int, int, int]) -> bool:
+        """
+        Finds out if a move is a capture or a promotion to a queen, ie one of the moves ordered by MVV-LVA
+
+        :param mailbox: the piece code on each square of the board
+        :param move: compact move
+        :return: bool as described
+        """
+        return mailbox[move[1]] is not None or move[2] == EN_PASSANT or move[2] == PROMOTE_QUEEN
+
+    @staticmethod
+    def mvv_lva(mailbox: list[int | None], move: tuple[int, int, int]) -> int:
+        """
+        Scores a capture or promotion by the value of the piece taken, then by the value of the piece taking it
+
+        A promotion counts the piece gained in place of the pawn towards the value taken
+
+        :param mailbox: the piece code on each square of the board
+        :param move: compact move
+        :return: int for the score, higher is better
+        """
+        victim = mailbox[move[1]]
+        taken = PIECE_SCORES[PAWN] if move[2] == EN_PASSANT else 0 if victim is None else PIECE_SCORES[victim % 6]
+        if move[2] >= PROMOTE_KNIGHT:
+            taken += PIECE_SCORES[move[2] - PROMOTE_KNIGHT + 1] - PIECE_SCORES[PAWN]
+        attacker = mailbox[move[0]] % 6
+        return taken * 16 - (MoveOrderer.KING_ATTACKER_VALUE if attacker == KING else PIECE_SCORES[attacker])
+
+    def __age_history(self) -> None:
+        """
+        Halves every history score
+
+        :return: None
+        """
+        for row in self.history:
+            for square in range(64):
+                row[square] >>= 1
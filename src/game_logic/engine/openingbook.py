@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import mmap
+import random
+import struct
+from typing import TYPE_CHECKING
+
+from src.game_logic.codes import CodeHelper, QUIET, DOUBLE_PUSH, EN_PASSANT, CASTLE, PROMOTE_KNIGHT
+from src.game_logic.engine.polyglotkeys import PolyglotKeys
+from src.game_logic.helpers import CoordsHelper
+from src.game_logic.mid_level.move_finders.legalmovegenerator import LegalMoveGenerator
+from src.game_logic.mid_level.support.bitboard import BitBoard
+
+if TYPE_CHECKING:
+    from src.game_logic.mid_level.support.board import Board
+    from src.game_logic.mid_level.moves.move import Move
+
+
+class OpeningBook:
+    """
+    Reads the moves for a position from an opening book in the Polyglot .bin format
+
+    A book is a file of 16 byte entries sorted by key, each a big-endian 64-bit position key, 16-bit move, 16-bit weight
+    and 32-bit learn value. The file is memory mapped rather than read in, and the entries for a position are found with
+    a binary search on its key, so opening a book takes no time and only the pages that a lookup touches are read, no
+    matter how big the book is.
+
+    Positions are looked up by their standard Polyglot key, see polyglot_key() and PolyglotKeys, so books made by other
+    programs can be read, and books written with write() can be read by them.
+
+    Moves are stored as in Polyglot, with the dest square in bits 0-5, the source square in bits 6-11 and the piece
+    promoted to in bits 12-14 (1 for a knight up to 4 for a queen). Castling is stored as the king moving onto its rook.
+    Use as a context manager, or call close() when done, so that the file is unmapped
+    """
+
+    ENTRY = struct.Struct(">QHHI")
+
+    # The square of the rook that a king moves onto for a castling in a book, keyed by the square the king moves to
+    CASTLING_ROOKS = {6: 7, 2: 0, 62: 63, 58: 56}
+    # The square that a king moves to for a castling, keyed by the square of the rook it moves onto in a book
+    CASTLING_KINGS = {7: 6, 0: 2, 63: 62, 56: 58}
+
+    def __init__(self, path: str):
+        """
+        Constructor for an OpeningBook
+
+        :param path: str for the path of the book file
+        """
+        self.path = path
+        self.__file = open(path, "rb")
+        self.__book = None
+        self.__size = 0
+        try:
+            self.__book = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.__size = len(self.__book) // self.ENTRY.size
+        except ValueError:
+            pass  # An empty file can't be mapped, it is a book without any entries
+
+    def __enter__(self) -> OpeningBook:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def close(self) -> None:
+        """
+        Unmaps and closes the book file
+
+        :return: None
+        """
+        if self.__book is not None:
+            self.__book.close()
+            self.__book = None
+        self.__file.close()
+
+    def entries(self, key: int) -> list[tuple[int, int, int]]:
+        """
+        Finds the entries of this book for a position key
+
+        :param key: int for the key of a position
+        :return: list of tuples of (move, weight, learn value) for each entry, in the order of the book
+        """
+        entry = self.ENTRY
+        book = self.__book
+        low, high = 0, self.__size
+        while low < high:
+            middle = (low + high) >> 1
+            if entry.unpack_from(book, middle * entry.size)[0] < key:
+                low = middle + 1
+            else:
+                high = middle
+        found = []
+        while low < self.__size:
+            entry_key, move, weight, learn = entry.unpack_from(book, low * entry.size)
+            if entry_key != key:
+                break
+            found.append((move, weight, learn))
+            low += 1
+        return found
+
+    def compact_moves(self, board: 'Board') -> list[tuple[tuple[int, int, int], int]]:
+        """
+        Finds the moves of this book for the position on a board
+
+        Moves that aren't legal in the position are left out, in case of a collision between keys. They are checked
+        against the moves of a LegalMoveGenerator, on a BitBoard made from a snapshot if the board isn't one
+
+        :param board: Board object for the position
+        :return: list of tuples of (compact move, weight), see BitBoard
+        """
+        found = []
+        entries = self.entries(self.polyglot_key(board))
+        if not entries:
+            return found
+        legal_moves = OpeningBook.__generator(board).moves()
+        for book_move, weight, _ in entries:
+            move = self.decode_move(board, book_move)
+            if move is not None and move in legal_moves:
+                found.append((move, weight))
+        return found
+
+    def moves(self, board: 'Board') -> list[tuple['Move', int]]:
+        """
+        Finds the moves of this book for the position on a board as Move objects, see compact_moves()
+
+        Promotions, including under-promotions, are given the piece promoted to from the promotion bits of the book move
+
+        :param board: Board object for the position
+        :return: list of tuples of (Move object, weight) for moves that can be readily executed
+        """
+        return [(self.__create_move(board, compact_move), weight) for compact_move, weight in self.compact_moves(board)]
+
+    def choose_compact(self, board: 'Board', weighted: bool = True,
+                       rng: random.Random | None = None) -> tuple[int, int, int] | None:
+        """
+        Chooses a move of this book for the position on a board
+
+        :param board: Board object for the position
+        :param weighted: bool for if a move should be picked at random, in proportion to its weight. Otherwise the move
+        with the highest weight is picked. Default True
+        :param rng: Random object to pick with, leave as None to use the random module
+        :return: compact move as described, or None if the position isn't in this book
+        """
+        return self.__choose(self.compact_moves(board), weighted, rng)
+
+    def choose(self, board: 'Board', weighted: bool = True, rng: random.Random | None = None) -> 'Move' | None:
+        """
+        Chooses a move of this book for the position on a board as a Move object, see choose_compact()
+
+        :return: Move object that can be readily executed, or None if the position isn't in this book
+        """
+        return self.__choose(self.moves(board), weighted, rng)
+
+    @staticmethod
+    def __choose(moves: list[tuple[object, int]], weighted: bool, rng: random.Random | None):
+        """
+        Chooses a move from a list of moves and their weights, see choose_compact()
+
+        :return: the move chosen, or None if there aren't any
+        """
+        if not moves:
+            return None
+        if not weighted:
+            return max(moves, key=lambda move: move[1])[0]
+        weights = [weight for _, weight in moves]
+        if not any(weights):
+            weights = None  # Entries that all have no weight are picked from evenly
+        return (rng or random).choices([move for move, _ in moves], weights)[0]
+
+    @staticmethod
+    def polyglot_key(board: 'Board') -> int:
+        """
+        Finds the key that the position on a board is stored under in a book, see PolyglotKeys
+
+        :param board: Board object for the position
+        :return: int for the 64-bit Polyglot key of the position
+        """
+        return PolyglotKeys.key(board)
+
+    @staticmethod
+    def encode_move(move: tuple[int, int, int]) -> int:
+        """
+        Finds the book move for a compact move, the opposite of decode_move()
+
+        :param move: tuple for a compact move
+        :return: int for the book move as described
+        """
+        source, dest, flag = move
+        if flag == CASTLE:
+            dest = OpeningBook.CASTLING_ROOKS[dest]
+        promotion = flag - PROMOTE_KNIGHT + 1 if flag >= PROMOTE_KNIGHT else 0
+        return promotion << 12 | source << 6 | dest
+
+    @staticmethod
+    def decode_move(board: 'Board', book_move: int) -> tuple[int, int, int] | None:
+        """
+        Finds the compact move for a book move in the position on a board
+
+        :param board: Board object for the position
+        :param book_move: int for a book move
+        :return: tuple for the compact move, or None if there isn't a piece of the side to move on its source square
+        """
+        source, dest, promotion = book_move >> 6 & 63, book_move & 63, book_move >> 12 & 7
+        piece = board.get_position(CodeHelper.coords(source)).piece
+        if piece is None or CodeHelper.colour_index(piece.colour) != board.side_to_move:
+            return None
+        if piece.type == "KING":
+            target = board.get_position(CodeHelper.coords(dest)).piece
+            if target is not None and target.type == "ROOK" and target.colour == piece.colour \
+                    and dest in OpeningBook.CASTLING_KINGS:
+                return source, OpeningBook.CASTLING_KINGS[dest], CASTLE
+        elif piece.type == "PAWN":
+            if promotion:
+                return source, dest, PROMOTE_KNIGHT + promotion - 1
+            if abs(dest - source) == 16:
+                return source, dest, DOUBLE_PUSH
+            if dest == board.ep_square and (dest - source) % 8:
+                return source, dest, EN_PASSANT
+        return source, dest, QUIET
+
+    @staticmethod
+    def write(path: str, entries: list[tuple[int, tuple[int, int, int], int]]) -> None:
+        """
+        Writes an opening book, sorted by key as readers expect
+
+        :param path: str for the path of the book file
+        :param entries: list of tuples of (position key, compact move, weight), with the Polyglot key of each position,
+        see polyglot_key()
+        :return: None
+        """
+        packed = sorted((key, OpeningBook.encode_move(move), weight, 0) for key, move, weight in entries)
+        with open(path, "wb") as file:
+            for entry in packed:
+                file.write(OpeningBook.ENTRY.pack(*entry))
+
+    @staticmethod
+    def __generator(board: 'Board') -> LegalMoveGenerator:
+        """
+        Finds the LegalMoveGenerator to check the moves of a board with
+
+        :param board: Board object
+        :return: LegalMoveGenerator object as described
+        """
+        if board.backend != "BITBOARD":
+            board = BitBoard.from_snapshot(board.snapshot(), CoordsHelper())
+        if board.move_generator is None:
+            return LegalMoveGenerator(board)
+        return board.move_generator
+
+    @staticmethod
+    def __create_move(board: 'Board', move: tuple[int, int, int]) -> 'Move':
+        """
+        Creates the Move object for a compact move on a board, with the MoveFinder of the piece that moves
+
+        :return: Move object as described, with the piece promoted to for a promotion
+        """
+        piece = board.get_position(CodeHelper.coords(move[0])).piece
+        return piece.move_finder._create_move(move)
+
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from src.game_logic.codes import CodeHelper, EN_PASSANT, PROMOTE_KNIGHT
+from src.game_logic.engine.evaluator import Evaluator
+from src.game_logic.engine.moveorderer import MoveOrderer
+from src.game_logic.engine.staticexchange import StaticExchange
+from src.game_logic.engine.transpositiontable import TranspositionTable
+
+if TYPE_CHECKING:
+    from src.game_logic.mid_level.support.bitboard import BitBoard
+
+
+class SearchEngine:
+    """
+    Chooses moves for the side to move on a BitBoard
+
+    Searches with iterative deepening negamax, alpha-beta pruning and principal variation search. Each iteration
+    searches one ply deeper than the last, with the moves ordered by a MoveOrderer so that the best moves found so far,
+    stored in a TranspositionTable, are searched first. The first move at each node is searched with the full window,
+    and the rest with a null window that only proves they are no better, re-searching any that turn out to be better.
+    Leaf nodes are extended with a quiescence search of captures that don't lose material, so that positions aren't
+    scored in the middle of an exchange.
+
+    Positions are scored by an Evaluator, in centipawns from the point of view of the side to move
+    """
+
+    INFINITY = 1000000
+    MATE = 100000
+    MAX_PLY = 128
+    MAX_DEPTH = 64
+    NODES_PER_TIME_CHECK = 1024
+
+    def __init__(self, table_size_mb: int = 16, evaluator: Evaluator | None = None):
+        """
+        Constructor for a SearchEngine
+
+        :param table_size_mb: int for the most memory that the transposition table of this engine can use in megabytes,
+        default 16
+        :param evaluator: Evaluator object to score positions with, leave as None for a default Evaluator
+        """
+        self.table = TranspositionTable(table_size_mb)
+        self.evaluator = Evaluator() if evaluator is None else evaluator
+        self.orderer = MoveOrderer(self.MAX_PLY)
+        self.board = None
+        self.nodes = 0
+        self.depth = 0
+        self.score = 0
+        self.__deadline = None
+        self.__stopped = False
+        self.__stop_event = None
+        self.__root_best = None
+
+    def best_move(self, board: 'BitBoard', side: str, time_budget: float, max_depth: int = MAX_DEPTH,
+                  stop_event: threading.Event | None = None) -> tuple[int, int, int] | None:
+        """
+        Finds the best move for a side within a time budget
+
+        The board is left as it was found
+
+        :param board: BitBoard object with the position to search, must have a move generator
+        :param side: str for the colour of the side to find a move for, must be the side to move
+        :param time_budget: float for the number of seconds that the search can take
+        :param max_depth: int for the deepest iteration to search to, default MAX_DEPTH
+        :param stop_event: Event object that cuts the search short once it is set, as if the time budget had run out,
+        so that another thread can stop it. Leave as None to only stop on time
+        :return: compact move that was found best, or None if the side has no legal moves
+        """
+        assert CodeHelper.colour_index(side) == board.side_to_move, "Can only find a best move for the side to move"
+        assert time_budget > 0, "Time budget must be positive"
+        self.board = board
+        self.nodes = 0
+        self.depth = 0
+        self.score = 0
+        self.__deadline = time.perf_counter() + time_budget
+        self.__stopped = False
+        self.__stop_event = stop_event
+        self.table.new_search()
+        self.orderer.new_search()
+
+        moves = board.move_generator.generate(board.side_to_move)
+        if not moves:
+            return None
+        best_move = moves[0]
+        for depth in range(1, max_depth + 1):
+            self.__root_best = None
+            score = self.__negamax(depth, -self.INFINITY, self.INFINITY, 0)
+            if self.__root_best is not None:
+                best_move = self.__root_best  # Even a cut short iteration searches the previous best move first
+            if self.__stopped:
+                break
+            self.depth, self.score = depth, score
+            if abs(score) >= self.MATE - self.MAX_PLY:
+                break  # A forced mate has been found, searching deeper won't change it
+        return best_move
+
+    def __negamax(self, depth: int, alpha: int, beta: int, ply: int) -> int:
+        """
+        Searches the position on the board with alpha-beta pruning and principal variation search
+
+        :param depth: int for the number of plies left to search before the quiescence search
+        :param alpha: int for the score that the side to move is already sure of
+        :param beta: int for the score that the opponent is already sure of
+        :param ply: int for the number of plies from the root of the search
+        :return: int for the score of the position, from the point of view of the side to move
+        """
+        if self.__out_of_time():
+            return 0
+        board = self.board
+        if ply > 0 and board.halfmove_clock >= 100:
+            return 0
+        key = board.zobrist_key
+        entry = self.table.probe(key)
+        table_move = None
+        if entry is not None:
+            table_move, table_depth, bound, table_score = entry
+            if ply > 0 and table_depth >= depth:
+                table_score = self.__score_from_table(table_score, ply)
+                if bound == TranspositionTable.EXACT:
+                    return table_score
+                if bound == TranspositionTable.LOWER:
+                    alpha = max(alpha, table_score)
+                elif bound == TranspositionTable.UPPER:
+                    beta = min(beta, table_score)
+                if alpha >= beta:
+                    return table_score
+        if depth <= 0 or ply >= self.MAX_PLY:
+            return self.__quiescence(alpha, beta, ply)
+
+        moves = board.move_generator.generate(board.side_to_move)
+        if not moves:
+            return -self.MATE + ply if board.side_in_check(board.side_to_move) else 0
+        original_alpha = alpha
+        best_score, best_move = -self.INFINITY, None
+        for i, move in enumerate(self.orderer.ordered(board, moves, ply, table_move)):
+            board.make_move(move)
+            if i == 0:
+                score = -self.__negamax(depth - 1, -beta, -alpha, ply + 1)
+            else:
+                score = -self.__negamax(depth - 1, -alpha - 1, -alpha, ply + 1)
+                if alpha < score < beta:
+                    score = -self.__negamax(depth - 1, -beta, -alpha, ply + 1)
+            board.unmake_move()
+            if self.__stopped:
+                return 0
+            if score > best_score:
+                best_score, best_move = score, move
+                if ply == 0:
+                    self.__root_best = move
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                self.orderer.record_cutoff(board, move, depth, ply)
+                break
+
+        if best_score >= beta:
+            bound = TranspositionTable.LOWER
+        elif best_score <= original_alpha:
+            bound = TranspositionTable.UPPER
+        else:
+            bound = TranspositionTable.EXACT
+        self.table.store(key, best_move, depth, bound, self.__score_to_table(best_score, ply))
+        return best_score
+
+    def __quiescence(self, alpha: int, beta: int, ply: int) -> int:
+        """
+        Searches only the captures and promotions from the position on the board, until the position is quiet
+
+        Captures that lose material by static exchange evaluation are skipped, see StaticExchange
+
+        :param alpha: int for the score that the side to move is already sure of
+        :param beta: int for the score that the opponent is already sure of
+        :param ply: int for the number of plies from the root of the search
+        :return: int for the score of the position, from the point of view of the side to move
+        """
+        if self.__out_of_time():
+            return 0
+        stand_pat = self.evaluator.evaluate(self.board)
+        if stand_pat >= beta or ply >= self.MAX_PLY:
+            return stand_pat
+        alpha = max(alpha, stand_pat)
+        board = self.board
+        mailbox = board.mailbox
+        captures = [move for move in board.move_generator.generate(board.side_to_move)
+                    if move[2] >= PROMOTE_KNIGHT or (mailbox[move[1]] is not None or move[2] == EN_PASSANT)
+                    and StaticExchange.move_exchange(board, move) >= 0]
+        for move in self.orderer.ordered(board, captures, ply):
+            board.make_move(move)
+            score = -self.__quiescence(-beta, -alpha, ply + 1)
+            board.unmake_move()
+            if self.__stopped:
+                return 0
+            if score >= beta:
+                return score
+            alpha = max(alpha, score)
+        return alpha
+
+    def __out_of_time(self) -> bool:
+        """
+        Counts a node, and finds out if the search has run out of time or been stopped. The clock and stop event are
+        only checked every so many nodes
+
+        :return: bool as described
+        """
+        self.nodes += 1
+        if not self.__stopped and self.nodes % self.NODES_PER_TIME_CHECK == 0 \
+                and (time.perf_counter() >= self.__deadline
+                     or self.__stop_event is not None and self.__stop_event.is_set()):
+            self.__stopped = True
+        return self.__stopped
+
+    def __score_to_table(self, score: int, ply: int) -> int:
+        """
+        Converts a mate score to be relative to the position it is stored for, rather than the root of the search
+
+        :param score: int for a score from the search
+        :param ply: int for the number of plies from the root of the search
+        :return: int for the score to store
+        """
+        if score >= self.MATE - self.MAX_PLY:
+            return score + ply
+        if score <= -self.MATE + self.MAX_PLY:
+            return score - ply
+        return score
+
+    def __score_from_table(self, score: int, ply: int) -> int:
+        """
+        Converts a mate score stored in the table back to be relative to the root of the search
+
+        :param score: int for a score stored in the table
+        :param ply: int for the number of plies from the root of the search
+        :return: int for the score
+        """
+        if score >= self.MATE - self.MAX_PLY:
+            return score - ply
+        if score <= -self.MATE + self.MAX_PLY:
+            return score + ply
+        return score
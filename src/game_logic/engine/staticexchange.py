@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src.game_logic.codes import PAWN, KING, EN_PASSANT, PIECE_TYPES
+from src.game_logic.helpers import CoordsHelper
+from src.game_logic.mid_level.support.bitboard import BitBoard
+from src.game_logic.mid_level.support.piecesquaretables import PieceSquareTables
+
+if TYPE_CHECKING:
+    from src.game_logic.mid_level.support.board import Board
+
+
+class StaticExchange:
+    """
+    Works out the material won or lost by a sequence of captures on one square, without making any moves
+
+    Each side in turn recaptures on the square with its least valuable attacker, and may stop whenever carrying on would
+    lose material. Attackers are found with the same knight, king, pawn and sliding attack patterns that the move
+    finders use, from the bitboards of a BitBoard. Each piece that captures is taken out of the occupancy, so that a
+    slider lined up behind it, eg a rook behind a rook or a queen behind a bishop, joins in as an x-ray attacker.
+
+    Pieces are worth their material values in centipawns, see PieceSquareTables.PIECE_VALUES. A king only captures
+    if the square isn't attacked by the other side after the capture. Pins, and pawns promoting as they capture, aren't
+    taken into account
+    """
+
+    @staticmethod
+    def static_exchange(board: 'Board', square: int) -> int:
+        """
+        Finds how much material the other side can win by capturing the piece on a square, eg to find out if it is
+        hanging, whoever's turn it is
+
+        :param board: Board object with the position, one that isn't a BitBoard is copied to one first
+        :param square: int from 0-63 for the square
+        :return: int for the most material in centipawns that the side attacking the piece can win, 0 if the square is
+        empty or the piece is safe
+        """
+        board = StaticExchange.__bitboard(board)
+        target = board.mailbox[square]
+        if target is None:
+            return 0
+        side = target // 6 ^ 1
+        occupied = board.occupied
+        source = StaticExchange.__least_valuable_attacker(board, square, side, occupied)
+        if source is None:
+            return 0
+        return max(StaticExchange.__swap(board, square, source, side, occupied,
+                                         StaticExchange.value(target)), 0)
+
+    @staticmethod
+    def move_exchange(board: 'Board', move: tuple[int, int, int]) -> int:
+        """
+        Finds how much material the side to move wins by making a move and letting the exchange on its dest square play
+        out, eg a negative value for a capture that loses material
+
+        :param board: Board object with the position, one that isn't a BitBoard is copied to one first
+        :param move: compact move of the side to move
+        :return: int for the material in centipawns as described
+        """
+        board = StaticExchange.__bitboard(board)
+        source, dest, flag = move
+        mailbox = board.mailbox
+        occupied = board.occupied
+        if flag == EN_PASSANT:
+            captured_square = dest - 8 if board.side_to_move == 0 else dest + 8
+            occupied ^= 1 << captured_square
+            taken = PieceSquareTables.PIECE_VALUES[PAWN]
+        else:
+            taken = 0 if mailbox[dest] is None else StaticExchange.value(mailbox[dest])
+        return StaticExchange.__swap(board, dest, source, mailbox[source] // 6, occupied, taken)
+
+    @staticmethod
+    def value(code: int) -> int:
+        """
+        Finds the value of a piece in an exchange
+
+        :param code: int for the piece code
+        :return: int for the value in centipawns
+        """
+        return PieceSquareTables.PIECE_VALUES[code % 6]
+
+    @staticmethod
+    def __swap(board: 'BitBoard', square: int, source: int, side: int, occupied: int, taken: int) -> int:
+        """
+        Plays out the exchange on a square, starting with a capture by a piece that has to be made
+
+        :param board: BitBoard object with the position
+        :param square: int for the square of the exchange
+        :param source: int for the square of the piece that makes the first capture
+        :param side: int for the colour index of the side that makes the first capture
+        :param occupied: int for the occupancy of the board before the first capture
+        :param taken: int for the value of the piece taken by the first capture
+        :return: int for the material won by the side that makes the first capture, with both sides stopping when best
+        """
+        gains = [taken]
+        on_square = StaticExchange.value(board.mailbox[source])
+        occupied &= ~(1 << source)
+        side ^= 1
+        while True:
+            source = StaticExchange.__least_valuable_attacker(board, square, side, occupied)
+            if source is None:
+                break
+            gains.append(on_square - gains[-1])
+            on_square = StaticExchange.value(board.mailbox[source])
+            occupied &= ~(1 << source)
+            side ^= 1
+        # Each side only makes its capture if it does better than stopping before it
+        for i in range(len(gains) - 1, 0, -1):
+            gains[i - 1] = -max(-gains[i - 1], gains[i])
+        return gains[0]
+
+    @staticmethod
+    def __least_valuable_attacker(board: 'BitBoard', square: int, side: int, occupied: int) -> int | None:
+        """
+        Finds the least valuable piece of a side that can capture on a square, with pieces missing from an occupancy
+        counted as already having captured
+
+        :param board: BitBoard object with the position
+        :param square: int for the square
+        :param side: int for the colour index of the side
+        :param occupied: int for the occupancy of the board
+        :return: int for the square of the piece as described, or None if there isn't one
+        """
+        attackers = board.attackers(square, side, occupied) & occupied
+        if not attackers:
+            return None
+        pieces = board.piece_bitboards
+        for piece_type in range(len(PIECE_TYPES)):
+            found = attackers & pieces[side * 6 + piece_type]
+            if found:
+                lowest = found & -found
+                if piece_type == KING and board.attackers(square, side ^ 1, occupied ^ lowest) & occupied:
+                    return None  # The king can't capture onto a square that is still attacked
+                return lowest.bit_length() - 1
+        return None
+
+    @staticmethod
+    def __bitboard(board: 'Board') -> 'BitBoard':
+        """
+        Finds a BitBoard with the position of a board
+
+        :param board: Board object
+        :return: the board itself if it is a BitBoard, otherwise a copy of it made from a snapshot
+        """
+        if board.backend == "BITBOARD":
+            return board
+        return BitBoard.from_snapshot(board.snapshot(), CoordsHelper())
@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import mmap
+import os
+from typing import TYPE_CHECKING
+
+from src.game_logic.codes import CodeHelper, WHITE, PAWN, KING, PIECE_LETTERS
+from src.game_logic.mid_level.support.leaperattacks import LeaperAttacks
+
+if TYPE_CHECKING:
+    from src.game_logic.mid_level.support.board import Board
+
+
+class Tablebase:
+    """
+    Probes endgame tablebases for the result of a position and its distance to mate
+
+    There is a table for each set of material, named like 'KQK', with the white king and pieces followed by the black
+    king and pieces, each in the order of PIECE_ORDER. A table has one byte for every placement of its pieces on the
+    board with each side to move, see index(). The byte holds the result for the side to move, see encode(). Positions
+    where the same material is on the other side of the board are probed with the colours swapped, so 'KQK' answers
+    for a black queen as well.
+
+    Tables are made by TablebaseGenerator and stored as '<material>.tb' files in a directory. Each file is memory mapped
+    the first time it is needed, so probing reads a single byte and no table is ever loaded in whole.
+
+    Tables cover positions without castling rights, and positions where an en-passant capture can be made aren't
+    probed. Use as a context manager, or call close() when done, so that the files are unmapped
+    """
+
+    # Piece types in the order they are listed in the name of a table, after the king
+    PIECE_ORDER = "QRBNP"
+
+    ILLEGAL = 255
+    DRAW = 0
+    # Codes from 1 are wins and codes from LOSS are losses, see encode()
+    LOSS = 128
+
+    def __init__(self, directory: str):
+        """
+        Constructor for a Tablebase
+
+        :param directory: str for the directory of the table files
+        """
+        self.directory = directory
+        self.__files = {}
+        self.__tables = {}
+
+    def __enter__(self) -> Tablebase:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Unmaps and closes the table files that have been opened
+
+        :return: None
+        """
+        for table in self.__tables.values():
+            table.close()
+        for file in self.__files.values():
+            file.close()
+        self.__tables = {}
+        self.__files = {}
+
+    def has_table(self, material: str) -> bool:
+        """
+        Finds out if there is a table for some material, with either side holding it
+
+        :param material: str for the name of the material, eg 'KQK'
+        :return: bool as described
+        """
+        return self.__table(material) is not None or self.__table(Tablebase.swap_material(material)) is not None
+
+    def probe(self, board: 'Board') -> tuple[str, int] | None:
+        """
+        Finds the result of the position on a board with perfect play, and how many half moves it is from mate
+
+        :param board: Board object for the position
+        :return: tuple of the result for the side to move, either "WIN", "DRAW" or "LOSS", and the number of half moves
+        until mate, 0 for a draw. None if there is no table for the position
+        """
+        mailbox = board.snapshot().mailbox
+        if board.castling_rights or mailbox.count(KING) != 1 or mailbox.count(6 + KING) != 1:
+            return None
+        side = board.side_to_move
+        ep_square = board.ep_square
+        if ep_square is not None and any(code == side * 6 + PAWN for code in
+                                         (mailbox[square] for square in CodeHelper.squares(
+                                             LeaperAttacks.PAWN_ATTACKS[side ^ 1][ep_square]))):
+            return None
+        material = Tablebase.material(mailbox)
+        code = self.probe_code(material, mailbox, side)
+        if code is None:
+            return None
+        return Tablebase.decode(code)
+
+    def probe_code(self, material: str, mailbox: tuple[int | None, ...] | list[int | None],
+                   side: int) -> int | None:
+        """
+        Finds the byte for a position in its table, see encode()
+
+        :param material: str for the name of the material of the position, see material()
+        :param mailbox: the piece code on each square, as per BoardSnapshot.mailbox
+        :param side: int for the colour index of the side to move
+        :return: int for the byte as described, None if there is no table for the material
+        """
+        table = self.__table(material)
+        if table is None:
+            material = Tablebase.swap_material(material)
+            table = self.__table(material)
+            if table is None:
+                return None
+            # Look up the same position with the colours swapped and the board flipped
+            mailbox = [None if code is None else (code + 6) % 12 for code in
+                       (mailbox[square ^ 56] for square in range(64))]
+            side ^= 1
+        return table[Tablebase.index(Tablebase.material_codes(material), mailbox, side)]
+
+    def __table(self, material: str) -> mmap.mmap | None:
+        """
+        Finds the mapped file of the table for some material, mapping it the first time
+
+        :param material: str for the name of the material
+        :return: mmap object, or None if there is no table file
+        """
+        if material not in self.__tables:
+            path = Tablebase.path(self.directory, material)
+            if not os.path.exists(path):
+                return None  # Not remembered, so that a table made later is found
+            file = self.__files[material] = open(path, "rb")
+            self.__tables[material] = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self.__tables[material]
+
+    @staticmethod
+    def path(directory: str, material: str) -> str:
+        """
+        Finds the path of the file of a table
+
+        :param directory: str for the directory of the table files
+        :param material: str for the name of the material
+        :return: str for the path as described
+        """
+        return os.path.join(directory, material + ".tb")
+
+    @staticmethod
+    def material(mailbox: tuple[int | None, ...] | list[int | None]) -> str:
+        """
+        Finds the name of the material on a board, eg 'KQK'
+
+        :param mailbox: the piece code on each square, as per BoardSnapshot.mailbox
+        :return: str as described
+        """
+        letters = [[], []]
+        for code in mailbox:
+            if code is not None and code % 6 != KING:
+                letters[code // 6].append(PIECE_LETTERS[code % 6])
+        return Tablebase.material_name(letters[WHITE], letters[1])
+
+    @staticmethod
+    def material_name(white: list[str], black: list[str]) -> str:
+        """
+        Finds the name of some material from the letters of the pieces of each side, other than the kings
+
+        :param white: list of the letters of the white pieces, as per PIECE_LETTERS, in any order
+        :param black: list of the letters of the black pieces
+        :return: str for the name as described
+        """
+        return "K" + "".join(sorted(white, key=Tablebase.PIECE_ORDER.index)) + \
+            "K" + "".join(sorted(black, key=Tablebase.PIECE_ORDER.index))
+
+    @staticmethod
+    def swap_material(material: str) -> str:
+        """
+        Finds the name of some material with the colours swapped, eg 'KKQ' for 'KQK'
+
+        :param material: str for the name of the material
+        :return: str as described
+        """
+        second_king = material.index("K", 1)
+        return material[second_king:] + material[:second_king]
+
+    @staticmethod
+    def material_codes(material: str) -> list[int]:
+        """
+        Finds the piece codes of the pieces of a table, in the order they are indexed
+
+        :param material: str for the name of the material
+        :return: list of piece codes as described
+        """
+        second_king = material.index("K", 1)
+        return [(0 if i < second_king else 6) + PIECE_LETTERS.index(letter) for i, letter in enumerate(material)]
+
+    @staticmethod
+    def index(codes: list[int], mailbox: tuple[int | None, ...] | list[int | None], side: int) -> int:
+        """
+        Finds the index of a position in the table of its material
+
+        The index is made of the square of each piece of the table in turn, as the digits of a number in base 64, with
+        the side to move on top. Pieces of the same type are placed in the order of their squares
+
+        :param codes: list of the piece codes of the table, see material_codes()
+        :param mailbox: the piece code on each square, as per BoardSnapshot.mailbox
+        :param side: int for the colour index of the side to move
+        :return: int as described
+        """
+        squares = {}
+        for square, code in enumerate(mailbox):
+            if code is not None:
+                squares.setdefault(code, []).append(square)
+        index = side
+        for code in codes:
+            index = index * 64 + squares[code].pop(0)
+        return index
+
+    @staticmethod
+    def size(material: str) -> int:
+        """
+        Finds the number of bytes in the table of some material
+
+        :param material: str for the name of the material
+        :return: int as described
+        """
+        return 2 * 64 ** len(material)
+
+    @staticmethod
+    def encode(result: str, plies: int) -> int:
+        """
+        Finds the byte for a result in a table
+
+        Wins are always an odd number of half moves from mate and losses an even number, so a win in p half moves is
+        stored as (p + 1) / 2 and a loss in p half moves as LOSS + p / 2
+
+        :param result: str for the result for the side to move, "WIN", "DRAW" or "LOSS"
+        :param plies: int for the number of half moves until mate
+        :return: int as described
+        """
+        if result == "WIN":
+            return (plies + 1) >> 1
+        if result == "LOSS":
+            return Tablebase.LOSS + (plies >> 1)
+        return Tablebase.DRAW
+
+    @staticmethod
+    def decode(code: int) -> tuple[str, int] | None:
+        """
+        Finds the result for a byte in a table, the opposite of encode()
+
+        :param code: int for the byte
+        :return: tuple of the result and number of half moves until mate, or None if the byte is for an illegal position
+        """
+        if code == Tablebase.ILLEGAL:
+            return None
+        if code == Tablebase.DRAW:
+            return "DRAW", 0
+        if code < Tablebase.LOSS:
+            return "WIN", 2 * code - 1
+        return "LOSS", 2 * (code - Tablebase.LOSS)
+
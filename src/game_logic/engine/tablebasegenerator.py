@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import itertools
+import os
+
+from src.game_logic.codes import WHITE, PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING, EN_PASSANT, PROMOTE_KNIGHT
+from src.game_logic.engine.tablebase import Tablebase
+from src.game_logic.helpers import CoordsHelper
+from src.game_logic.mid_level.move_finders.legalmovegenerator import LegalMoveGenerator
+from src.game_logic.mid_level.support.bitboard import BitBoard
+from src.game_logic.mid_level.support.leaperattacks import LeaperAttacks
+from src.game_logic.mid_level.support.slidingattacks import SlidingAttacks
+
+
+class TablebaseGenerator:
+    """
+    Makes endgame tablebases by retrograde analysis, see Tablebase
+
+    Every placement of the pieces of a table is set up on a BitBoard once, and its legal moves are found with a
+    LegalMoveGenerator, the same rules that the MoveFinders of the pieces follow on a BitBoard. Moves that capture or
+    promote leave the table, and are scored straight away from the tables of the material they lead to, which are made
+    first. The other moves are only counted.
+
+    Then, starting from the checkmates, each position whose result is known is taken back one move at a time in order
+    of distance to mate. A position that can move into a loss for the other side is a win one half move further from
+    mate, and a position is a loss once the count of its moves that don't lead to a win for the other side runs out.
+    Positions that are never reached either way are draws.
+
+    Three piece tables take seconds to make. Four piece tables are 64 times bigger and take a long time, so make them
+    once and keep the files
+    """
+
+    def __init__(self, directory: str):
+        """
+        Constructor for a TablebaseGenerator
+
+        :param directory: str for the directory to keep the table files in
+        """
+        self.directory = directory
+        self.tablebase = Tablebase(directory)
+
+    def generate(self, material: str) -> str:
+        """
+        Makes the table for some material, along with the tables it depends on, unless they have been made already
+
+        :param material: str for the name of the material, eg 'KQK', see Tablebase
+        :return: str for the path of the table file
+        """
+        path = Tablebase.path(self.directory, material)
+        if os.path.exists(path):
+            return path
+        for sub_material in TablebaseGenerator.sub_materials(material):
+            if not TablebaseGenerator.is_insufficient(sub_material) and not self.tablebase.has_table(sub_material):
+                self.generate(sub_material)
+        values = self.__solve(material)
+        os.makedirs(self.directory, exist_ok=True)
+        partial_path = path + ".partial"
+        with open(partial_path, "wb") as file:
+            file.write(values)
+        os.replace(partial_path, path)  # So that a half written table is never probed
+        return path
+
+    @staticmethod
+    def sub_materials(material: str) -> list[str]:
+        """
+        Finds the material that a capture or promotion can lead to from some material
+
+        :param material: str for the name of the material
+        :return: list of names of material as described
+        """
+        second_king = material.index("K", 1)
+        sides = [list(material[1:second_king]), list(material[second_king + 1:])]
+        found = []
+        for side, letters in enumerate(sides):
+            for i, letter in enumerate(letters):
+                changes = [letters[:i] + letters[i + 1:]]
+                if letter == "P":
+                    changes += [letters[:i] + [promoted] + letters[i + 1:] for promoted in "QRBN"]
+                for changed in changes:
+                    white, black = (changed, sides[1]) if side == WHITE else (sides[0], changed)
+                    sub_material = Tablebase.material_name(white, black)
+                    if sub_material not in found:
+                        found.append(sub_material)
+        return found
+
+    @staticmethod
+    def is_insufficient(material: str) -> bool:
+        """
+        Finds out if some material can never checkmate, ie there are no pawns, rooks or queens and at most one knight or
+        bishop
+
+        :param material: str for the name of the material
+        :return: bool as described
+        """
+        pieces = material.replace("K", "")
+        return len(pieces) <= 1 and pieces in ["", "B", "N"]
+
+    def __solve(self, material: str) -> bytearray:
+        """
+        Works out the result of every position of a table
+
+        :param material: str for the name of the material
+        :return: bytearray of the table, see Tablebase.encode()
+        """
+        codes = Tablebase.material_codes(material)
+        pieces = len(codes)
+        side_offset = 64 ** pieces
+        values = bytearray([Tablebase.ILLEGAL]) * Tablebase.size(material)
+        counts = bytearray(len(values))
+        escapes = set()  # Positions with a capture or promotion that doesn't lose, so they can't be lost
+        conversion_losses = {}  # Most half moves to mate over the captures and promotions that lose, by position
+        buckets = {}  # Positions to settle, by the number of half moves to mate
+
+        board = BitBoard(CoordsHelper())
+        board.castling_rights = 0
+        generator = LegalMoveGenerator(board)
+        mailbox = board.mailbox
+        placed = ()
+        for squares in itertools.permutations(range(64), pieces):
+            for square in placed:
+                board.set_square(square, None)
+            placed = ()
+            if any(code % 6 == PAWN and square >> 3 in (0, 7) for square, code in zip(squares, codes)):
+                continue
+            for square, code in zip(squares, codes):
+                board.set_square(square, code)
+            placed = squares
+            base = 0
+            for square in squares:
+                base = base * 64 + square
+            for side in range(2):
+                board.side_to_move = side
+                if board.side_in_check(side ^ 1):
+                    continue
+                index = side * side_offset + base
+                values[index] = Tablebase.DRAW
+                moves = generator.generate(side)
+                if not moves:
+                    if board.side_in_check(side):
+                        buckets.setdefault(0, []).append((index, "LOSS"))
+                    continue
+                count, best_win, worst_loss, escape = 0, None, None, False
+                for move in moves:
+                    if mailbox[move[1]] is None and move[2] != EN_PASSANT and move[2] < PROMOTE_KNIGHT:
+                        count += 1
+                        continue
+                    board.make_move(move)
+                    result, plies = self.__converted_result(board)
+                    board.unmake_move()
+                    if result == "LOSS":
+                        best_win = plies + 1 if best_win is None else min(best_win, plies + 1)
+                    elif result == "WIN":
+                        worst_loss = plies + 1 if worst_loss is None else max(worst_loss, plies + 1)
+                    else:
+                        escape = True
+                counts[index] = count
+                if best_win is not None:
+                    escapes.add(index)
+                    buckets.setdefault(best_win, []).append((index, "WIN"))
+                elif escape:
+                    escapes.add(index)
+                elif worst_loss is not None:
+                    conversion_losses[index] = worst_loss
+                    if not count:
+                        buckets.setdefault(worst_loss, []).append((index, "LOSS"))
+        for square in placed:
+            board.set_square(square, None)
+
+        plies = 0
+        while buckets:
+            for index, result in buckets.pop(plies, []):
+                if values[index] != Tablebase.DRAW:
+                    continue  # Settled nearer to mate already
+                values[index] = Tablebase.encode(result, plies)
+                for predecessor in TablebaseGenerator.__predecessors(index, codes):
+                    if values[predecessor] != Tablebase.DRAW:
+                        continue
+                    if result == "LOSS":
+                        buckets.setdefault(plies + 1, []).append((predecessor, "WIN"))
+                    elif predecessor not in escapes and counts[predecessor]:
+                        counts[predecessor] -= 1
+                        if not counts[predecessor]:
+                            loss = max(plies + 1, conversion_losses.get(predecessor, 0))
+                            buckets.setdefault(loss, []).append((predecessor, "LOSS"))
+            plies += 1
+        return values
+
+    def __converted_result(self, board: 'BitBoard') -> tuple[str, int]:
+        """
+        Finds the result for the side to move on a board just after a capture or promotion, from the table of the
+        material it leads to
+
+        :param board: BitBoard object for the position
+        :return: tuple of the result and number of half moves until mate, see Tablebase.probe()
+        """
+        if board.has_insufficient_material():
+            return "DRAW", 0
+        mailbox = board.mailbox
+        code = self.tablebase.probe_code(Tablebase.material(mailbox), mailbox, board.side_to_move)
+        assert code is not None, "The table for the material has to be made first"
+        return Tablebase.decode(code)
+
+    @staticmethod
+    def __predecessors(index: int, codes: list[int]) -> list[int]:
+        """
+        Finds the positions that could have come before a position of a table, by taking back a move of the side that
+        isn't to move without a capture or promotion
+
+        Positions that would be illegal are included, so they must be checked against the table
+
+        :param index: int for the index of the position, see Tablebase.index()
+        :param codes: list of the piece codes of the table, see Tablebase.material_codes()
+        :return: list of the indices of the positions as described
+        """
+        pieces = len(codes)
+        side_offset = 64 ** pieces
+        mover = (index // side_offset) ^ 1
+        squares = [(index >> 6 * (pieces - 1 - i)) & 63 for i in range(pieces)]
+        occupied = 0
+        for square in squares:
+            occupied |= 1 << square
+        empty = ~occupied
+        found = []
+        for i, code in enumerate(codes):
+            if code // 6 != mover:
+                continue
+            square = squares[i]
+            piece_type = code % 6
+            if piece_type == KING:
+                origins = LeaperAttacks.KING_ATTACKS[square] & empty
+            elif piece_type == KNIGHT:
+                origins = LeaperAttacks.KNIGHT_ATTACKS[square] & empty
+            elif piece_type == BISHOP:
+                origins = SlidingAttacks.bishop_attacks(square, occupied) & empty
+            elif piece_type == ROOK:
+                origins = SlidingAttacks.rook_attacks(square, occupied) & empty
+            elif piece_type == QUEEN:
+                origins = SlidingAttacks.queen_attacks(square, occupied) & empty
+            else:
+                origins = TablebaseGenerator.__pawn_origins(square, mover, occupied)
+            place = 6 * (pieces - 1 - i)
+            without = mover * side_offset + (index % side_offset) - (square << place)
+            while origins:
+                lowest = origins & -origins
+                found.append(without + ((lowest.bit_length() - 1) << place))
+                origins ^= lowest
+        return found
+
+    @staticmethod
+    def __pawn_origins(square: int, side: int, occupied: int) -> int:
+        """
+        Finds the squares that a pawn could have been pushed to a square from
+
+        :param square: int for the square of the pawn
+        :param side: int for the colour index of the pawn
+        :param occupied: int for the occupancy of the board
+        :return: int for a bitboard of the squares as described
+        """
+        backward = -8 if side == WHITE else 8
+        row = square >> 3 if side == WHITE else 7 - (square >> 3)
+        origins = 0
+        single = square + backward
+        if row >= 2 and not occupied >> single & 1:
+            origins |= 1 << single
+            if row == 3 and not occupied >> (single + backward) & 1:
+                origins |= 1 << (single + backward)
+        return origins
+
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from array import array
+
+
+class TranspositionTable:
+    """
+    Fixed-size hash table of search results, keyed by the Zobrist key of a position
+
+    The table is preallocated as two flat arrays of unsigned 64-bit ints, one for keys and one for packed entries, so
+    its memory footprint is fixed when it is created and never grows. Each entry packs the best move, the search depth,
+    the bound type, the age of the search that stored it and the score into one int:
+
+        bits 0-14   best move, source | dest << 6 | flag << 12, 0 if there is none
+        bits 16-23  depth
+        bits 24-25  bound, EXACT, LOWER or UPPER
+        bits 26-31  age
+        bits 32-63  score, offset to make it unsigned
+
+    Entries are indexed by the low bits of the key. A new entry replaces the one in its slot if the slot holds the same
+    position, an entry from an older search, or an entry searched to the same depth or shallower. So deep results from
+    the current search are kept, while stale ones are recycled.
+    """
+
+    EXACT = 1
+    LOWER = 2
+    UPPER = 3
+
+    ENTRY_BYTES = 16
+    SCORE_OFFSET = 1 << 31
+    AGE_MASK = 0x3F
+
+    def __init__(self, size_mb: int = 16):
+        """
+        Constructor for a TranspositionTable
+
+        :param size_mb: int for the most memory that the table can use in megabytes, the number of entries is rounded
+        down to a power of two. Default 16
+        """
+        assert size_mb > 0, "Transposition table size must be positive"
+        entries = 1
+        while entries * 2 * self.ENTRY_BYTES <= size_mb << 20:
+            entries *= 2
+        self.__mask = entries - 1
+        self.__keys = array("Q", bytes(8 * entries))
+        self.__data = array("Q", bytes(8 * entries))
+        self.__age = 0
+
+    @property
+    def size(self) -> int:
+        """
+        The number of entries that this table can hold
+
+        :return: int as described
+        """
+        return self.__mask + 1
+
+    def new_search(self) -> None:
+        """
+        Moves this table on to a new search, so that the entries of earlier searches can be replaced first
+
+        :return: None
+        """
+        self.__age = (self.__age + 1) & self.AGE_MASK
+
+    def clear(self) -> None:
+        """
+        Empties this table, without reallocating it
+
+        :return: None
+        """
+        for i in range(self.size):
+            self.__keys[i] = 0
+            self.__data[i] = 0
+
+    def probe(self, key: int) -> tuple[tuple[int, int, int] | None, int, int, int] | None:
+        """
+        Looks up the entry for a position
+
+        :param key: int for the Zobrist key of the position
+        :return: tuple of (best move or None, depth, bound, score), or None if this table has no entry for the position
+        """
+        index = key & self.__mask
+        data = self.__data[index]
+        if not data or self.__keys[index] != key:
+            return None
+        packed_move = data & 0x7FFF
+        move = (packed_move & 63, packed_move >> 6 & 63, packed_move >> 12) if packed_move else None
+        return move, data >> 16 & 0xFF, data >> 24 & 3, (data >> 32) - self.SCORE_OFFSET
+
+    def store(self, key: int, move: tuple[int, int, int] | None, depth: int, bound: int, score: int) -> None:
+        """
+        Stores the result of searching a position, following the replacement policy of this table
+
+        :param key: int for the Zobrist key of the position
+        :param move: compact move that was best in the position, or None if there isn't one
+        :param depth: int for the depth that the position was searched to
+        :param bound: int for if the score is EXACT, a LOWER bound or an UPPER bound
+        :param score: int for the score of the position
+        :return: None
+        """
+        index = key & self.__mask
+        old_data = self.__data[index]
+        if old_data and self.__keys[index] != key and (old_data >> 26 & self.AGE_MASK) == self.__age \
+                and (old_data >> 16 & 0xFF) > depth:
+            return
+        packed_move = 0 if move is None else move[0] | move[1] << 6 | move[2] << 12
+        if packed_move == 0 and self.__keys[index] == key:
+            packed_move = old_data & 0x7FFF  # Keep the best move found by an earlier search of this position
+        self.__keys[index] = key
+        self.__data[index] = packed_move | min(depth, 0xFF) << 16 | bound << 24 | self.__age << 26 \
+            | (score + self.SCORE_OFFSET) << 32
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from src.game_logic.mid_level.support.geometry import Geometry
+
 
 class CoordsHelper:
     """
@@ -27,6 +29,8 @@ class CoordsHelper:
         :param coords: coordinate tuple pair
         :return: bool if inputted coords are valid or not
         """
+        if type(coords) is tuple and coords in Geometry.SQUARES:
+            return True  # Coords on the board are found with a single lookup, only the rest need checking
         return CoordsHelper.__coords_are_coords(coords) and CoordsHelper.__coords_in_board(coords)
 
     @staticmethod
@@ -101,54 +105,13 @@ class TraverseHelper:
         """
         Return the next coordinates in the direction of an inputted bearing
 
+        For going all the way to the edge of the board, Geometry.RAY_COORDS has each bearing from each coordinate
+
         :param coords: tuple for coordinates
         :param bearing: str for the bearing to travel in
         :return: a new pair of coordinates in the bearing specified
         """
-        adjust_coords = self.__determine_adjust_coords_func(bearing)
-        return adjust_coords(coords)
-
-    def __determine_adjust_coords_func(self, bearing: str) -> callable:
-        """
-        Determines the function to adjust position that should be used when doing a dfs in a particular bearing
-
-        :param bearing: str for the bearing as described
-        :return: callable function that can be used to increment the position of a possible move by a piece
-        """
-        if bearing == "N":
-            adjust_coords = self.__next_coords_func(1, 0)
-        elif bearing == "S":
-            adjust_coords = self.__next_coords_func(-1, 0)
-        elif bearing == "E":
-            adjust_coords = self.__next_coords_func(0, 1)
-        elif bearing == "W":
-            adjust_coords = self.__next_coords_func(0, -1)
-        elif bearing == "NE":
-            adjust_coords = self.__next_coords_func(1, 1)
-        elif bearing == "SE":
-            adjust_coords = self.__next_coords_func(-1, 1)
-        elif bearing == "SW":
-            adjust_coords = self.__next_coords_func(-1, -1)
-        elif bearing == "NW":
-            adjust_coords = self.__next_coords_func(-1, 1)
-        else:
-            raise Exception('Bearing is not valid, must be in {0}}'.format(bearing_helper.__all_bearings()))
-        return adjust_coords
-
-    def __next_coords_func(self, row_incr: int, col_incr: int) -> callable:
-        """
-        Provides an anonymous function that is used to increment a coordinate to the next possible one during a dfs to find
-        possible coordinate destination for moves or other pieces
-
-        A move is simply a tuple, (row, col) specifying a possible position that a piece could move
-        row_incr and col_incr must be one of -1, 1 or 0
-
-        :param row_incr: increment for how the row of a position should be updated
-        :param col_incr: increment for how the col of a position should be updated
-        :return: lambda function as described
-        """
-        # TODO does this even belong here??
-        acceptable_increments = [1, -1, 0]
-        assert row_incr in acceptable_increments and col_incr in acceptable_increments
-        return lambda coords: CoordsHelper.add(coords, (row_incr, col_incr))
-
+        step = Geometry.BEARING_STEPS.get(bearing)
+        if step is None:
+            raise Exception('Bearing is not valid, must be in {0}'.format(BearingHelper.all_bearings()))
+        return coords[0] + step[0], coords[1] + step[1]
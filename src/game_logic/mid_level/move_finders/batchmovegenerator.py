@@ -0,0 +1,272 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Callable
+
+from src.game_logic.codes import WHITE, PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING
+from src.game_logic.helpers import CoordsHelper
+from src.game_logic.mid_level.move_finders.legalmovegenerator import LegalMoveGenerator
+from src.game_logic.mid_level.support.bitboard import BitBoard
+
+try:
+    import numpy
+except ImportError:  # NumPy is optional, without it the moves are generated one board at a time
+    numpy = None
+
+if TYPE_CHECKING:
+    from src.game_logic.mid_level.support.board import Board
+
+
+class BatchMoveGenerator:
+    """
+    Generates the legal moves for many boards at once, eg a page of puzzles or every position of a game
+
+    The moves of each board are the compact moves that a LegalMoveGenerator finds, so they are exactly the moves that
+    the MoveFinders of the pieces of the side to move find between them, see MoveFinder.compact_moves(). No Piece or
+    MoveFinder objects are involved though, so there is no Python call per piece per position.
+
+    When NumPy is installed, the stages that decide legality are worked out for the whole batch in one go, with the
+    bitboards of every board in uint64 arrays:
+
+    - the danger squares, ie the squares attacked by the side not to move with the king taken off the board
+    - the check mask, ie the checking piece and the squares between it and the king, see LegalMoveGenerator
+    - the pinned pieces, and the line that each of them can still move on
+
+    Sliding attacks are found with Kogge-Stone fills and leaper attacks with shifts, so the same handful of array
+    operations covers every board. Each LegalMoveGenerator is then handed these stages, so it only has to find the
+    targets of each piece. NumPy is optional, see the README. Without it, or for moves that aren't checked for
+    legality, the moves are generated one board at a time with the same results
+    """
+
+    FULL_BOARD = LegalMoveGenerator.FULL_BOARD
+    NOT_FILE_A = 0xFEFEFEFEFEFEFEFE
+    NOT_FILE_H = 0x7F7F7F7F7F7F7F7F
+    NOT_FILES_AB = 0xFCFCFCFCFCFCFCFC
+    NOT_FILES_GH = 0x3F3F3F3F3F3F3F3F
+
+    # Shifts for one step in each direction, with the squares that can be stepped onto without wrapping around a side
+    ROOK_STEPS = [(8, FULL_BOARD), (-8, FULL_BOARD), (1, NOT_FILE_A), (-1, NOT_FILE_H)]
+    BISHOP_STEPS = [(9, NOT_FILE_A), (7, NOT_FILE_H), (-7, NOT_FILE_A), (-9, NOT_FILE_H)]
+    KNIGHT_STEPS = [(17, NOT_FILE_A), (15, NOT_FILE_H), (10, NOT_FILES_AB), (6, NOT_FILES_GH), (-6, NOT_FILES_AB),
+                    (-10, NOT_FILES_GH), (-15, NOT_FILE_A), (-17, NOT_FILE_H)]
+
+    @staticmethod
+    def moves(boards: list['Board'], legal: bool = True) -> list[list[tuple[int, int, int]]]:
+        """
+        Finds the moves that the side to move can do on each of a list of boards
+
+        Boards that aren't BitBoards are copied to one from a snapshot first. The boards are left as they were found
+
+        :param boards: list of Board objects
+        :param legal: bool for if only legal moves should be found, see LegalMoveGenerator.moves(). Default True
+        :return: list with a list of compact moves for each board, in the same order as the boards
+        """
+        generators = [BatchMoveGenerator.__generator(board) for board in boards]
+        if not legal or numpy is None or not boards:
+            return [generator.generate(generator.board.side_to_move, legal) for generator in generators]
+        stages = BatchMoveGenerator.legality_stages([generator.board for generator in generators])
+        return [generator.generate(generator.board.side_to_move, danger=danger, check_mask=check_mask, pins=pins)
+                for generator, (danger, check_mask, pins) in zip(generators, stages)]
+
+    @staticmethod
+    def legality_stages(boards: list['BitBoard'],
+                        vectorised: bool | None = None) -> list[tuple[int, int, tuple[int, dict[int, int]]]]:
+        """
+        Finds the stages that decide which moves of the side to move are legal on each of a list of boards, see
+        BatchMoveGenerator
+
+        :param boards: list of BitBoard objects
+        :param vectorised: bool for if the whole batch should be done with NumPy arrays, rather than with Python ints a
+        board at a time. Leave as None to use NumPy if it is installed
+        :return: list with a tuple of (danger squares, check mask, (pinned pieces, pin rays)) for each board, in the
+        same order as the boards, as taken by LegalMoveGenerator.generate()
+        """
+        columns = BatchMoveGenerator.__columns(boards)
+        if BatchMoveGenerator.__vectorise(vectorised):
+            arrays = [numpy.array(column, dtype=numpy.uint64) for column in columns]
+            dangers, check_masks, pin_lines = BatchMoveGenerator._stages(*arrays, number=numpy.uint64)
+            rows = zip(dangers.tolist(), check_masks.tolist(),
+                       zip(*[zip(pinned.tolist(), ray.tolist()) for pinned, ray in pin_lines]))
+        else:
+            rows = (BatchMoveGenerator._stages(*row, number=int) for row in zip(*columns))
+        stages = []
+        for danger, check_mask, pin_lines in rows:
+            pinned = 0
+            pin_rays = {}
+            for line_pinned, ray in pin_lines:
+                if line_pinned:
+                    pinned |= line_pinned
+                    pin_rays[line_pinned.bit_length() - 1] = ray
+            stages.append((danger, check_mask, (pinned, pin_rays)))
+        return stages
+
+    @staticmethod
+    def danger_squares(boards: list['BitBoard'], vectorised: bool | None = None) -> list[int]:
+        """
+        Finds the squares attacked by the side not to move on each of a list of boards, with the king of the side to
+        move taken off the board, so that squares behind the king away from a checking piece count as attacked
+
+        :param boards: list of BitBoard objects
+        :param vectorised: bool for if the whole batch should be done with NumPy arrays, see legality_stages()
+        :return: list of bitboards as described, in the same order as the boards
+        """
+        return [danger for danger, _, _ in BatchMoveGenerator.legality_stages(boards, vectorised)]
+
+    @staticmethod
+    def __vectorise(vectorised: bool | None) -> bool:
+        """
+        Finds out if the stages should be worked out with NumPy arrays
+
+        :param vectorised: bool as asked for, or None to use NumPy if it is installed
+        :return: bool as described
+        """
+        if vectorised is None:
+            return numpy is not None
+        assert not vectorised or numpy is not None, "NumPy isn't installed"
+        return vectorised
+
+    @staticmethod
+    def __generator(board: 'Board') -> LegalMoveGenerator:
+        """
+        Finds the LegalMoveGenerator to generate the moves of a board with
+
+        :param board: Board object
+        :return: LegalMoveGenerator object as described
+        """
+        if board.backend != "BITBOARD":
+            board = BitBoard.from_snapshot(board.snapshot(), CoordsHelper())
+        if board.move_generator is None:
+            return LegalMoveGenerator(board)
+        return board.move_generator
+
+    @staticmethod
+    def __columns(boards: list['BitBoard']) -> list[list[int]]:
+        """
+        Gathers the bitboards that the stages are worked out from, see _stages()
+
+        :param boards: list of BitBoard objects
+        :return: list of columns, each with one bitboard per board
+        """
+        columns = [[] for _ in range(9)]
+        for board in boards:
+            pieces = board.piece_bitboards
+            side = board.side_to_move
+            enemy = (side ^ 1) * 6
+            row = [board.occupied,
+                   board.colour_bitboards[side],
+                   pieces[side * 6 + KING],
+                   pieces[enemy + PAWN] if side != WHITE else 0,
+                   pieces[enemy + PAWN] if side == WHITE else 0,
+                   pieces[enemy + KNIGHT],
+                   pieces[enemy + KING],
+                   pieces[enemy + ROOK] | pieces[enemy + QUEEN],
+                   pieces[enemy + BISHOP] | pieces[enemy + QUEEN]]
+            for column, bitboard in zip(columns, row):
+                column.append(bitboard)
+        return columns
+
+    @staticmethod
+    def _stages(occupied, own, king, white_pawns, black_pawns, knights, kings, rooks, bishops, number: Callable):
+        """
+        Finds the danger squares, check mask and pins of the side to move, only using shifts, bitwise operations and
+        selections so that it works the same on Python ints and on NumPy uint64 arrays
+
+        The pawns, knights, kings, rooks and bishops are those of the side not to move, with queens counted as both
+        rooks and bishops
+
+        :param occupied: bitboard, or array of bitboards, of every piece
+        :param own: bitboard of the pieces of the side to move
+        :param king: bitboard of the king of the side to move
+        :param number: callable to make constants with, int for Python ints or numpy.uint64 for arrays
+        :return: tuple of the danger squares, the check mask and a list of (pinned piece, pin ray) for each direction
+        from the king, each a bitboard or array as described
+        """
+        shift = BatchMoveGenerator.__shift
+        fill = BatchMoveGenerator.__fill
+        select = BatchMoveGenerator.__select
+        zero = number(0)
+        full = number(BatchMoveGenerator.FULL_BOARD)
+        empty = full ^ occupied
+        without_king = empty | king
+
+        danger = shift(white_pawns, 9, BatchMoveGenerator.NOT_FILE_A, number) \
+            | shift(white_pawns, 7, BatchMoveGenerator.NOT_FILE_H, number) \
+            | shift(black_pawns, -7, BatchMoveGenerator.NOT_FILE_A, number) \
+            | shift(black_pawns, -9, BatchMoveGenerator.NOT_FILE_H, number)
+        # The pawns that attack the king are on the squares that a pawn of its own side would attack from its square
+        checkers = black_pawns & (shift(king, 9, BatchMoveGenerator.NOT_FILE_A, number)
+                                  | shift(king, 7, BatchMoveGenerator.NOT_FILE_H, number)) \
+            | white_pawns & (shift(king, -7, BatchMoveGenerator.NOT_FILE_A, number)
+                             | shift(king, -9, BatchMoveGenerator.NOT_FILE_H, number))
+        for step, mask in BatchMoveGenerator.KNIGHT_STEPS:
+            danger = danger | shift(knights, step, mask, number)
+            checkers = checkers | (shift(king, step, mask, number) & knights)
+
+        check_rays = zero
+        pin_lines = []
+        for steps, sliders in [(BatchMoveGenerator.ROOK_STEPS, rooks), (BatchMoveGenerator.BISHOP_STEPS, bishops)]:
+            for step, mask in steps:
+                danger = danger | shift(kings, step, mask, number) \
+                    | shift(fill(sliders, step, mask, without_king, number), step, mask, number)
+                # The ray from the king up to and including the first piece in this direction
+                ray = shift(fill(king, step, mask, empty, number), step, mask, number)
+                checker = ray & sliders
+                checkers = checkers | checker
+                check_rays = check_rays | select(checker, ray, zero)
+                # A piece of its own is pinned if the next piece past it is a slider that moves in this direction
+                blocker = ray & own
+                x_ray = shift(fill(blocker, step, mask, empty, number), step, mask, number)
+                pinned = select(x_ray & sliders, blocker, zero)
+                pin_lines.append((pinned, select(pinned, ray | x_ray, zero)))
+
+        double_check = checkers & (checkers - number(1))
+        check_mask = select(checkers, select(double_check, zero, checkers | check_rays), full)
+        return danger, check_mask, pin_lines
+
+    @staticmethod
+    def __fill(bitboards, step: int, mask: int, empty, number: Callable):
+        """
+        Spreads bitboards over the empty squares in a direction, with a Kogge-Stone fill 1, 2 then 4 steps at a time
+
+        :param bitboards: int or NumPy uint64 array of bitboards to spread
+        :param step: int for the number of squares in one step in the direction, see __shift()
+        :param mask: int for a bitboard of the squares that can be stepped onto without wrapping around a side
+        :param empty: int or array of bitboards of the squares that can be spread over
+        :param number: callable to make constants with, see _stages()
+        :return: int or array of the bitboards and the squares spread over, not including the first piece reached
+        """
+        shift = BatchMoveGenerator.__shift
+        full = BatchMoveGenerator.FULL_BOARD
+        propagators = empty & number(mask)
+        filled = bitboards | (propagators & shift(bitboards, step, full, number))
+        propagators = propagators & shift(propagators, step, full, number)
+        filled = filled | (propagators & shift(filled, 2 * step, full, number))
+        propagators = propagators & shift(propagators, 2 * step, full, number)
+        return filled | (propagators & shift(filled, 4 * step, full, number))
+
+    @staticmethod
+    def __shift(bitboards, step: int, mask: int, number: Callable):
+        """
+        Shifts bitboards by a number of squares, keeping only the squares in a mask
+
+        :param bitboards: int or NumPy uint64 array of bitboards
+        :param step: int for the number of squares to shift up the board by, negative to shift down
+        :param mask: int for a bitboard of the squares to keep
+        :param number: callable to make constants with, see _stages()
+        :return: int or array as described
+        """
+        if step > 0:
+            return (bitboards << number(step)) & number(mask & BatchMoveGenerator.FULL_BOARD)
+        return (bitboards >> number(-step)) & number(mask)
+
+    @staticmethod
+    def __select(condition, if_set, if_empty):
+        """
+        Picks between two bitboards by whether another bitboard has any squares, for each board of a batch
+
+        :param condition: int or NumPy uint64 array of bitboards
+        :param if_set: int or array of the bitboards to pick where the condition has squares
+        :param if_empty: int or array of the bitboards to pick where the condition is empty
+        :return: int or array as described
+        """
+        if isinstance(condition, int):
+            return if_set if condition else if_empty
+        return numpy.where(condition != 0, if_set, if_empty).astype(numpy.uint64)
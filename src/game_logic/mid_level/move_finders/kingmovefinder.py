@@ -5,7 +5,10 @@ if TYPE_CHECKING:
     from src.game_logic.pieces import Piece
     from src.game_logic.mid_level.support.board import Board
 
+from src.game_logic.helpers import BearingHelper, TraverseHelper
 from src.game_logic.mid_level.move_finders.movefinder import MoveFinder
+from src.game_logic.mid_level.support.check import Check
+from src.game_logic.mid_level.support.geometry import Geometry
 
 
 class KingMoveFinder(MoveFinder):
@@ -34,17 +37,7 @@ class KingMoveFinder(MoveFinder):
 
         :return:
         """
-        curr_coords = self.piece.coords
-        return self.filter_dest_coords([
-            (curr_coords[0] + 1, curr_coords[1] + 1),
-            (curr_coords[0] + 1, curr_coords[1] - 1),
-            (curr_coords[0] + 1, curr_coords[1]),
-            (curr_coords[0] - 1, curr_coords[1] + 1),
-            (curr_coords[0] - 1, curr_coords[1] - 1),
-            (curr_coords[0] - 1, curr_coords[1]),
-            (curr_coords[0], curr_coords[1] + 1),
-            (curr_coords[0], curr_coords[1] - 1),
-        ])
+        return self.filter_dest_coords(list(Geometry.KING_COORDS[self.piece.coords]))
 
     @staticmethod
     def castling_sides():
@@ -98,8 +91,8 @@ class KingMoveFinder(MoveFinder):
         :param side: str for the side of castling
         :return: bool as described
         """
-        king_move_coords = self.__castle_king_move_coords(side)
-        return len(self.piece.filter_standard_moves(king_move_coords, self.board)) == len(king_move_coords)
+        check = Check(self.piece, self.board, BearingHelper(), TraverseHelper())
+        return any(check.coords_attacked(coords) for coords in self.__castle_king_move_coords(side))
 
     def __castle_king_move_coords(self, side: str) -> list[tuple[int, int]]:
         """
@@ -161,7 +154,7 @@ class KingMoveFinder(MoveFinder):
         :param side: str for the side of castling
         :return:
         """
-        coords = self.__castle_king_move_coords()
+        coords = self.__castle_king_move_coords(side)
         if side == "queen-side":
             coords.append((self.piece.coords[0], self.piece.coords[1] - 3))
         return coords
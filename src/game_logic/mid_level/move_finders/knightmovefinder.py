@@ -6,6 +6,7 @@ if TYPE_CHECKING:
     from src.game_logic.mid_level import Move, Board
 
 from src.game_logic.mid_level.move_finders.movefinder import MoveFinder
+from src.game_logic.mid_level.support.geometry import Geometry
 
 class KnightMoveFinder(MoveFinder):
     """
@@ -18,7 +19,7 @@ class KnightMoveFinder(MoveFinder):
         :param knight: Knight object to find the moves for
         :param board: Board object for this game of chess
         """
-        super().__init__(knight, board)
+        super().__init__(piece=knight, board=board)
 
     def _possible_moves(self) -> list['Move']:
         return self._create_standard_moves(self._dest_coords_list())
@@ -33,16 +34,9 @@ class KnightMoveFinder(MoveFinder):
 
         Implemented with coords as an input so to help to see if a king is in check via a knight, hence also why it is static
 
+        Coordinates off the board are left out, see Geometry.KNIGHT_COORDS
+
         :param coords to find the move coordinates of a knight (or attack from)
         :return: list of tuples as described
         """
-        row = coords[0]
-        col = coords[1]
-        return [(row - 2, col + 1),
-                (row - 1, col + 2),
-                (row - 2, col - 1),
-                (row - 1, col - 2),
-                (row + 1, col - 2),
-                (row + 2, col - 1),
-                (row + 2, col + 1),
-                (row + 1, col + 2)]
+        return list(Geometry.KNIGHT_COORDS[coords])
@@ -0,0 +1,395 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+from src.game_logic.codes import WHITE, PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING, QUIET, DOUBLE_PUSH, EN_PASSANT, \
+    CASTLE, PROMOTE_KNIGHT, PROMOTE_BISHOP, PROMOTE_ROOK, PROMOTE_QUEEN, WHITE_KING_SIDE, WHITE_QUEEN_SIDE
+from src.game_logic.mid_level.support.geometry import Geometry
+from src.game_logic.mid_level.support.leaperattacks import LeaperAttacks
+from src.game_logic.mid_level.support.slidingattacks import SlidingAttacks
+
+if TYPE_CHECKING:
+    from src.game_logic.mid_level.support.bitboard import BitBoard
+
+
+class LegalMoveGenerator:
+    """
+    Generates the legal moves for a position on a BitBoard, without executing any moves
+
+    Before generating any moves, the pieces pinned to the king and a check-evasion mask are found once. The check mask
+    is every square when the king is not in check. Under a single check it is the checking piece plus the squares
+    between it and the king, and it is empty under a double check, so only the king can move. Moves of pieces other
+    than the king must land inside the check mask, and pinned pieces must stay on the line of their pin. King moves and
+    en-passant captures are checked with attack lookups directly.
+
+    Moves are compact (source square, dest square, flag) tuples, as played by BitBoard.make_move()
+    """
+
+    FULL_BOARD = 0xFFFFFFFFFFFFFFFF
+    PROMOTION_FLAGS = [PROMOTE_QUEEN, PROMOTE_ROOK, PROMOTE_BISHOP, PROMOTE_KNIGHT]
+
+    def __init__(self, board: 'BitBoard'):
+        """
+        Constructor for a LegalMoveGenerator
+
+        :param board: BitBoard object to generate moves for
+        """
+        self.board = board
+        self.__cache_key = None
+        self.__cache_moves = []
+
+    def moves(self, side: int | None = None, legal: bool = True) -> list[tuple[int, int, int]]:
+        """
+        Finds the moves that a side can do in the current position of the board
+
+        The result is kept until the position changes, so that finding the moves of each piece of a side in turn only
+        generates the moves once
+
+        :param side: int for the colour index of the side, defaults to the side to move
+        :param legal: bool for if only legal moves should be found. If False, moves that leave the king in check are
+        included, like MoveFinder.moves(ignore_friendly_check=True). Default True
+        :return: list of compact moves as described
+        """
+        board = self.board
+        if side is None:
+            side = board.side_to_move
+        key = (tuple(board.piece_bitboards), board.castling_rights, board.ep_square, board.side_to_move, side, legal)
+        if key != self.__cache_key:
+            self.__cache_moves = self.generate(side, legal)
+            self.__cache_key = key
+        return self.__cache_moves
+
+    def moves_from(self, square: int, legal: bool = True) -> list[tuple[int, int, int]]:
+        """
+        Finds the moves that the piece on a square can do
+
+        :param square: int from 0-63 for the square of the piece
+        :param legal: bool for if only legal moves should be found, see moves()
+        :return: list of compact moves as described, empty if the square is vacant
+        """
+        code = self.board.mailbox[square]
+        if code is None:
+            return []
+        return [move for move in self.moves(code // 6, legal) if move[0] == square]
+
+    def attacks_from(self, square: int) -> int:
+        """
+        Finds the squares that the piece on a square attacks, whatever occupies them
+
+        :param square: int from 0-63 for the square of the piece
+        :return: int for a bitboard as described, 0 if the square is vacant
+        """
+        code = self.board.mailbox[square]
+        if code is None:
+            return 0
+        piece_type = code % 6
+        if piece_type == PAWN:
+            return LeaperAttacks.PAWN_ATTACKS[code // 6][square]
+        elif piece_type == KNIGHT:
+            return LeaperAttacks.KNIGHT_ATTACKS[square]
+        elif piece_type == KING:
+            return LeaperAttacks.KING_ATTACKS[square]
+        elif piece_type == BISHOP:
+            return SlidingAttacks.bishop_attacks(square, self.board.occupied)
+        elif piece_type == ROOK:
+            return SlidingAttacks.rook_attacks(square, self.board.occupied)
+        return SlidingAttacks.queen_attacks(square, self.board.occupied)
+
+    def generate_from(self, square: int, legal: bool = True) -> list[tuple[int, int, int]]:
+        """
+        Generates the moves that the piece on a square can do, without generating the moves of the rest of its side
+
+        :param square: int from 0-63 for the square of the piece
+        :param legal: bool for if only legal moves should be found, see moves()
+        :return: list of compact moves as described, empty if the square is vacant
+        """
+        code = self.board.mailbox[square]
+        if code is None:
+            return []
+        return self.generate(code // 6, legal, 1 << square)
+
+    def move_dependencies(self, square: int, legal: bool = True) -> int:
+        """
+        Finds the squares that the moves of the piece on a square depend on, so that the moves can be kept until
+        something on one of these squares changes
+
+        These are the square of the piece, the squares it attacks up to and including the first blocker on each ray, the
+        squares a pawn pushes to and, for legal moves, the line through the piece and its king, which decides if it is
+        pinned. Kings, and pawns while an en-passant capture is possible, depend on the whole board. See
+        move_context() for the rest of what the moves depend on
+
+        :param square: int from 0-63 for the square of the piece
+        :param legal: bool for if the moves are only the legal moves, see moves()
+        :return: int for a bitboard as described
+        """
+        board = self.board
+        code = board.mailbox[square]
+        if code is None or code % 6 == KING or (code % 6 == PAWN and board.ep_square is not None):
+            return self.FULL_BOARD
+        side = code // 6
+        dependencies = 1 << square | self.attacks_from(square)
+        if code % 6 == PAWN:
+            forward = 8 if side == WHITE else -8
+            for dest in [square + forward, square + 2 * forward]:
+                if 0 <= dest < 64:
+                    dependencies |= 1 << dest
+        if legal:
+            king_square = board.king_square(side)
+            if king_square is not None:
+                dependencies |= Geometry.LINE[king_square][square]
+        return dependencies
+
+    def move_context(self, square: int, legal: bool = True) -> tuple:
+        """
+        Describes what the moves of the piece on a square depend on, other than the squares from move_dependencies()
+
+        For legal moves this is the square of the king and the pieces giving check, the en-passant square and side to
+        move for pawns, and the castling rights for kings
+
+        :param square: int from 0-63 for the square of the piece
+        :param legal: bool for if the moves are only the legal moves, see moves()
+        :return: tuple that compares equal for as long as the moves can be kept
+        """
+        board = self.board
+        code = board.mailbox[square]
+        if code is None:
+            return ()
+        side = code // 6
+        context = ()
+        if legal:
+            king_square = board.king_square(side)
+            context = (king_square, 0 if king_square is None else board.attackers(king_square, side ^ 1))
+        if code % 6 == PAWN:
+            context += (board.ep_square, board.side_to_move)
+        elif code % 6 == KING:
+            context += (board.castling_rights,)
+        return context
+
+    def generate(self, side: int, legal: bool = True, sources: int = FULL_BOARD, danger: int | None = None,
+                 check_mask: int | None = None, pins: tuple[int, dict] | None = None) -> list[tuple[int, int, int]]:
+        """
+        Generates the moves that a side can do in the current position of the board, without using the cache
+
+        :param side: int for the colour index of the side
+        :param legal: bool for if only legal moves should be found, see moves()
+        :param sources: int for a bitboard of the squares of the pieces to generate moves for, default every square
+        :param danger: int for a bitboard of the squares attacked by the other side with the king of this side taken
+        off the board, if it is already known, see BatchMoveGenerator. The king moves are checked against it rather than
+        looking up the attackers of each square. Leave as None to look them up
+        :param check_mask: int for the check mask of this side, if it is already known, see BatchMoveGenerator. Leave as
+        None to find it from the attackers of the king
+        :param pins: tuple of a bitboard of the pinned pieces of this side and a dict from the square of each to the
+        squares it can still move on, if they are already known, see BatchMoveGenerator. Leave as None to find them. Must
+        be given along with check_mask
+        :return: list of compact moves as described
+        """
+        board = self.board
+        pieces = board.piece_bitboards
+        colours = board.colour_bitboards
+        occupied = board.occupied
+        own = colours[side]
+        enemy = colours[side ^ 1]
+        base = side * 6
+        king_square = board.king_square(side)
+        moves = []
+
+        pinned = 0
+        pin_rays = {}
+        in_check = False
+        if legal and check_mask is not None:
+            in_check = check_mask != self.FULL_BOARD
+            pinned, pin_rays = pins
+        elif legal and king_square is not None:
+            checkers = board.attackers(king_square, side ^ 1)
+            if checkers:
+                in_check = True
+                if checkers & (checkers - 1):
+                    check_mask = 0  # Double check, only the king can move
+                else:
+                    check_mask = checkers | self.between(king_square, checkers.bit_length() - 1)
+            pinned, pin_rays = self.__pins(king_square, side, own, enemy)
+        if check_mask is None or not legal:
+            check_mask = self.FULL_BOARD
+
+        if check_mask:
+            not_own = ~own
+            self.__pawn_moves(side, pieces[base + PAWN] & sources, occupied, enemy, check_mask, pinned, pin_rays, king_square,
+                              legal, moves)
+            for square in self.__squares(pieces[base + KNIGHT] & ~pinned & sources):
+                self.__add_targets(square, LeaperAttacks.KNIGHT_ATTACKS[square] & not_own & check_mask, moves)
+            rook_attacks = SlidingAttacks.rook_attacks
+            bishop_attacks = SlidingAttacks.bishop_attacks
+            for piece_type, attacks in [(BISHOP, bishop_attacks), (ROOK, rook_attacks), (QUEEN, None)]:
+                for square in self.__squares(pieces[base + piece_type] & sources):
+                    if attacks is None:
+                        targets = rook_attacks(square, occupied) | bishop_attacks(square, occupied)
+                    else:
+                        targets = attacks(square, occupied)
+                    targets &= not_own & check_mask
+                    if pinned >> square & 1:
+                        targets &= pin_rays[square]
+                    self.__add_targets(square, targets, moves)
+
+        if king_square is not None and sources >> king_square & 1:
+            self.__king_moves(side, king_square, own, occupied, in_check, legal, danger, moves)
+        return moves
+
+    def between(self, first: int, second: int) -> int:
+        """
+        Finds the squares strictly between two squares that share a row, column or diagonal
+
+        :param first: int from 0-63 for a square
+        :param second: int from 0-63 for a square
+        :return: int for a bitboard as described, 0 if the squares are not in line or are next to each other
+        """
+        return Geometry.BETWEEN[first][second]
+
+    def __pins(self, king_square: int, side: int, own: int, enemy: int) -> tuple[int, dict]:
+        """
+        Finds the pieces of a side that are pinned to their king
+
+        :param king_square: int for the square of the king
+        :param side: int for the colour index of the side
+        :param own: int for the occupancy of the side
+        :param enemy: int for the occupancy of the other side
+        :return: tuple of a bitboard of the pinned pieces, and a dict from the square of each pinned piece to the
+        squares it can still move on, ie the line to the pinning piece, including its square
+        """
+        pieces = self.board.piece_bitboards
+        enemy_base = (side ^ 1) * 6
+        queens = pieces[enemy_base + QUEEN]
+        # Treat friendly pieces as transparent, so that ranged enemies behind them are found
+        snipers = (SlidingAttacks.rook_attacks(king_square, enemy) & (pieces[enemy_base + ROOK] | queens)) \
+            | (SlidingAttacks.bishop_attacks(king_square, enemy) & (pieces[enemy_base + BISHOP] | queens))
+        pinned = 0
+        pin_rays = {}
+        for sniper in self.__squares(snipers):
+            line = self.between(king_square, sniper)
+            blockers = line & (own | enemy)
+            if blockers and not blockers & (blockers - 1) and blockers & own:
+                pinned |= blockers
+                pin_rays[blockers.bit_length() - 1] = line | 1 << sniper
+        return pinned, pin_rays
+
+    def __pawn_moves(self, side: int, pawns: int, occupied: int, enemy: int, check_mask: int, pinned: int,
+                     pin_rays: dict, king_square: int | None, legal: bool, moves: list) -> None:
+        """
+        Adds the moves of the pawns of a side, including double moves, promotions and en-passant captures
+
+        :return: None
+        """
+        board = self.board
+        forward = 8 if side == WHITE else -8
+        start_row = 1 if side == WHITE else 6
+        last_row = 7 if side == WHITE else 0
+        ep_square = board.ep_square if side == board.side_to_move else None
+        pawn_attacks = LeaperAttacks.PAWN_ATTACKS[side]
+        for square in self.__squares(pawns):
+            allowed = check_mask
+            if pinned >> square & 1:
+                allowed &= pin_rays[square]
+            dest = square + forward
+            if not occupied >> dest & 1:
+                if allowed >> dest & 1:
+                    self.__add_pawn_move(square, dest, dest >> 3 == last_row, moves)
+                double_dest = dest + forward
+                if square >> 3 == start_row and not occupied >> double_dest & 1 and allowed >> double_dest & 1:
+                    moves.append((square, double_dest, DOUBLE_PUSH))
+            for dest in self.__squares(pawn_attacks[square] & enemy & allowed):
+                self.__add_pawn_move(square, dest, dest >> 3 == last_row, moves)
+            if ep_square is not None and pawn_attacks[square] >> ep_square & 1:
+                if not legal or self.__en_passant_is_legal(side, square, ep_square, king_square):
+                    moves.append((square, ep_square, EN_PASSANT))
+
+    def __en_passant_is_legal(self, side: int, source: int, dest: int, king_square: int | None) -> bool:
+        """
+        Finds out if an en-passant capture leaves the king of the capturing side out of check
+
+        Both pawns leave their row in an en-passant capture, so it is checked by looking up the attacks on the king as
+        if the capture had happened, rather than with the check mask and pins
+
+        :return: bool as described
+        """
+        if king_square is None:
+            return True
+        board = self.board
+        pieces = board.piece_bitboards
+        captured = dest - 8 if side == WHITE else dest + 8
+        occupied = board.occupied ^ (1 << source | 1 << captured) | 1 << dest
+        enemy_base = (side ^ 1) * 6
+        queens = pieces[enemy_base + QUEEN]
+        return not ((LeaperAttacks.KNIGHT_ATTACKS[king_square] & pieces[enemy_base + KNIGHT])
+                    | (LeaperAttacks.PAWN_ATTACKS[side][king_square] & pieces[enemy_base + PAWN] & ~(1 << captured))
+                    | (SlidingAttacks.bishop_attacks(king_square, occupied) & (pieces[enemy_base + BISHOP] | queens))
+                    | (SlidingAttacks.rook_attacks(king_square, occupied) & (pieces[enemy_base + ROOK] | queens)))
+
+    def __king_moves(self, side: int, king_square: int, own: int, occupied: int, in_check: bool, legal: bool,
+                     danger: int | None, moves: list) -> None:
+        """
+        Adds the moves of the king of a side, including castling
+
+        :return: None
+        """
+        board = self.board
+        enemy_side = side ^ 1
+        targets = LeaperAttacks.KING_ATTACKS[king_square] & ~own
+        if legal and danger is not None:
+            self.__add_targets(king_square, targets & ~danger, moves)
+        else:
+            without_king = occupied ^ 1 << king_square
+            for dest in self.__squares(targets):
+                if not legal or not board.attackers(dest, enemy_side, without_king):
+                    moves.append((king_square, dest, QUIET))
+
+        home = 0 if side == WHITE else 56
+        rights = board.castling_rights >> (2 * side)
+        if king_square != home + 4 or not rights & (WHITE_KING_SIDE | WHITE_QUEEN_SIDE) or in_check:
+            return
+        rook = side * 6 + ROOK
+        mailbox = board.mailbox
+        if rights & WHITE_KING_SIDE and mailbox[home + 7] == rook and not occupied & (0b11 << (home + 5)) \
+                and not board.square_attacked(home + 5, enemy_side) and not board.square_attacked(home + 6, enemy_side) \
+                and (legal or not board.square_attacked(home + 4, enemy_side)):
+            moves.append((king_square, home + 6, CASTLE))
+        if rights & WHITE_QUEEN_SIDE and mailbox[home] == rook and not occupied & (0b111 << (home + 1)) \
+                and not board.square_attacked(home + 3, enemy_side) and not board.square_attacked(home + 2, enemy_side) \
+                and (legal or not board.square_attacked(home + 4, enemy_side)):
+            moves.append((king_square, home + 2, CASTLE))
+
+    @staticmethod
+    def __add_pawn_move(source: int, dest: int, promotes: bool, moves: list) -> None:
+        """
+        Adds a pawn move, or the four promotions for it if it reaches the last row
+
+        :return: None
+        """
+        if promotes:
+            for flag in LegalMoveGenerator.PROMOTION_FLAGS:
+                moves.append((source, dest, flag))
+        else:
+            moves.append((source, dest, QUIET))
+
+    @staticmethod
+    def __add_targets(source: int, targets: int, moves: list) -> None:
+        """
+        Adds a quiet move or capture from a square to each target square in a bitboard
+
+        :return: None
+        """
+        while targets:
+            lowest = targets & -targets
+            moves.append((source, lowest.bit_length() - 1, QUIET))
+            targets ^= lowest
+
+    @staticmethod
+    def __squares(bitboard: int) -> list[int]:
+        """
+        Finds the squares that are set in a bitboard, see CodeHelper.squares()
+
+        :return: list of square indices
+        """
+        squares = []
+        while bitboard:
+            lowest = bitboard & -bitboard
+            squares.append(lowest.bit_length() - 1)
+            bitboard ^= lowest
+        return squares
@@ -1,7 +1,8 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterator
 
+from src.game_logic.codes import CodeHelper, CASTLE, EN_PASSANT, PROMOTE_KNIGHT, PIECE_TYPES
 from src.game_logic.mid_level.moves.castle import Castle
 from src.game_logic.mid_level.moves.standardmove import StandardMove
 
@@ -16,6 +17,9 @@ class MoveFinder(ABC):
     Class to support finding the moves that a piece can do at a given point in a game of chess
     """
 
+    # Types of piece that a pawn can be promoted to, in the order their moves are made off the board
+    PROMOTION_TYPES = ["QUEEN", "ROOK", "BISHOP", "KNIGHT"]
+
     def __init__(self, board: 'Board', piece: 'Piece' = None):
         """
         Constructor for a MoveFinder
@@ -25,6 +29,7 @@ class MoveFinder(ABC):
         """
         self.piece = piece
         self.board = board
+        self.__move_cache = {}
 
     def moves(self, ignore_friendly_check: bool = False) -> list:
         """
@@ -34,7 +39,105 @@ class MoveFinder(ABC):
         this is really to check if a piece controls another square or not. Default False
         :return: list as described
         """
-        return self.__filter_illegal_moves(self._possible_moves(), ignore_friendly_check)
+        return list(self.iter_moves(ignore_friendly_check))
+
+    def iter_moves(self, ignore_friendly_check: bool = False) -> Iterator['Move']:
+        """
+        Yields the legal moves that the piece belonging to this MoveFinder can do, one at a time
+
+        Each Move object is only made once it is reached, so a caller that stops early doesn't pay for the rest. On a
+        BitBoard the moves come from compact_moves(), otherwise each possible move is checked to be legal as it is reached
+
+        A pawn moving to the last row has a StandardMove for each piece it can be promoted to, with its promotion set
+
+        :param ignore_friendly_check: bool for if moves that cause a friendly check should be included, see moves()
+        :return: iterator of Move objects
+        """
+        if self.piece.position is None:
+            return  # Captured pieces can't move
+        if self.board.backend == "BITBOARD":
+            for compact_move in self.compact_moves(ignore_friendly_check):
+                yield self._create_move(compact_move)
+        else:
+            for move in self._possible_moves():
+                if move.is_legal(ignore_friendly_check):
+                    if move.type() == "STANDARD" and self.piece.type == "PAWN" and move.dest.row in [0, 7]:
+                        for piece_type in self.PROMOTION_TYPES:
+                            yield self._move_init("STANDARD")(self.board, move.source.coords, move.dest.coords,
+                                                              promotion=self._promotion_piece(piece_type))
+                    else:
+                        yield move
+
+    def compact_moves(self, ignore_friendly_check: bool = False) -> Iterator[tuple[int, int, int]]:
+        """
+        Yields the legal moves that the piece belonging to this MoveFinder can do as compact moves, see BitBoard
+
+        On a BitBoard no Move objects are made at all. Each promotion is yielded once per piece that can be promoted to
+
+        :param ignore_friendly_check: bool for if moves that cause a friendly check should be included, see moves()
+        :return: iterator of (source square, dest square, flag) tuples
+        """
+        if self.piece.position is None:
+            return
+        if self.board.backend == "BITBOARD":
+            yield from self.__cached_compact_moves(not ignore_friendly_check)
+        else:
+            for move in self.iter_moves(ignore_friendly_check):
+                yield move.compact()
+
+    def __cached_compact_moves(self, legal: bool) -> list[tuple[int, int, int]]:
+        """
+        Finds the compact moves of the piece belonging to this MoveFinder on a BitBoard, reusing the moves found last
+        time if nothing they depend on has changed
+
+        The moves are kept with the squares they depend on, see LegalMoveGenerator.move_dependencies(), and the pieces
+        on those squares. So a move on the other side of the board leaves them be, and only the move finders whose
+        squares were touched have to generate their moves again
+
+        :param legal: bool for if only legal moves should be found
+        :return: list of compact moves
+        """
+        generator = self.board.move_generator
+        square = CodeHelper.square(self.piece.coords)
+        cached = self.__move_cache.get(legal)
+        if cached is not None:
+            moves, cached_square, dependencies, contents, context = cached
+            if cached_square == square and context == generator.move_context(square, legal) \
+                    and contents == self.__contents(dependencies):
+                return moves
+        moves = generator.generate_from(square, legal)
+        dependencies = generator.move_dependencies(square, legal)
+        self.__move_cache[legal] = (moves, square, dependencies, self.__contents(dependencies),
+                                    generator.move_context(square, legal))
+        return moves
+
+    def __contents(self, squares: int) -> tuple[int, ...]:
+        """
+        Describes the pieces on a set of squares of a BitBoard
+
+        :param squares: int for a bitboard of the squares
+        :return: tuple of each piece bitboard masked to the squares
+        """
+        return tuple(bitboard & squares for bitboard in self.board.piece_bitboards)
+
+    def has_any_legal_move(self) -> bool:
+        """
+        Finds out if the piece belonging to this MoveFinder has at least one legal move, stopping at the first one found
+
+        :return: bool as described
+        """
+        return next(self.compact_moves(), None) is not None
+
+    def count_legal_moves(self) -> int:
+        """
+        Counts the legal moves that the piece belonging to this MoveFinder can do, without making any Move objects on a
+        BitBoard
+
+        Each promotion of a pawn counts as a move of its own, as it is in moves()
+
+        :return: int as described
+        """
+        return sum(1 for _ in self.compact_moves())
 
     def can_attack_coords(self, coords : tuple[int, int]) -> bool:
         """
@@ -43,8 +146,10 @@ class MoveFinder(ABC):
         :param coords: coordinates on a chessboard
         :return: bool as described
         """
-        all_moves = self.moves(ignore_friendly_check=True)
-        for move in all_moves:
+        if self.board.backend == "BITBOARD":
+            attacks = self.board.move_generator.attacks_from(CodeHelper.square(self.piece.coords))
+            return bool(attacks >> CodeHelper.square(coords) & 1)
+        for move in self.iter_moves(ignore_friendly_check=True):
             if move.type() == "STANDARD" and move.can_capture and move.dest.coords == coords:
                 return True
         return False
@@ -63,20 +168,6 @@ class MoveFinder(ABC):
         """
         pass
 
-    @staticmethod
-    def __filter_illegal_moves(moves: list, ignore_friendly_check=False):
-        """
-        Filters a list of moves, so only the legal ones remain
-
-        :param moves: List of moves
-        :return: list of filtered moves
-        """
-        filtered_moves = []
-        for move in moves:
-            if move.is_legal(ignore_friendly_check):
-                filtered_moves.append(move)
-        return filtered_moves
-
     def _create_standard_moves(self, dest_coords_list : list[tuple[int, int]], can_capture: bool = True):
         """
         Creates a list of standard move objects based on the inputted destination coordinates
@@ -100,6 +191,51 @@ class MoveFinder(ABC):
             moves.append(self._move_init("STANDARD")(self.board, self.piece.coords, dest_coords, capture_coords=None))
         return moves
 
+    def _create_moves(self, compact_moves: list[tuple[int, int, int]]) -> list['Move']:
+        """
+        Creates Move objects from the compact moves found by a LegalMoveGenerator, see BitBoard
+
+        :param compact_moves: list of (source square, dest square, flag) tuples for moves of the piece of this MoveFinder
+        :return: list of move objects that can be readily executed
+        """
+        return [self._create_move(compact_move) for compact_move in compact_moves]
+
+    def _create_move(self, compact_move: tuple[int, int, int]) -> 'Move' | None:
+        """
+        Creates the Move object for a single compact move, see _create_moves()
+
+        A promotion is made into a StandardMove with a new piece of the type promoted to, see _promotion_piece()
+
+        :param compact_move: (source square, dest square, flag) tuple for a move of the piece of this MoveFinder
+        :return: Move object that can be readily executed
+        """
+        source, dest, flag = compact_move
+        source_coords, dest_coords = CodeHelper.coords(source), CodeHelper.coords(dest)
+        if flag == CASTLE:
+            rook_source, rook_dest = self.board.CASTLING_ROOK_SQUARES[dest]
+            rook = self.board.get_position(CodeHelper.coords(rook_source)).piece
+            return self._move_init("CASTLE")(self.board, self.piece, rook, dest_coords, CodeHelper.coords(rook_dest))
+        if flag == EN_PASSANT:
+            return self._move_init("STANDARD")(self.board, source_coords, dest_coords,
+                                               capture_coords=(source_coords[0], dest_coords[1]))
+        if flag >= PROMOTE_KNIGHT:
+            return self._move_init("STANDARD")(self.board, source_coords, dest_coords,
+                                               promotion=self._promotion_piece(PIECE_TYPES[flag - PROMOTE_KNIGHT + 1]))
+        return self._move_init("STANDARD")(self.board, source_coords, dest_coords)
+
+    def _promotion_piece(self, piece_type: str) -> 'Piece':
+        """
+        Creates a piece for the pawn of this MoveFinder to be promoted to, with the piece factory of the board
+
+        The piece isn't added to the pieces of a player, that is left to whoever executes the move, see
+        Game.execute_move()
+
+        :param piece_type: str for the type of the piece, one of PROMOTION_TYPES
+        :return: Piece object as described
+        """
+        assert self.board.piece_factory is not None, "The board needs a piece factory for promotions, see Setup"
+        return self.board.piece_factory(self.piece.colour, piece_type, self.piece.king)
+
     def filter_dest_coords(self, dest_coords: list[tuple[int, int]], attack_only: bool = False,
                            vacant_only: bool = False) -> list[tuple[int, int]]:
         """
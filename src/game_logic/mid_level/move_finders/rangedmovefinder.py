@@ -9,6 +9,9 @@ if TYPE_CHECKING:
     from src.game_logic.mid_level.moves import Move
 
 from src.game_logic.mid_level.move_finders.movefinder import MoveFinder
+from src.game_logic.codes import CodeHelper
+from src.game_logic.mid_level.support.geometry import Geometry
+from src.game_logic.mid_level.support.slidingattacks import SlidingAttacks
 
 class RangedMoveFinder(MoveFinder):
     """
@@ -31,11 +34,24 @@ class RangedMoveFinder(MoveFinder):
         return self._create_standard_moves(self._dest_coords_list())
 
     def _dest_coords_list(self) -> list[tuple[int, int]]:
+        if self.board.backend == "BITBOARD":
+            return self.__table_dest_coords()
         move_coords = []
         for bearing in self.piece.bearings():
             move_coords += self.__dfs_coords(bearing)
         return self.filter_dest_coords(move_coords)
 
+    def __table_dest_coords(self) -> list[tuple[int, int]]:
+        """
+        Finds the destination coords of this piece with a single lookup in the precomputed SlidingAttacks tables, masked
+        by friendly occupancy. Only used on a BitBoard
+
+        :return: list of coordinate tuples as described
+        """
+        attacks = SlidingAttacks.attacks(self.piece.type, CodeHelper.square(self.piece.coords), self.board.occupied)
+        attacks &= ~self.board.colour_occupancy(self.piece.colour)
+        return [CodeHelper.coords(square) for square in CodeHelper.squares(attacks)]
+
     def __dfs_coords(self, bearing: 'str') -> list[tuple]:
         """
         Completes a dfs for the specified Traverse for a piece at a particular position.
@@ -48,11 +64,12 @@ class RangedMoveFinder(MoveFinder):
         """
         assert bearing in self.piece.bearings(), "This bearing is not in the known bearings of this Ranged Piece!"
         move_coords: list[tuple] = []
-        traverse_coords: tuple = self.traverse_helper.next_coords(self.piece.coords, bearing)
-        while self.board.coords_in_board(traverse_coords):
-            if self.board.get_position(traverse_coords).is_friendly(self.piece.colour):  # Friendly pieces block moves
+        for traverse_coords in Geometry.RAY_COORDS[bearing][self.piece.coords]:
+            traverse_pos = self.board.get_position(traverse_coords)
+            if traverse_pos.is_friendly(self.piece.colour):  # Friendly pieces block moves
                 break
             move_coords.append(traverse_coords)
-            traverse_coords = self.traverse_helper.next_coords(traverse_coords, bearing)
+            if traverse_pos.is_hostile(self.piece.colour):  # Enemy pieces can be captured, but block moves past them
+                break
         return move_coords
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 from src.game_logic.mid_level.moves.move import Move
+from src.game_logic.codes import CodeHelper, CASTLE
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -16,7 +17,8 @@ class Castle(Move):
 
     The instructions on which coordinates to move the king and rook to are provided my KingMoveFinder
     """
-    __side: str = ""
+
+    __slots__ = ("king", "rook", "king_dest_coords", "rook_dest_coords", "king_source_coords", "rook_source_coords")
 
     def __init__(self, board: 'Board', king: 'King', rook: 'Rook', king_dest_coords: tuple, rook_dest_coords: tuple):
         """
@@ -26,7 +28,7 @@ class Castle(Move):
         :param king: King object to be moved by this Castling
         :param rook : Rook involved in this castling
         """
-        super().__init__(board, [rook, king], can_capture=False)
+        super().__init__(board, [rook, king])
         assert king.colour == rook.colour, "Rook and king must be same colour in castling!"
         assert rook is not None, "Rook cannot be None!"
         self.king = king
@@ -55,6 +57,9 @@ class Castle(Move):
     def type(self) -> str:
         return "CASTLE"
 
+    def compact(self) -> tuple[int, int, int]:
+        return CodeHelper.square(self.king_source_coords), CodeHelper.square(self.king_dest_coords), CASTLE
+
     def _reverse_moving_pieces(self) -> None:
         self.rook.swap_position(self.board.get_position(self.rook_source_coords))
         self.king.swap_position(self.board.get_position(self.king_source_coords))
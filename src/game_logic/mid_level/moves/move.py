@@ -16,7 +16,8 @@ class Move(ABC):
         capture pieces on a forward move.
     """
 
-    __executed: bool = False
+    # Moves are made in bulk by move finders and replays, so they keep their attributes in slots rather than a __dict__
+    __slots__ = ("__executed", "__had_moved", "board", "pieces")
 
     def __init__(self, board: 'Board', pieces: list['Piece']):
         """
@@ -27,6 +28,8 @@ class Move(ABC):
         """
         self.board = board
         self.pieces = pieces
+        self.__executed = False
+        self.__had_moved = []
 
     @property
     def executed(self) -> bool:
@@ -48,7 +51,10 @@ class Move(ABC):
         :return: None
         """
         self.pre_execute_checks(check_legal, ignore_friendly_check)
+        self.__had_moved = [piece.has_moved for piece in self.pieces]
+        self.board.pre_move_updates(self)
         self._move_pieces()
+        self.board.post_move_updates(self)
         self.__post_execute_updates(is_test)
 
     def __post_execute_updates(self, is_test: bool = False) -> None:
@@ -93,6 +99,7 @@ class Move(ABC):
         """
         self.__pre_reverse_checks()
         self._reverse_moving_pieces()
+        self.board.post_reverse_updates(self)
         self.__post_reverse_updates()
 
     def __post_reverse_updates(self) -> None:
@@ -102,8 +109,8 @@ class Move(ABC):
         :return: None
         """
         self.__executed = False
-        for piece in self.pieces:
-            piece.has_moved = True
+        for piece, had_moved in zip(self.pieces, self.__had_moved):
+            piece.has_moved = had_moved
 
     def __pre_reverse_checks(self):
         """
@@ -135,6 +142,8 @@ class Move(ABC):
         :return: bool as described
         """
         if not ignore_friendly_check:
+            if self.board.backend == "BITBOARD":
+                return self.board.move_is_legal(self.compact())
             return self.__causes_friendly_check()
         return True
 
@@ -160,6 +169,15 @@ class Move(ABC):
         """
         pass
 
+    @abstractmethod
+    def compact(self) -> tuple[int, int, int]:
+        """
+        Compact form of this move, as played by BitBoard.make_move()
+
+        :return: tuple of (source square, dest square, flag), see the flags in codes
+        """
+        pass
+
     @abstractmethod
     def type(self) -> str:
         """
@@ -3,6 +3,7 @@ from __future__ import annotations
 import math
 
 from src.game_logic.mid_level.moves.move import Move
+from src.game_logic.codes import CodeHelper, QUIET, DOUBLE_PUSH, EN_PASSANT, PIECE_TYPES
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -19,9 +20,11 @@ class StandardMove(Move):
     Attributes:
         Inherited attributes from Move
     """
-    __capture : Piece | None =  None
 
-    def __init__(self, board: 'Board', source_coords: tuple[int, int], dest_coords: tuple[int, int], capture_coords=None, can_capture : bool= True):
+    __slots__ = ("__can_capture", "__promotion", "__capture", "source", "dest", "piece", "capture_pos")
+
+    def __init__(self, board: 'Board', source_coords: tuple[int, int], dest_coords: tuple[int, int], capture_coords=None, can_capture : bool= True,
+                 promotion: 'Piece' | None = None):
         """
         Constructor for a standard move
 
@@ -31,12 +34,15 @@ class StandardMove(Move):
         :param capture_coords: coordinates for the piece that is being captured by this move.
          If left None, these are set to dest_coords. Aimed at supporting en-passant capturing
         :param can_capture: bool for if this Move can capture another piece or not. //TODO why is this necessary?
+        :param promotion: Piece object that a pawn is promoted to by this move, placed on the dest in place of the pawn.
+        Leave as None if this move isn't a promotion
         """
         super().__init__(board, [board.get_position(source_coords).piece])
         self.source = board.get_position(source_coords)
         self.dest = board.get_position(dest_coords)
         self.piece = self.source.piece
         self.can_capture = can_capture
+        self.promotion = promotion
         self._set_capture(capture_coords)
 
     @property
@@ -59,6 +65,27 @@ class StandardMove(Move):
         assert isinstance(can_capture, bool)
         self.__can_capture = can_capture
 
+    @property
+    def promotion(self) -> 'Piece' | None:
+        """
+        The piece that a pawn is promoted to by this StandardMove, None if it isn't a promotion
+
+        :return: Piece or None object as described
+        """
+        return self.__promotion
+
+    @promotion.setter
+    def promotion(self, val: 'Piece' | None) -> None:
+        """
+        Sets the piece that a pawn is promoted to by this StandardMove, see Setup.create_piece() for creating one
+
+        :param val: Piece object that isn't on the board yet, or None
+        :return: None
+        """
+        assert val is None or (val.position is None and val.type in ["KNIGHT", "BISHOP", "ROOK", "QUEEN"]), \
+            "A pawn can only be promoted to a knight, bishop, rook or queen that isn't on the board"
+        self.__promotion = val
+
     @property
     def capture(self) -> 'Piece' | None:
         """
@@ -78,16 +105,34 @@ class StandardMove(Move):
             self.capture_pos = self.dest
         else:
             self.capture_pos = self.board.get_position(capture_coords)
-            self.capture_piece = self.capture_pos.piece
-            assert self.capture_piece is not None, "Capture coords specified with no piece at coords!"
+            assert self.capture_pos.piece is not None, "Capture coords specified with no piece at coords!"
+        self.__capture = self.capture_pos.piece
 
     def _move_pieces(self) -> None:
-        self.capture_pos.piece.reset_position()
-        self.piece.swap_position(self.dest)
+        if self.capture is not None:
+            self.capture.reset_position()
+        if self.promotion is None:
+            self.piece.swap_position(self.dest)
+        else:
+            self.piece.reset_position()
+            self.promotion.swap_position(self.dest)
 
     def _reverse_moving_pieces(self) -> None:
+        if self.promotion is not None:
+            self.promotion.reset_position()
         self.piece.swap_position(self.source)
-        self.capture_piece.swap_position(self.capture_pos)
+        if self.capture is not None:
+            self.capture.swap_position(self.capture_pos)
+
+    def compact(self) -> tuple[int, int, int]:
+        flag = QUIET
+        if self.promotion is not None:
+            flag = PIECE_TYPES.index(self.promotion.type) + 3
+        elif self.capture_pos is not self.dest:
+            flag = EN_PASSANT
+        elif self.piece.type == "PAWN" and abs(self.source.row - self.dest.row) == 2:
+            flag = DOUBLE_PUSH
+        return CodeHelper.square(self.source.coords), CodeHelper.square(self.dest.coords), flag
 
     def is_legal(self, ignore_friendly_check: bool = False) -> bool:
         """
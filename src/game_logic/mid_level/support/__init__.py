@@ -1,4 +1,6 @@
 from src.game_logic.mid_level.support.board import Board
+from src.game_logic.mid_level.support.bitboard import BitBoard
+from src.game_logic.mid_level.support.bitposition import BitPosition
 from src.game_logic.mid_level.support.check import Check
 from src.game_logic.mid_level.support.player import Player
 from src.game_logic.mid_level.support.position import Position
\ No newline at end of file
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src.game_logic.codes import CodeHelper, PAWN, KNIGHT, BISHOP, ROOK, KING
+from src.game_logic.mid_level.support.leaperattacks import LeaperAttacks
+from src.game_logic.mid_level.support.slidingattacks import SlidingAttacks
+
+if TYPE_CHECKING:
+    from src.game_logic.mid_level.support.bitboard import BitBoard
+
+
+class AttackMap:
+    """
+    The squares that each colour attacks in a position on a BitBoard, and the pieces that attack each square
+
+    Built once for a position, so that questions like 'is this king in check', 'which squares can't the king castle
+    through' or 'what attacks this square' are each a single lookup. See BitBoard.attack_map for how maps are cached
+    for each position
+    """
+
+    def __init__(self, board: 'BitBoard'):
+        """
+        Constructor for an AttackMap, finds the attacks of every piece on a board
+
+        :param board: BitBoard object with the position to map
+        """
+        self.__attacked = [0, 0]
+        self.__attackers = [[0] * 64, [0] * 64]
+        occupied = board.occupied
+        piece_bitboards = board.piece_bitboards
+        for side in range(2):
+            attackers = self.__attackers[side]
+            for piece_type in range(6):
+                for square in CodeHelper.squares(piece_bitboards[side * 6 + piece_type]):
+                    attacks = self.__piece_attacks(side, piece_type, square, occupied)
+                    self.__attacked[side] |= attacks
+                    bit = 1 << square
+                    for target in CodeHelper.squares(attacks):
+                        attackers[target] |= bit
+
+    @staticmethod
+    def __piece_attacks(side: int, piece_type: int, square: int, occupied: int) -> int:
+        """
+        Finds the squares that a piece attacks
+
+        :param side: int for the colour index of the piece
+        :param piece_type: int for the type of the piece
+        :param square: int from 0-63 for the square of the piece
+        :param occupied: int for a bitboard of the occupied squares, that block ranged pieces
+        :return: int for a bitboard of the attacked squares
+        """
+        if piece_type == PAWN:
+            return LeaperAttacks.PAWN_ATTACKS[side][square]
+        if piece_type == KNIGHT:
+            return LeaperAttacks.KNIGHT_ATTACKS[square]
+        if piece_type == KING:
+            return LeaperAttacks.KING_ATTACKS[square]
+        if piece_type == BISHOP:
+            return SlidingAttacks.bishop_attacks(square, occupied)
+        if piece_type == ROOK:
+            return SlidingAttacks.rook_attacks(square, occupied)
+        return SlidingAttacks.queen_attacks(square, occupied)
+
+    def attacked(self, by_side: int) -> int:
+        """
+        Finds the squares that a side attacks
+
+        :param by_side: int for the colour index of the side
+        :return: int for a bitboard as described
+        """
+        return self.__attacked[by_side]
+
+    def is_attacked(self, square: int, by_side: int) -> bool:
+        """
+        Finds out if a square is attacked by a side
+
+        :param square: int from 0-63 for the square
+        :param by_side: int for the colour index of the side
+        :return: bool as described
+        """
+        return bool(self.__attacked[by_side] >> square & 1)
+
+    def attackers(self, square: int, by_side: int) -> int:
+        """
+        Finds the pieces of a side that attack a square
+
+        :param square: int from 0-63 for the square
+        :param by_side: int for the colour index of the side
+        :return: int for a bitboard of the squares of the attacking pieces
+        """
+        return self.__attackers[by_side][square]
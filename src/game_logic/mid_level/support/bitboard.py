@@ -0,0 +1,638 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+from src.game_logic.mid_level.support.board import Board
+from src.game_logic.mid_level.support.bitposition import BitPosition
+from src.game_logic.codes import CodeHelper, WHITE, BLACK, PAWN, KNIGHT, BISHOP, ROOK, QUEEN, \
+    KING, DOUBLE_PUSH, EN_PASSANT, CASTLE, PROMOTE_KNIGHT, ALL_CASTLING
+from src.game_logic.mid_level.support.leaperattacks import LeaperAttacks
+from src.game_logic.mid_level.support.slidingattacks import SlidingAttacks
+from src.game_logic.mid_level.support.zobrist import Zobrist
+from src.game_logic.mid_level.support.piecesquaretables import PieceSquareTables
+from src.game_logic.mid_level.support.attackmap import AttackMap
+from src.game_logic.mid_level.support.boardsnapshot import BoardSnapshot
+
+if TYPE_CHECKING:
+    from src.game_logic.helpers import CoordsHelper
+    from src.game_logic.mid_level.moves.move import Move
+    from src.game_logic.mid_level.move_finders.legalmovegenerator import LegalMoveGenerator
+
+
+class BitBoard(Board):
+    """
+    Class to represent a Board object in a game of chess that is backed by bitboards
+
+    Each of the twelve coloured piece types has a 64-bit int with one bit set per square that it occupies, as per
+    CodeHelper.square(coords). Occupancy ints are also kept for each colour and for the whole board, so that questions
+    like 'which squares hold a black piece' are answered with a single int rather than a scan of the Position objects.
+
+    Position objects are still available through get_position() and get_row(). These are BitPositions, which keep the
+    bitboards up to date whenever a Piece is moved onto or off them.
+
+    Searches can play compact moves with make_move() and take them back with unmake_move(), these only touch the
+    bitboards and the game state, see Board, and keep an undo stack, so no Move, Position or Piece objects are involved.
+
+    The Zobrist key of the position, see Zobrist, is kept up to date on every change to the pieces or the game state,
+    so it is never worked out from scratch. The same goes for the material and piece-square sums used for scoring the
+    position, see PieceSquareTables.
+
+    The AttackMap of a position is built the first time it is asked for and cached by the Zobrist key, so making or
+    unmaking a move leaves it behind without any work, and coming back to a recent position finds it again. Building a
+    map costs far more than one square_attacked() call, so it is only worth it for callers that ask several questions
+    of the same position, single questions like is_in_check() don't use it.
+
+    A BitBoard can be copied with clone(), or made from a BoardSnapshot with from_snapshot(). The copy only has the
+    bitboards and game state, its Positions are empty and no Piece objects are shared, so it is independent of the
+    board it came from and is only meant for searching with make_move() and unmake_move().
+    """
+
+    ATTACK_MAP_CACHE_SIZE = 16
+
+    # Bitboard of the light squares, ie b1, d1, ..., a2, c2, ...
+    LIGHT_SQUARES = 0x55AA55AA55AA55AA
+
+    def __init__(self, coords_helper: 'CoordsHelper'):
+        """
+        Initializer for a BitBoard object, creates an empty board
+
+        The game state starts as it is at the start of a game of chess, white to move with all castling rights
+
+        :param coords_helper: CoordsHelper object to help with dealing with coordinates
+        """
+        self.__piece_bitboards = [0] * 12
+        self.__colour_bitboards = [0, 0]
+        self.__occupied = 0
+        self.__mailbox = [None] * 64
+        self.__side_to_move = WHITE
+        self.__castling_rights = ALL_CASTLING
+        self.__ep_square = None
+        self.__halfmove_clock = 0
+        self.__fullmove_number = 1
+        self.__undo_stack = []
+        self.__move_generator = None
+        self.__zobrist_key = Zobrist.CASTLING_KEYS[ALL_CASTLING]
+        self.__ep_key = 0
+        self.__middle_score = 0
+        self.__end_score = 0
+        self.__phase = 0
+        self.__attack_maps = {}
+        self.__coords_helper = coords_helper
+        super().__init__([[BitPosition((row, col), coords_helper, self) for col in range(8)] for row in range(8)])
+
+    @property
+    def backend(self) -> str:
+        return "BITBOARD"
+
+    @property
+    def move_generator(self) -> 'LegalMoveGenerator' | None:
+        """
+        The LegalMoveGenerator that finds moves on this board for the MoveFinders of its pieces, set by Setup
+
+        :return: LegalMoveGenerator object, or None if one hasn't been set
+        """
+        return self.__move_generator
+
+    @move_generator.setter
+    def move_generator(self, val: 'LegalMoveGenerator') -> None:
+        self.__move_generator = val
+
+    @property
+    def zobrist_key(self) -> int:
+        """
+        The 64-bit Zobrist key of the position on this board, covering the pieces, side to move, castling rights and
+        en passant file
+
+        :return: int as described
+        """
+        return self.__zobrist_key
+
+    @property
+    def position_key(self) -> int:
+        return self.__zobrist_key
+
+    @property
+    def attack_map(self) -> AttackMap:
+        """
+        The AttackMap of the position on this board, built if it isn't already cached for the Zobrist key
+
+        :return: AttackMap object as described
+        """
+        attack_maps = self.__attack_maps
+        attack_map = attack_maps.get(self.__zobrist_key)
+        if attack_map is None:
+            if len(attack_maps) >= self.ATTACK_MAP_CACHE_SIZE:
+                del attack_maps[next(iter(attack_maps))]
+            attack_map = attack_maps[self.__zobrist_key] = AttackMap(self)
+        return attack_map
+
+    @property
+    def middle_score(self) -> int:
+        """
+        The sum of the middle game values of every piece on this board, from white's point of view
+
+        :return: int as described
+        """
+        return self.__middle_score
+
+    @property
+    def end_score(self) -> int:
+        """
+        The sum of the end game values of every piece on this board, from white's point of view
+
+        :return: int as described
+        """
+        return self.__end_score
+
+    @property
+    def phase(self) -> int:
+        """
+        The phase of the game, the sum of the phase weights of every piece on this board. Goes down as pieces are
+        captured, see PieceSquareTables
+
+        :return: int as described
+        """
+        return self.__phase
+
+    @property
+    def piece_bitboards(self) -> list[int]:
+        """
+        The bitboards for each piece code, see CodeHelper.piece_code()
+
+        :return: list of 12 ints as described
+        """
+        return self.__piece_bitboards
+
+    @property
+    def colour_bitboards(self) -> list[int]:
+        """
+        The occupancy bitboards for each colour, indexed by CodeHelper.colour_index()
+
+        :return: list of 2 ints as described
+        """
+        return self.__colour_bitboards
+
+    @property
+    def occupied(self) -> int:
+        """
+        The occupancy bitboard for the whole board
+
+        :return: int as described
+        """
+        return self.__occupied
+
+    @property
+    def mailbox(self) -> list[int | None]:
+        """
+        The piece code occupying each square of this board, None for vacant squares
+
+        :return: list of length 64 as described
+        """
+        return self.__mailbox
+
+    def piece_bitboard(self, colour: str, piece_type: str) -> int:
+        """
+        Finds the bitboard for the pieces of a given colour and type
+
+        :param colour: str for the colour of the pieces
+        :param piece_type: str for the type of the pieces, as per Piece.type
+        :return: int for the bitboard as described
+        """
+        return self.__piece_bitboards[CodeHelper.piece_code(colour, piece_type)]
+
+    def colour_occupancy(self, colour: str) -> int:
+        """
+        Finds the occupancy bitboard for the pieces of a given colour
+
+        :param colour: str for the colour of the pieces
+        :return: int for the bitboard as described
+        """
+        return self.__colour_bitboards[CodeHelper.colour_index(colour)]
+
+    def snapshot(self) -> BoardSnapshot:
+        """
+        Takes an immutable copy of the position on this board straight from the mailbox, see BoardSnapshot
+
+        :return: BoardSnapshot object as described
+        """
+        return BoardSnapshot(tuple(self.__mailbox), self.__side_to_move, self.__castling_rights, self.__ep_square,
+                             self.__halfmove_clock, self.__fullmove_number)
+
+    @staticmethod
+    def from_snapshot(snapshot: BoardSnapshot, coords_helper: 'CoordsHelper') -> BitBoard:
+        """
+        Makes a new BitBoard with the position of a snapshot, with empty Positions and no Piece objects
+
+        The Zobrist key and scores are built up square by square, so this takes O(64). A move generator is not set, see
+        clone() for copying the one of an existing board
+
+        :param snapshot: BoardSnapshot object with the position to set up
+        :param coords_helper: CoordsHelper object to help with dealing with coordinates
+        :return: BitBoard object as described
+        """
+        board = BitBoard(coords_helper)
+        for square, code in enumerate(snapshot.mailbox):
+            if code is not None:
+                board.set_square(square, code)
+        board.side_to_move = snapshot.side_to_move
+        board.castling_rights = snapshot.castling_rights
+        board.ep_square = snapshot.ep_square
+        board.halfmove_clock = snapshot.halfmove_clock
+        board.fullmove_number = snapshot.fullmove_number
+        return board
+
+    def clone(self) -> BitBoard:
+        """
+        Makes an independent copy of the position on this board, see from_snapshot()
+
+        The copy gets its own move generator of the same type as the one of this board, if this board has one. Moves
+        made on this board before cloning can't be unmade on the copy
+
+        :return: BitBoard object as described
+        """
+        board = BitBoard.from_snapshot(self.snapshot(), self.__coords_helper)
+        if self.__move_generator is not None:
+            board.move_generator = type(self.__move_generator)(board)
+        return board
+
+    def piece_code_at(self, square: int) -> int | None:
+        """
+        Finds the piece code occupying a square on this board
+
+        :param square: int from 0-63 for a square
+        :return: int for a piece code, or None if the square is vacant
+        """
+        return self.__mailbox[square]
+
+    def set_square(self, square: int, code: int | None) -> None:
+        """
+        Sets the piece code that occupies a square, updating all bitboards
+
+        Only updates the bitboards, any Position or Piece objects are left untouched. See BitPosition for how these are
+        kept in sync
+
+        :param square: int from 0-63 for a square
+        :param code: int for a piece code, or None to clear the square
+        :return: None
+        """
+        bit = 1 << square
+        old_code = self.__mailbox[square]
+        if old_code is not None:
+            self.__piece_bitboards[old_code] ^= bit
+            self.__colour_bitboards[old_code // 6] ^= bit
+            self.__occupied ^= bit
+            self.__zobrist_key ^= Zobrist.PIECE_KEYS[old_code][square]
+            self.__middle_score -= PieceSquareTables.MIDDLE_VALUES[old_code][square]
+            self.__end_score -= PieceSquareTables.END_VALUES[old_code][square]
+            self.__phase -= PieceSquareTables.PHASES[old_code]
+        if code is not None:
+            self.__piece_bitboards[code] |= bit
+            self.__colour_bitboards[code // 6] |= bit
+            self.__occupied |= bit
+            self.__zobrist_key ^= Zobrist.PIECE_KEYS[code][square]
+            self.__middle_score += PieceSquareTables.MIDDLE_VALUES[code][square]
+            self.__end_score += PieceSquareTables.END_VALUES[code][square]
+            self.__phase += PieceSquareTables.PHASES[code]
+        self.__mailbox[square] = code
+
+    @property
+    def side_to_move(self) -> int:
+        """
+        The colour index of the side to move, WHITE or BLACK
+
+        :return: int as described
+        """
+        return self.__side_to_move
+
+    @side_to_move.setter
+    def side_to_move(self, val: int) -> None:
+        assert val in [WHITE, BLACK]
+        if val != self.__side_to_move:
+            self.__zobrist_key ^= Zobrist.SIDE_KEY
+        self.__side_to_move = val
+        self.__update_ep_key()
+
+    @property
+    def castling_rights(self) -> int:
+        """
+        The castling rights that remain in this game, made up from the castling bits in codes
+
+        :return: int as described
+        """
+        return self.__castling_rights
+
+    @castling_rights.setter
+    def castling_rights(self, val: int) -> None:
+        assert 0 <= val <= ALL_CASTLING
+        self.__zobrist_key ^= Zobrist.CASTLING_KEYS[self.__castling_rights] ^ Zobrist.CASTLING_KEYS[val]
+        self.__castling_rights = val
+
+    @property
+    def ep_square(self) -> int | None:
+        """
+        The square that a pawn skipped over with a double move on the last move, None if the last move wasn't one
+
+        :return: int from 0-63 or None as described
+        """
+        return self.__ep_square
+
+    @ep_square.setter
+    def ep_square(self, val: int | None) -> None:
+        self.__ep_square = val
+        self.__update_ep_key()
+
+    def __update_ep_key(self) -> None:
+        """
+        Swaps the en passant part of the Zobrist key for the key of the current en passant square and side to move
+
+        :return: None
+        """
+        side = self.__side_to_move
+        self.__zobrist_key ^= self.__ep_key
+        self.__ep_key = Zobrist.ep_key(self.__ep_square, side, self.__piece_bitboards[side * 6 + PAWN])
+        self.__zobrist_key ^= self.__ep_key
+
+    @property
+    def halfmove_clock(self) -> int:
+        """
+        The number of moves since the last capture or pawn move
+
+        :return: int as described
+        """
+        return self.__halfmove_clock
+
+    @halfmove_clock.setter
+    def halfmove_clock(self, val: int) -> None:
+        self.__halfmove_clock = val
+
+    @property
+    def fullmove_number(self) -> int:
+        """
+        The number of the current full move, starts at 1 and goes up after each black move
+
+        :return: int as described
+        """
+        return self.__fullmove_number
+
+    @fullmove_number.setter
+    def fullmove_number(self, val: int) -> None:
+        self.__fullmove_number = val
+
+    def make_move(self, move: tuple[int, int, int]) -> None:
+        """
+        Plays a compact move on the bitboards, pushing an undo record so it can be taken back with unmake_move(), and
+        the key of the position before the move onto the key history, see Board
+
+        The undo record holds the move (and so the moved-from square), the piece code captured, and the castling
+        rights, en-passant square, halfmove clock, Zobrist key and scores from before the move.
+
+        The move is not checked to be legal, see move_is_legal()
+
+        :param move: tuple of (source square, dest square, flag), see the flags in codes
+        :return: None
+        """
+        source, dest, flag = move
+        mailbox = self.__mailbox
+        piece_bitboards = self.__piece_bitboards
+        colour_bitboards = self.__colour_bitboards
+        code = mailbox[source]
+        side = code // 6
+        capture_square = dest
+        if flag == EN_PASSANT:
+            capture_square = dest - 8 if side == WHITE else dest + 8
+        captured = mailbox[capture_square]
+        castling_rights = self.__castling_rights
+        key = self.__zobrist_key
+        self.__undo_stack.append((move, captured, castling_rights, self.__ep_square, self.__halfmove_clock, key,
+                                  self.__ep_key, self.__middle_score, self.__end_score, self.__phase))
+        self.key_history.append(key)
+        piece_keys = Zobrist.PIECE_KEYS
+        middle_values = PieceSquareTables.MIDDLE_VALUES
+        end_values = PieceSquareTables.END_VALUES
+
+        key ^= self.__ep_key
+        if captured is not None:
+            capture_bit = 1 << capture_square
+            piece_bitboards[captured] ^= capture_bit
+            colour_bitboards[captured // 6] ^= capture_bit
+            mailbox[capture_square] = None
+            key ^= piece_keys[captured][capture_square]
+            self.__middle_score -= middle_values[captured][capture_square]
+            self.__end_score -= end_values[captured][capture_square]
+            self.__phase -= PieceSquareTables.PHASES[captured]
+        source_bit = 1 << source
+        dest_bit = 1 << dest
+        if flag >= PROMOTE_KNIGHT:
+            promoted = side * 6 + flag - 3
+            piece_bitboards[code] ^= source_bit
+            piece_bitboards[promoted] |= dest_bit
+            mailbox[dest] = promoted
+            key ^= piece_keys[code][source] ^ piece_keys[promoted][dest]
+            self.__middle_score += middle_values[promoted][dest] - middle_values[code][source]
+            self.__end_score += end_values[promoted][dest] - end_values[code][source]
+            self.__phase += PieceSquareTables.PHASES[promoted]
+        else:
+            piece_bitboards[code] ^= source_bit | dest_bit
+            mailbox[dest] = code
+            key ^= piece_keys[code][source] ^ piece_keys[code][dest]
+            self.__middle_score += middle_values[code][dest] - middle_values[code][source]
+            self.__end_score += end_values[code][dest] - end_values[code][source]
+        colour_bitboards[side] ^= source_bit | dest_bit
+        mailbox[source] = None
+        if flag == CASTLE:
+            rook_source, rook_dest = self.CASTLING_ROOK_SQUARES[dest]
+            self.__move_castling_rook(rook_source, rook_dest)
+            rook = side * 6 + ROOK
+            key ^= piece_keys[rook][rook_source] ^ piece_keys[rook][rook_dest]
+            self.__middle_score += middle_values[rook][rook_dest] - middle_values[rook][rook_source]
+            self.__end_score += end_values[rook][rook_dest] - end_values[rook][rook_source]
+        self.__occupied = colour_bitboards[WHITE] | colour_bitboards[BLACK]
+
+        self.__castling_rights = castling_rights & self.CASTLING_MASKS[source] & self.CASTLING_MASKS[dest]
+        key ^= Zobrist.CASTLING_KEYS[castling_rights] ^ Zobrist.CASTLING_KEYS[self.__castling_rights] ^ Zobrist.SIDE_KEY
+        if flag == DOUBLE_PUSH:
+            self.__ep_square = (source + dest) >> 1
+            self.__ep_key = Zobrist.ep_key(self.__ep_square, side ^ 1, piece_bitboards[(side ^ 1) * 6 + PAWN])
+            key ^= self.__ep_key
+        else:
+            self.__ep_square = None
+            self.__ep_key = 0
+        self.__zobrist_key = key
+        if captured is not None or code % 6 == PAWN:
+            self.__halfmove_clock = 0
+        else:
+            self.__halfmove_clock += 1
+        if side == BLACK:
+            self.__fullmove_number += 1
+        self.__side_to_move = side ^ 1
+
+    def unmake_move(self) -> None:
+        """
+        Takes back the last move played with make_move()
+
+        :return: None
+        """
+        move, captured, castling_rights, ep_square, halfmove_clock, key, ep_key, middle_score, end_score, phase = \
+            self.__undo_stack.pop()
+        self.key_history.pop()
+        source, dest, flag = move
+        mailbox = self.__mailbox
+        piece_bitboards = self.__piece_bitboards
+        colour_bitboards = self.__colour_bitboards
+        side = self.__side_to_move ^ 1
+        source_bit = 1 << source
+        dest_bit = 1 << dest
+        if flag >= PROMOTE_KNIGHT:
+            code = side * 6 + PAWN
+            piece_bitboards[mailbox[dest]] ^= dest_bit
+            piece_bitboards[code] |= source_bit
+        else:
+            code = mailbox[dest]
+            piece_bitboards[code] ^= source_bit | dest_bit
+        colour_bitboards[side] ^= source_bit | dest_bit
+        mailbox[source] = code
+        mailbox[dest] = None
+        if flag == CASTLE:
+            rook_source, rook_dest = self.CASTLING_ROOK_SQUARES[dest]
+            self.__move_castling_rook(rook_dest, rook_source)
+        if captured is not None:
+            capture_square = dest
+            if flag == EN_PASSANT:
+                capture_square = dest - 8 if side == WHITE else dest + 8
+            capture_bit = 1 << capture_square
+            piece_bitboards[captured] |= capture_bit
+            colour_bitboards[captured // 6] |= capture_bit
+            mailbox[capture_square] = captured
+        self.__occupied = colour_bitboards[WHITE] | colour_bitboards[BLACK]
+
+        self.__castling_rights = castling_rights
+        self.__ep_square = ep_square
+        self.__halfmove_clock = halfmove_clock
+        self.__zobrist_key = key
+        self.__ep_key = ep_key
+        self.__middle_score = middle_score
+        self.__end_score = end_score
+        self.__phase = phase
+        if side == BLACK:
+            self.__fullmove_number -= 1
+        self.__side_to_move = side
+
+    def has_insufficient_material(self) -> bool:
+        """
+        Finds out if neither side has enough material left to checkmate, see Board.has_insufficient_material()
+
+        :return: bool as described
+        """
+        piece_bitboards = self.__piece_bitboards
+        if piece_bitboards[PAWN] | piece_bitboards[ROOK] | piece_bitboards[QUEEN] | piece_bitboards[6 + PAWN] | \
+                piece_bitboards[6 + ROOK] | piece_bitboards[6 + QUEEN]:
+            return False
+        knights = piece_bitboards[KNIGHT] | piece_bitboards[6 + KNIGHT]
+        bishops = piece_bitboards[BISHOP] | piece_bitboards[6 + BISHOP]
+        minors = knights | bishops
+        if minors & (minors - 1) == 0:
+            return True
+        return not knights and (not bishops & self.LIGHT_SQUARES or not bishops & ~self.LIGHT_SQUARES)
+
+    def __move_castling_rook(self, rook_source: int, rook_dest: int) -> None:
+        """
+        Moves the rook involved in a castling on the bitboards
+
+        :param rook_source: int for the square the rook moves from
+        :param rook_dest: int for the square the rook moves to
+        :return: None
+        """
+        code = self.__mailbox[rook_source]
+        rook_bits = 1 << rook_source | 1 << rook_dest
+        self.__piece_bitboards[code] ^= rook_bits
+        self.__colour_bitboards[code // 6] ^= rook_bits
+        self.__mailbox[rook_dest] = code
+        self.__mailbox[rook_source] = None
+
+    def move_is_legal(self, move: tuple[int, int, int]) -> bool:
+        """
+        Finds out if a compact move leaves the king of the side that moved out of check
+
+        Probes with make_move() and unmake_move(), so no Move objects are created and no Piece objects are touched
+
+        :param move: tuple of (source square, dest square, flag)
+        :return: bool as described
+        """
+        side = self.__mailbox[move[0]] // 6
+        self.make_move(move)
+        legal = not self.side_in_check(side)
+        self.unmake_move()
+        return legal
+
+    def king_square(self, side: int) -> int | None:
+        """
+        Finds the square of the king of a side
+
+        :param side: int for the colour index of the side
+        :return: int from 0-63, or None if that side has no king on this board
+        """
+        king = self.__piece_bitboards[side * 6 + KING]
+        return king.bit_length() - 1 if king else None
+
+    def attackers(self, square: int, by_side: int, occupied: int | None = None) -> int:
+        """
+        Finds the pieces of a side that attack a square
+
+        :param square: int from 0-63 for the square
+        :param by_side: int for the colour index of the attacking side
+        :param occupied: int for the occupancy to use for blocking ranged pieces, defaults to the occupancy of this board.
+        Useful for finding attacks as if some pieces were moved
+        :return: int for a bitboard of the squares of the attacking pieces
+        """
+        if occupied is None:
+            occupied = self.__occupied
+        pieces = self.__piece_bitboards
+        base = by_side * 6
+        queens = pieces[base + QUEEN]
+        return (LeaperAttacks.KNIGHT_ATTACKS[square] & pieces[base + KNIGHT]) \
+            | (LeaperAttacks.PAWN_ATTACKS[by_side ^ 1][square] & pieces[base + PAWN]) \
+            | (LeaperAttacks.KING_ATTACKS[square] & pieces[base + KING]) \
+            | (SlidingAttacks.bishop_attacks(square, occupied) & (pieces[base + BISHOP] | queens)) \
+            | (SlidingAttacks.rook_attacks(square, occupied) & (pieces[base + ROOK] | queens))
+
+    def square_attacked(self, square: int, by_side: int) -> bool:
+        """
+        Finds out if a square is attacked by any piece of a side
+
+        :param square: int from 0-63 for the square
+        :param by_side: int for the colour index of the attacking side
+        :return: bool as described
+        """
+        pieces = self.__piece_bitboards
+        base = by_side * 6
+        if LeaperAttacks.KNIGHT_ATTACKS[square] & pieces[base + KNIGHT]:
+            return True
+        if LeaperAttacks.PAWN_ATTACKS[by_side ^ 1][square] & pieces[base + PAWN]:
+            return True
+        if LeaperAttacks.KING_ATTACKS[square] & pieces[base + KING]:
+            return True
+        queens = pieces[base + QUEEN]
+        if SlidingAttacks.bishop_attacks(square, self.__occupied) & (pieces[base + BISHOP] | queens):
+            return True
+        return bool(SlidingAttacks.rook_attacks(square, self.__occupied) & (pieces[base + ROOK] | queens))
+
+    def side_in_check(self, side: int) -> bool:
+        """
+        Finds out if the king of a side is attacked
+
+        :param side: int for the colour index of the side
+        :return: bool as described, False if that side has no king
+        """
+        king = self.king_square(side)
+        return king is not None and self.square_attacked(king, side ^ 1)
+
+    def is_in_check(self, colour: str) -> bool:
+        """
+        Finds out if the king of a colour is in check
+
+        Asks only if the square of the king is attacked, see square_attacked(), which is much cheaper for a single
+        question than building the AttackMap of the position
+
+        :param colour: str for the colour of the king
+        :return: bool as described
+        """
+        return self.side_in_check(CodeHelper.colour_index(colour))
@@ -0,0 +1,54 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+from src.game_logic.codes import CodeHelper
+from src.game_logic.mid_level.support.position import Position
+
+if TYPE_CHECKING:
+    from src.game_logic.pieces.piece import Piece
+    from src.game_logic.helpers import CoordsHelper
+    from src.game_logic.mid_level.support.bitboard import BitBoard
+
+
+class BitPosition(Position):
+    """
+    Represents a Position on a chessboard that is backed by a BitBoard
+
+    Setting the piece of this position also updates the bitboards of the BitBoard that it belongs to
+    """
+
+    __slots__ = ("__board", "__square")
+
+    def __init__(self, coords: tuple[int, int], coords_helper: 'CoordsHelper', board: 'BitBoard',
+                 piece: 'Piece' = None):
+        """
+        Constructor for a BitPosition object
+
+        :param coords: tuple for the coordinates of this position on a chess board
+        :param coords_helper: CoordsHelper object to help with dealing with coordinates
+        :param board: BitBoard object that this position belongs to
+        :param piece: Piece object that this position contains, leave empty if no piece present
+        """
+        self.__board = board
+        self.__square = CodeHelper.square(coords)
+        super().__init__(coords, coords_helper, piece)
+
+    @Position.piece.setter
+    def piece(self, val: 'Piece') -> None:
+        """
+        Sets which piece currently occupies this position, and updates the bitboards for the square of this position
+
+        :param val: Piece object to be set
+        :return: None
+        """
+        Position.piece.fset(self, val)
+        self.__board.set_square(self.__square, None if val is None else CodeHelper.piece_code(val.colour, val.type))
+
+    @property
+    def square(self) -> int:
+        """
+        The square index of this position, from 0-63
+
+        :return: int as described
+        """
+        return self.__square
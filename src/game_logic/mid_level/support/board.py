@@ -1,23 +1,71 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
+
+from src.game_logic.codes import CodeHelper, WHITE, BLACK, PAWN, KNIGHT, BISHOP, KING, DOUBLE_PUSH, EN_PASSANT, \
+    CASTLE, WHITE_KING_SIDE, WHITE_QUEEN_SIDE, BLACK_KING_SIDE, BLACK_QUEEN_SIDE, ALL_CASTLING, CASTLING_LETTERS
+from src.game_logic.mid_level.support.boardsnapshot import BoardSnapshot
+from src.game_logic.mid_level.support.geometry import Geometry
+from src.game_logic.mid_level.support.leaperattacks import LeaperAttacks
+from src.game_logic.mid_level.support.zobrist import Zobrist
 
 if TYPE_CHECKING:
     from src.game_logic.mid_level.support.position import Position
+    from src.game_logic.mid_level.moves.move import Move
+    from src.game_logic.pieces import King, Piece
 
 
 class Board:
     """
     Class to represent a Board object in a game of chess
+
+    As well as the positions, a Board tracks the state of the game that can't be read off the pieces, ie the side to
+    move, castling rights, the en-passant square and the move clocks. These are kept up to date as Move objects are
+    executed and reversed, see post_move_updates()
+
+    The key of the position before each move is pushed onto a key history, so repetitions are found by comparing keys
+    rather than whole positions. Only the keys since the last capture or pawn move are searched, see repetition_count()
+
+    The key is worked out from scratch the first time it is asked for, then kept up to date as Move objects are executed
+    and reversed and the game state is set, by XORing in and out only the keys of what changed, as a BitBoard does. So
+    pieces must only be moved by Move objects once the key has been asked for
     """
 
     __board_mat : list = None
 
+    # Castling rights kept after a move from or to each square, ie moving a king or rook, or capturing a rook
+    CASTLING_MASKS = [ALL_CASTLING] * 64
+    CASTLING_MASKS[0] = ALL_CASTLING ^ WHITE_QUEEN_SIDE
+    CASTLING_MASKS[7] = ALL_CASTLING ^ WHITE_KING_SIDE
+    CASTLING_MASKS[4] = ALL_CASTLING ^ (WHITE_KING_SIDE | WHITE_QUEEN_SIDE)
+    CASTLING_MASKS[56] = ALL_CASTLING ^ BLACK_QUEEN_SIDE
+    CASTLING_MASKS[63] = ALL_CASTLING ^ BLACK_KING_SIDE
+    CASTLING_MASKS[60] = ALL_CASTLING ^ (BLACK_KING_SIDE | BLACK_QUEEN_SIDE)
+
+    # Squares that the rook moves from and to in a castling, keyed by the square the king moves to
+    CASTLING_ROOK_SQUARES = {6: (7, 5), 2: (0, 3), 62: (63, 61), 58: (56, 59)}
+
+    # Number of half moves without a capture or pawn move after which a game is drawn by the fifty-move rule
+    FIFTY_MOVE_LIMIT = 100
+
     def __init__(self, board_mat: list):
         """
         Initializer for a  Board Object
 
+        The game state starts as it is at the start of a game of chess, white to move with all castling rights
+
         :param board_mat: matrix containing Position objects representing the actual board in a chess game
         """
+        self.__side_to_move = WHITE
+        self.__castling_rights = ALL_CASTLING
+        self.__ep_square = None
+        self.__halfmove_clock = 0
+        self.__fullmove_number = 1
+        self.__state_stack = []
+        self.__key_history = []
+        self.__zobrist_key = None
+        self.__ep_key = 0
+        self.__move_codes = []
+        self.__piece_factory = None
         self.__set_board_mat(board_mat)
 
     def get_position(self, coords: tuple) -> Position:
@@ -39,6 +87,329 @@ class Board:
         """
         self.board_mat[position.coords[0]][position.coords[1]] = position
 
+    @property
+    def backend(self) -> str:
+        """
+        The type of storage behind this Board, implemented to avoid isinstance()
+
+        :return: str, either "MATRIX" or "BITBOARD"
+        """
+        return "MATRIX"
+
+    @property
+    def piece_factory(self) -> Callable[[str, str, 'King'], 'Piece'] | None:
+        """
+        Callable that creates the pieces that pawns are promoted to on this board, set by Setup, see
+        Setup.create_piece()
+
+        :return: callable taking a colour, piece type and king, or None if one hasn't been set
+        """
+        return self.__piece_factory
+
+    @piece_factory.setter
+    def piece_factory(self, val: Callable[[str, str, 'King'], 'Piece'] | None) -> None:
+        self.__piece_factory = val
+
+    @property
+    def side_to_move(self) -> int:
+        """
+        The colour index of the side to move, WHITE or BLACK, see codes
+
+        :return: int as described
+        """
+        return self.__side_to_move
+
+    @side_to_move.setter
+    def side_to_move(self, val: int) -> None:
+        assert val in [WHITE, BLACK]
+        if self.__zobrist_key is not None and val != self.__side_to_move:
+            self.__zobrist_key ^= Zobrist.SIDE_KEY
+        self.__side_to_move = val
+        self.__update_ep_key()
+
+    @property
+    def castling_rights(self) -> int:
+        """
+        The castling rights that remain in this game, made up from the castling bits in codes
+
+        :return: int as described
+        """
+        return self.__castling_rights
+
+    @castling_rights.setter
+    def castling_rights(self, val: int) -> None:
+        assert 0 <= val <= ALL_CASTLING
+        if self.__zobrist_key is not None:
+            self.__zobrist_key ^= Zobrist.CASTLING_KEYS[self.__castling_rights] ^ Zobrist.CASTLING_KEYS[val]
+        self.__castling_rights = val
+
+    @property
+    def ep_square(self) -> int | None:
+        """
+        The square that a pawn skipped over with a double move on the last move, None if the last move wasn't one
+
+        :return: int from 0-63 or None as described
+        """
+        return self.__ep_square
+
+    @ep_square.setter
+    def ep_square(self, val: int | None) -> None:
+        self.__ep_square = val
+        self.__update_ep_key()
+
+    def __update_ep_key(self) -> None:
+        """
+        Swaps the en passant part of the Zobrist key for the key of the current en passant square and side to move, if
+        the key has been worked out
+
+        :return: None
+        """
+        if self.__zobrist_key is None:
+            return
+        self.__zobrist_key ^= self.__ep_key
+        self.__ep_key = self.__find_ep_key()
+        self.__zobrist_key ^= self.__ep_key
+
+    def __find_ep_key(self) -> int:
+        """
+        Finds the key for the en passant square of this board, see Zobrist.ep_key()
+
+        :return: int as described
+        """
+        side = self.__side_to_move
+        pawns = 0
+        if self.__ep_square is not None:
+            # Only the squares that a pawn could capture en passant from matter
+            for square in CodeHelper.squares(LeaperAttacks.PAWN_ATTACKS[side ^ 1][self.__ep_square]):
+                if self.__square_code(square) == side * 6 + PAWN:
+                    pawns |= 1 << square
+        return Zobrist.ep_key(self.__ep_square, side, pawns)
+
+    @property
+    def halfmove_clock(self) -> int:
+        """
+        The number of moves since the last capture or pawn move
+
+        :return: int as described
+        """
+        return self.__halfmove_clock
+
+    @halfmove_clock.setter
+    def halfmove_clock(self, val: int) -> None:
+        self.__halfmove_clock = val
+
+    @property
+    def fullmove_number(self) -> int:
+        """
+        The number of the current full move, starts at 1 and goes up after each black move
+
+        :return: int as described
+        """
+        return self.__fullmove_number
+
+    @fullmove_number.setter
+    def fullmove_number(self, val: int) -> None:
+        self.__fullmove_number = val
+
+    @property
+    def position_key(self) -> int:
+        """
+        The Zobrist key of the position on this board, see Zobrist
+
+        Worked out from a snapshot of the board the first time it is asked for, and kept up to date from then on, see
+        Board
+
+        :return: int as described
+        """
+        if self.__zobrist_key is None:
+            self.__zobrist_key = Zobrist.snapshot_key(self.snapshot())
+            self.__ep_key = self.__find_ep_key()
+        return self.__zobrist_key
+
+    @property
+    def key_history(self) -> list[int]:
+        """
+        The keys of the positions on this board before each of the moves played on it, oldest first
+
+        :return: list of ints as described
+        """
+        return self.__key_history
+
+    def pre_move_updates(self, move: 'Move') -> None:
+        """
+        Records the position on this board just before a Move object is executed
+
+        :param move: Move object that is about to be executed
+        :return: None
+        """
+        self.__key_history.append(self.position_key)
+        if self.__zobrist_key is not None:
+            self.__move_codes = [(square, self.__square_code(square)) for square in self.__move_squares(move)]
+
+    def post_move_updates(self, move: 'Move') -> None:
+        """
+        Updates the game state once a Move object has been executed on this board
+
+        :param move: Move object that was just executed
+        :return: None
+        """
+        source, dest, flag = move.compact()
+        self.__state_stack.append((self.castling_rights, self.ep_square, self.halfmove_clock, self.__ep_key))
+        if self.__zobrist_key is not None:
+            for square, code in self.__move_codes:
+                new_code = self.__square_code(square)
+                if code is not None:
+                    self.__zobrist_key ^= Zobrist.PIECE_KEYS[code][square]
+                if new_code is not None:
+                    self.__zobrist_key ^= Zobrist.PIECE_KEYS[new_code][square]
+        self.castling_rights = self.castling_rights & self.CASTLING_MASKS[source] & self.CASTLING_MASKS[dest]
+        self.ep_square = (source + dest) >> 1 if flag == DOUBLE_PUSH else None
+        if move.type() == "STANDARD" and (move.capture is not None or move.piece.type == "PAWN"):
+            self.halfmove_clock = 0
+        else:
+            self.halfmove_clock += 1
+        if self.side_to_move == BLACK:
+            self.fullmove_number += 1
+        self.side_to_move ^= 1
+
+    def post_reverse_updates(self, move: 'Move') -> None:
+        """
+        Restores the game state once a Move object has been reversed on this board
+
+        :param move: Move object that was just reversed
+        :return: None
+        """
+        castling_rights, ep_square, self.halfmove_clock, ep_key = self.__state_stack.pop()
+        key = self.__key_history.pop()
+        self.castling_rights = castling_rights
+        self.ep_square = ep_square
+        self.side_to_move ^= 1
+        if self.side_to_move == BLACK:
+            self.fullmove_number -= 1
+        if self.__zobrist_key is not None:
+            self.__zobrist_key = key
+            self.__ep_key = ep_key
+
+    def __move_squares(self, move: 'Move') -> list[int]:
+        """
+        Finds the squares whose pieces a Move object changes, ie its source and dest squares, the square of a pawn
+        captured en passant and the squares of the rook in a castling
+
+        :param move: Move object that is about to be executed
+        :return: list of squares from 0-63 as described
+        """
+        source, dest, flag = move.compact()
+        if flag == EN_PASSANT:
+            return [source, dest, dest - 8 if self.side_to_move == WHITE else dest + 8]
+        if flag == CASTLE:
+            return [source, dest, *self.CASTLING_ROOK_SQUARES[dest]]
+        return [source, dest]
+
+    def __square_code(self, square: int) -> int | None:
+        """
+        Finds the code of the piece on a square
+
+        :param square: int from 0-63 for the square
+        :return: int for the piece code, or None if the square is empty
+        """
+        piece = self.get_position(Geometry.COORDS[square]).piece
+        return None if piece is None else CodeHelper.piece_code(piece.colour, piece.type)
+
+    def repetition_count(self) -> int:
+        """
+        Finds the number of times that the position on this board has come up in the game, counting this time
+
+        Only positions with the same side to move since the last capture or pawn move can be the same, so every second
+        key is checked back as far as the halfmove clock goes, rather than the whole key history
+
+        :return: int as described
+        """
+        key = self.position_key
+        history = self.__key_history
+        oldest = max(len(history) - self.halfmove_clock, 0)
+        count = 1
+        for index in range(len(history) - 2, oldest - 1, -2):
+            if history[index] == key:
+                count += 1
+        return count
+
+    def is_repetition(self, times: int = 3) -> bool:
+        """
+        Finds out if the position on this board has come up at least a number of times in the game
+
+        :param times: int for the number of times, default 3 for a threefold repetition
+        :return: bool as described
+        """
+        return self.repetition_count() >= times
+
+    def is_fifty_move_draw(self) -> bool:
+        """
+        Finds out if fifty moves by each side have been played without a capture or pawn move
+
+        :return: bool as described
+        """
+        return self.halfmove_clock >= self.FIFTY_MOVE_LIMIT
+
+    def has_insufficient_material(self) -> bool:
+        """
+        Finds out if neither side has enough material left to checkmate
+
+        This is the case when there are no pawns, rooks or queens, and either at most one knight or bishop is left, or
+        only bishops that are all on squares of the same colour
+
+        :return: bool as described
+        """
+        minors = []
+        for square, code in enumerate(self.snapshot().mailbox):
+            if code is None:
+                continue
+            piece_type = code % 6
+            if piece_type == KNIGHT or piece_type == BISHOP:
+                minors.append((piece_type, square))
+            elif piece_type != KING:
+                return False
+        if len(minors) <= 1:
+            return True
+        return all(piece_type == BISHOP for piece_type, square in minors) and \
+            len(set(((square >> 3) + (square & 7)) & 1 for piece_type, square in minors)) == 1
+
+    def to_fen(self) -> str:
+        """
+        Describes the position on this board in Forsyth-Edwards Notation, see Setup.from_fen() for the reverse
+
+        :return: str for the FEN string as described
+        """
+        mailbox = self.snapshot().mailbox
+        fen_rows = []
+        for row in range(7, -1, -1):
+            fen_row, empty = "", 0
+            for code in mailbox[row * 8:row * 8 + 8]:
+                if code is None:
+                    empty += 1
+                    continue
+                if empty:
+                    fen_row += str(empty)
+                    empty = 0
+                fen_row += CodeHelper.piece_letter(CodeHelper.code_colour(code), CodeHelper.code_type(code))
+            fen_rows.append(fen_row + (str(empty) if empty else ""))
+        castling = "".join(letter for letter, bit in CASTLING_LETTERS.items() if self.castling_rights & bit)
+        ep_square = "-" if self.ep_square is None else CodeHelper.square_name(self.ep_square)
+        return " ".join(["/".join(fen_rows), "w" if self.side_to_move == WHITE else "b", castling or "-", ep_square,
+                         str(self.halfmove_clock), str(self.fullmove_number)])
+
+    def snapshot(self) -> BoardSnapshot:
+        """
+        Takes an immutable copy of the position on this board, see BoardSnapshot
+
+        :return: BoardSnapshot object as described
+        """
+        mailbox = []
+        for square in range(64):
+            piece = self.get_position(CodeHelper.coords(square)).piece
+            mailbox.append(None if piece is None else CodeHelper.piece_code(piece.colour, piece.type))
+        return BoardSnapshot(tuple(mailbox), self.side_to_move, self.castling_rights, self.ep_square,
+                             self.halfmove_clock, self.fullmove_number)
+
     @property
     def board_mat(self):
         return self.__board_mat
@@ -54,6 +425,8 @@ class Board:
         :param coords: coordinate tuple pair
         :return: bool if inputted coords are valid or not
         """
+        if type(coords) is tuple and coords in Geometry.SQUARES:
+            return True  # Coords on the board are found with a single lookup, only the rest need checking
         return Board.__coords_are_coords(coords) and Board.coords_in_board(coords)
 
     @staticmethod
@@ -64,6 +437,8 @@ class Board:
         :param coords: tuple of length 2 with integer values to be checked
         :return: bool if the inputted coords are in the board or not
         """
+        if type(coords) is tuple and coords in Geometry.SQUARES:
+            return True
         assert Board.__coords_are_coords(coords), "These coords are not a 2d tuple integer pair!"
         return 0 <= coords[0] <= 7 and 0 <= coords[1] <= 7
 
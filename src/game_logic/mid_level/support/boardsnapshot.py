@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+
+class BoardSnapshot:
+    """
+    An immutable copy of the position on a Board, made up of the piece code on each square and the game state
+
+    Snapshots hold no Position, Piece or MoveFinder objects, so they can be shared between any number of boards, kept
+    around cheaply and pickled to send to other processes. See Board.snapshot() for taking one and
+    BitBoard.from_snapshot() for making a new board from one
+    """
+
+    __slots__ = ("__mailbox", "__side_to_move", "__castling_rights", "__ep_square", "__halfmove_clock",
+                 "__fullmove_number")
+
+    def __init__(self, mailbox: tuple[int | None, ...], side_to_move: int, castling_rights: int,
+                 ep_square: int | None, halfmove_clock: int, fullmove_number: int):
+        """
+        Constructor for a BoardSnapshot
+
+        :param mailbox: tuple of the piece code on each square from 0-63, or None for empty squares
+        :param side_to_move: int for the colour index of the side to move
+        :param castling_rights: int for the castling rights, as bits like WHITE_KING_SIDE
+        :param ep_square: int for the en-passant square, or None
+        :param halfmove_clock: int for the number of half moves since the last capture or pawn move
+        :param fullmove_number: int for the number of the current full move
+        """
+        assert len(mailbox) == 64, "A snapshot must have a piece code or None for every square"
+        self.__mailbox = tuple(mailbox)
+        self.__side_to_move = side_to_move
+        self.__castling_rights = castling_rights
+        self.__ep_square = ep_square
+        self.__halfmove_clock = halfmove_clock
+        self.__fullmove_number = fullmove_number
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BoardSnapshot):
+            return NotImplemented
+        return self.__state() == other.__state()
+
+    def __hash__(self) -> int:
+        return hash(self.__state())
+
+    def __state(self) -> tuple:
+        """
+        All of the fields of this snapshot, for comparing and hashing
+
+        :return: tuple as described
+        """
+        return (self.__mailbox, self.__side_to_move, self.__castling_rights, self.__ep_square, self.__halfmove_clock,
+                self.__fullmove_number)
+
+    @property
+    def mailbox(self) -> tuple[int | None, ...]:
+        """
+        The piece code on each square of this snapshot
+
+        :return: tuple of 64 piece codes, None for empty squares
+        """
+        return self.__mailbox
+
+    @property
+    def side_to_move(self) -> int:
+        return self.__side_to_move
+
+    @property
+    def castling_rights(self) -> int:
+        return self.__castling_rights
+
+    @property
+    def ep_square(self) -> int | None:
+        return self.__ep_square
+
+    @property
+    def halfmove_clock(self) -> int:
+        return self.__halfmove_clock
+
+    @property
+    def fullmove_number(self) -> int:
+        return self.__fullmove_number
@@ -7,7 +7,7 @@ if TYPE_CHECKING:
     from src.game_logic.helpers import BearingHelper
     from src.game_logic.helpers import TraverseHelper
 
-from src.game_logic.mid_level.move_finders.knightmovefinder import KnightMoveFinder
+from src.game_logic.mid_level.support.geometry import Geometry
 
 #TODO intergrate this with the rest of the project!
 
@@ -23,55 +23,100 @@ class Check:
         self.bearing_helper = bearing_helper
         self.traverse_helper = traverse_helper
 
-    def king_in_check(self):
-        pass
+    def king_in_check(self) -> bool:
+        """
+        Determines if the king of this Check is in check
+
+        On a BitBoard this asks the board if the square of the king is attacked, otherwise the board is traversed from
+        the king
+
+        :return: bool if the king is in check or not
+        """
+        if self.board.backend == "BITBOARD":
+            return self.board.is_in_check(self.king.colour)
+        return self.coords_attacked(self.king.coords)
+
+    def coords_attacked(self, coords: tuple[int, int]) -> bool:
+        """
+        Determines if a pair of coordinates is attacked by any enemy piece of the king of this Check, by traversing the
+        board from them
+
+        Used for the squares that a king castles through as well as for the king itself
 
-    def in_check_all_directions(self):
+        :param coords: tuple for the coordinates
+        :return: bool as described
+        """
+        return self.in_knight_check(coords) or self.in_check_all_directions(coords)
+
+    def in_check_all_directions(self, coords: tuple[int, int] | None = None):
         """
         Determines if a king is in check considering all the directions that legally exist on a chessboard
 
         For example, North, East, South-West etc
 
+        :param coords: tuple for the coordinates to check from, leave as None for the coordinates of the king
         :return: bool if a King is in Check or not
         """
         all_bearings = self.bearing_helper.all_bearings()
         for bearing in all_bearings:
-            if self.in_check_traverse(bearing):
+            if self.in_check_traverse(bearing, coords):
                 return True
         return False
 
-    def in_check_traverse(self, bearing: str) -> bool:
+    def in_check_traverse(self, bearing: str, coords: tuple[int, int] | None = None) -> bool:
         """
         Finds out if this king is in check for a given bearing across the chessboard.
 
-        Does a DFS on coordinates from the position of this king, and finds if any pieces it encounters can attack this King
+        Traverses the coordinates from the position of this king, and finds if the first piece it encounters is an
+        enemy piece that can attack this King along the bearing
 
         :param bearing: str for traveling in a specified bearing across the chessboard
+        :param coords: tuple for the coordinates to check from, leave as None for the coordinates of the king
         :return: bool if this king is in check via the bearing of the inputted traverse
         """
-        traverse_coords = self.traverse_helper.next_coords(self.king.coords, bearing)
-        while self.board.coords_are_valid(traverse_coords):
-            pos = self.board.get_position(traverse_coords)
-            if pos.is_hostile(self.king.colour):
-                if pos.piece.can_move_to_coords(self.king.coords, self.board, True):
-                    return True
-                break  # Blocks any enemy pieces from attacking this king in this bearing
-            elif pos.is_friendly(self.king.colour):
-                # Friendly piece in this position, blocks any attacks from enemy on this bearing
-                return False
-            traverse_coords = self.traverse_helper.next_coords(traverse_coords, bearing)
+        coords = self.king.coords if coords is None else coords
+        for distance, traverse_coords in enumerate(Geometry.RAY_COORDS[bearing][coords], start=1):
+            piece = self.board.get_position(traverse_coords).piece
+            if piece is None:
+                continue
+            if piece.colour == self.king.colour:
+                return False  # Friendly piece in this position, blocks any attacks from enemy on this bearing
+            return self.__attacks_along(piece.type, piece.colour, bearing, distance)
         return False
 
-    def in_knight_check(self) -> bool:
+    @staticmethod
+    def __attacks_along(piece_type: str, colour: str, bearing: str, distance: int) -> bool:
+        """
+        Finds out if an enemy piece attacks back along a bearing, ie onto the coordinates that were traversed from
+
+        :param piece_type: str for the type of the piece
+        :param colour: str for the colour of the piece
+        :param bearing: str for the bearing from the attacked coordinates to the piece
+        :param distance: int for the number of steps from the attacked coordinates to the piece
+        :return: bool as described
+        """
+        diagonal = len(bearing) == 2
+        if piece_type == "QUEEN":
+            return True
+        if piece_type == "BISHOP" or piece_type == "ROOK":
+            return diagonal == (piece_type == "BISHOP")
+        if distance != 1:
+            return False
+        if piece_type == "KING":
+            return True
+        # Pawns attack diagonally forwards, so a white pawn attacks from the south and a black pawn from the north
+        return piece_type == "PAWN" and diagonal and bearing[0] == ("S" if colour == "WHITE" else "N")
+
+    def in_knight_check(self, coords: tuple[int, int] | None = None) -> bool:
         """
         Determines if a King object is in check by an enemy knight
 
+        :param coords: tuple for the coordinates to check from, leave as None for the coordinates of the king
         :return: bool if this king is in check by a knight
         """
-        knight_coords = self.king.move_finder.filter_dest_coords(KnightMoveFinder.knight_move_coords(self.king.coords),
-                                                                 attack_only=True)
-        for coord in knight_coords:
-            pos_at_coords = self.board.get_position(coord)
-            if pos_at_coords.piece.type == "KNIGHT":
+        coords = self.king.coords if coords is None else coords
+        for knight_coords in Geometry.KNIGHT_COORDS[coords]:
+            piece = self.board.get_position(knight_coords).piece
+            if piece is not None and piece.type == "KNIGHT" and piece.colour != self.king.colour:
                 return True
         return False
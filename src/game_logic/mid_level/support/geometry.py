@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from src.game_logic.mid_level.support.leaperattacks import LeaperAttacks
+
+
+class Geometry:
+    """
+    Precomputed tables for the geometry of a chessboard, so that move finders look up squares instead of stepping
+    coordinates and checking that they are on the board
+
+    Squares are ints from 0-63, see CodeHelper.square(). Tables indexed by coordinates only hold coordinates that are on
+    the board, so nothing read from them needs to be checked. Bearings are as per BearingHelper, with north towards the
+    eighth row
+    """
+
+    BEARING_STEPS = {"N": (1, 0), "S": (-1, 0), "E": (0, 1), "W": (0, -1),
+                     "NE": (1, 1), "SE": (-1, 1), "SW": (-1, -1), "NW": (1, -1)}
+
+    # The coordinates of each square, and the square of each pair of coordinates on the board
+    COORDS: list[tuple[int, int]] = []
+    SQUARES: dict[tuple[int, int], int] = {}
+
+    # The squares travelled through from each square in each bearing, in order, up to the edge of the board
+    RAYS: dict[str, list[tuple[int, ...]]] = {}
+    RAY_COORDS: dict[str, dict[tuple[int, int], tuple[tuple[int, int], ...]]] = {}
+
+    # The squares a knight or king can reach from each square
+    KNIGHT_SQUARES: list[tuple[int, ...]] = []
+    KING_SQUARES: list[tuple[int, ...]] = []
+    KNIGHT_COORDS: dict[tuple[int, int], tuple[tuple[int, int], ...]] = {}
+    KING_COORDS: dict[tuple[int, int], tuple[tuple[int, int], ...]] = {}
+
+    # Bitboards indexed by two squares, of the squares strictly between them, and of the whole row, column or diagonal
+    # through them. Both are 0 for squares that are not in line
+    BETWEEN: list[list[int]] = []
+    LINE: list[list[int]] = []
+
+    @staticmethod
+    def build_tables() -> None:
+        """
+        Builds the tables for every square
+
+        Called once when this module is imported
+
+        :return: None
+        """
+        Geometry.COORDS = [(square >> 3, square & 7) for square in range(64)]
+        Geometry.SQUARES = {coords: square for square, coords in enumerate(Geometry.COORDS)}
+        Geometry.RAYS = {bearing: [Geometry.__ray(square, step) for square in range(64)]
+                         for bearing, step in Geometry.BEARING_STEPS.items()}
+        Geometry.RAY_COORDS = {bearing: Geometry.__coords_table(rays) for bearing, rays in Geometry.RAYS.items()}
+        Geometry.KNIGHT_SQUARES = [Geometry.__offset_squares(square, LeaperAttacks.KNIGHT_OFFSETS) for square in range(64)]
+        Geometry.KING_SQUARES = [Geometry.__offset_squares(square, LeaperAttacks.KING_OFFSETS) for square in range(64)]
+        Geometry.KNIGHT_COORDS = Geometry.__coords_table(Geometry.KNIGHT_SQUARES)
+        Geometry.KING_COORDS = Geometry.__coords_table(Geometry.KING_SQUARES)
+
+        Geometry.BETWEEN = [[0] * 64 for _ in range(64)]
+        Geometry.LINE = [[0] * 64 for _ in range(64)]
+        for first in range(64):
+            for bearing, rays in Geometry.RAYS.items():
+                opposite = Geometry.__opposite(bearing)
+                line = 1 << first
+                for square in rays[first] + Geometry.RAYS[opposite][first]:
+                    line |= 1 << square
+                between = 0
+                for second in rays[first]:
+                    Geometry.BETWEEN[first][second] = between
+                    Geometry.LINE[first][second] = line
+                    between |= 1 << second
+
+    @staticmethod
+    def __ray(square: int, step: tuple[int, int]) -> tuple[int, ...]:
+        """
+        Finds the squares travelled through from a square by repeating a step, up to the edge of the board
+
+        :param square: int from 0-63 for the square to start from, not included
+        :param step: tuple for the (row, col) step
+        :return: tuple of squares as described, in order
+        """
+        ray = []
+        row, col = (square >> 3) + step[0], (square & 7) + step[1]
+        while 0 <= row <= 7 and 0 <= col <= 7:
+            ray.append(row * 8 + col)
+            row, col = row + step[0], col + step[1]
+        return tuple(ray)
+
+    @staticmethod
+    def __offset_squares(square: int, offsets: list[tuple[int, int]]) -> tuple[int, ...]:
+        """
+        Finds the squares reached from a square by each of a list of offsets, leaving out any that are off the board
+
+        :param square: int from 0-63 for a square
+        :param offsets: list of (row, col) offsets
+        :return: tuple of squares as described, in the order of the offsets
+        """
+        squares = []
+        for row_incr, col_incr in offsets:
+            row, col = (square >> 3) + row_incr, (square & 7) + col_incr
+            if 0 <= row <= 7 and 0 <= col <= 7:
+                squares.append(row * 8 + col)
+        return tuple(squares)
+
+    @staticmethod
+    def __coords_table(square_table: list[tuple[int, ...]]) -> dict[tuple[int, int], tuple[tuple[int, int], ...]]:
+        """
+        Converts a table of squares for each square into a table of coordinates for each pair of coordinates
+
+        :param square_table: list of tuples of squares, indexed by square
+        :return: dict mapping coordinates to tuples of coordinates
+        """
+        return {Geometry.COORDS[square]: tuple(Geometry.COORDS[other] for other in squares)
+                for square, squares in enumerate(square_table)}
+
+    @staticmethod
+    def __opposite(bearing: str) -> str:
+        """
+        Finds the opposite of a bearing, e.g. 'SW' for 'NE'
+
+        :param bearing: str for the bearing
+        :return: str as described
+        """
+        row_step, col_step = Geometry.BEARING_STEPS[bearing]
+        return next(other for other, step in Geometry.BEARING_STEPS.items() if step == (-row_step, -col_step))
+
+
+Geometry.build_tables()
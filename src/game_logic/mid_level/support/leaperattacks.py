@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+
+class LeaperAttacks:
+    """
+    Precomputed attack tables for the pieces whose moves are not blocked by other pieces, knights, kings and pawns
+
+    Each table is indexed by square, see CodeHelper.square(), and holds a bitboard of the attacked squares. Pawn tables
+    are indexed by colour first, since pawns only attack forwards
+    """
+
+    KNIGHT_OFFSETS = [(-2, 1), (-1, 2), (-2, -1), (-1, -2), (1, -2), (2, -1), (2, 1), (1, 2)]
+    KING_OFFSETS = [(1, 1), (1, -1), (1, 0), (-1, 1), (-1, -1), (-1, 0), (0, 1), (0, -1)]
+    PAWN_OFFSETS = [[(1, -1), (1, 1)], [(-1, -1), (-1, 1)]]
+
+    KNIGHT_ATTACKS: list[int] = []
+    KING_ATTACKS: list[int] = []
+    PAWN_ATTACKS: list[list[int]] = []
+
+    @staticmethod
+    def build_tables() -> None:
+        """
+        Builds the attack tables for every square
+
+        Called once when this module is imported
+
+        :return: None
+        """
+        LeaperAttacks.KNIGHT_ATTACKS = [LeaperAttacks.__offset_attacks(square, LeaperAttacks.KNIGHT_OFFSETS)
+                                        for square in range(64)]
+        LeaperAttacks.KING_ATTACKS = [LeaperAttacks.__offset_attacks(square, LeaperAttacks.KING_OFFSETS)
+                                      for square in range(64)]
+        LeaperAttacks.PAWN_ATTACKS = [[LeaperAttacks.__offset_attacks(square, offsets) for square in range(64)]
+                                      for offsets in LeaperAttacks.PAWN_OFFSETS]
+
+    @staticmethod
+    def __offset_attacks(square: int, offsets: list[tuple[int, int]]) -> int:
+        """
+        Finds the squares reached from a square by each of a list of offsets, leaving out any that are off the board
+
+        :param square: int from 0-63 for a square
+        :param offsets: list of (row, col) offsets
+        :return: int for a bitboard as described
+        """
+        attacks = 0
+        for row_incr, col_incr in offsets:
+            row, col = (square >> 3) + row_incr, (square & 7) + col_incr
+            if 0 <= row <= 7 and 0 <= col <= 7:
+                attacks |= 1 << (row * 8 + col)
+        return attacks
+
+
+LeaperAttacks.build_tables()
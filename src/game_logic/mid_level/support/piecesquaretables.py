@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+from src.game_logic.codes import PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING
+
+
+class PieceSquareTables:
+    """
+    Material and piece-square values for scoring chess positions
+
+    Each piece code has a value on each square for the middle game and for the end game, made up of the material value
+    of the piece plus a bonus or penalty for the square it stands on. Black values are negative, so summing the values
+    of every piece on the board gives a score from white's point of view. A BitBoard keeps these sums up to date as
+    pieces move, see Evaluator for how they are blended into a single score.
+
+    The tables below are written from white's point of view, with the eighth row first, so they read like a board
+    """
+
+    PIECE_VALUES = {PAWN: 100, KNIGHT: 320, BISHOP: 330, ROOK: 500, QUEEN: 900, KING: 0}
+
+    # How much each piece type counts towards the game phase, which is MAX_PHASE with all pieces on the board
+    PHASE_WEIGHTS = {PAWN: 0, KNIGHT: 1, BISHOP: 1, ROOK: 2, QUEEN: 4, KING: 0}
+    MAX_PHASE = 24
+
+    PAWN_TABLE = [
+        0, 0, 0, 0, 0, 0, 0, 0,
+        50, 50, 50, 50, 50, 50, 50, 50,
+        10, 10, 20, 30, 30, 20, 10, 10,
+        5, 5, 10, 25, 25, 10, 5, 5,
+        0, 0, 0, 20, 20, 0, 0, 0,
+        5, -5, -10, 0, 0, -10, -5, 5,
+        5, 10, 10, -20, -20, 10, 10, 5,
+        0, 0, 0, 0, 0, 0, 0, 0,
+    ]
+    PAWN_END_TABLE = [
+        0, 0, 0, 0, 0, 0, 0, 0,
+        80, 80, 80, 80, 80, 80, 80, 80,
+        50, 50, 50, 50, 50, 50, 50, 50,
+        30, 30, 30, 30, 30, 30, 30, 30,
+        20, 20, 20, 20, 20, 20, 20, 20,
+        10, 10, 10, 10, 10, 10, 10, 10,
+        0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0,
+    ]
+    KNIGHT_TABLE = [
+        -50, -40, -30, -30, -30, -30, -40, -50,
+        -40, -20, 0, 0, 0, 0, -20, -40,
+        -30, 0, 10, 15, 15, 10, 0, -30,
+        -30, 5, 15, 20, 20, 15, 5, -30,
+        -30, 0, 15, 20, 20, 15, 0, -30,
+        -30, 5, 10, 15, 15, 10, 5, -30,
+        -40, -20, 0, 5, 5, 0, -20, -40,
+        -50, -40, -30, -30, -30, -30, -40, -50,
+    ]
+    BISHOP_TABLE = [
+        -20, -10, -10, -10, -10, -10, -10, -20,
+        -10, 0, 0, 0, 0, 0, 0, -10,
+        -10, 0, 5, 10, 10, 5, 0, -10,
+        -10, 5, 5, 10, 10, 5, 5, -10,
+        -10, 0, 10, 10, 10, 10, 0, -10,
+        -10, 10, 10, 10, 10, 10, 10, -10,
+        -10, 5, 0, 0, 0, 0, 5, -10,
+        -20, -10, -10, -10, -10, -10, -10, -20,
+    ]
+    ROOK_TABLE = [
+        0, 0, 0, 0, 0, 0, 0, 0,
+        5, 10, 10, 10, 10, 10, 10, 5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        0, 0, 0, 5, 5, 0, 0, 0,
+    ]
+    QUEEN_TABLE = [
+        -20, -10, -10, -5, -5, -10, -10, -20,
+        -10, 0, 0, 0, 0, 0, 0, -10,
+        -10, 0, 5, 5, 5, 5, 0, -10,
+        -5, 0, 5, 5, 5, 5, 0, -5,
+        0, 0, 5, 5, 5, 5, 0, -5,
+        -10, 5, 5, 5, 5, 5, 0, -10,
+        -10, 0, 5, 0, 0, 0, 0, -10,
+        -20, -10, -10, -5, -5, -10, -10, -20,
+    ]
+    KING_TABLE = [
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -20, -30, -30, -40, -40, -30, -30, -20,
+        -10, -20, -20, -20, -20, -20, -20, -10,
+        20, 20, 0, 0, 0, 0, 20, 20,
+        20, 30, 10, 0, 0, 10, 30, 20,
+    ]
+    KING_END_TABLE = [
+        -50, -40, -30, -20, -20, -30, -40, -50,
+        -30, -20, -10, 0, 0, -10, -20, -30,
+        -30, -10, 20, 30, 30, 20, -10, -30,
+        -30, -10, 30, 40, 40, 30, -10, -30,
+        -30, -10, 30, 40, 40, 30, -10, -30,
+        -30, -10, 20, 30, 30, 20, -10, -30,
+        -30, -30, 0, 0, 0, 0, -30, -30,
+        -50, -30, -30, -30, -30, -30, -30, -50,
+    ]
+
+    MIDDLE_TABLES = {PAWN: PAWN_TABLE, KNIGHT: KNIGHT_TABLE, BISHOP: BISHOP_TABLE, ROOK: ROOK_TABLE,
+                     QUEEN: QUEEN_TABLE, KING: KING_TABLE}
+    END_TABLES = {PAWN: PAWN_END_TABLE, KNIGHT: KNIGHT_TABLE, BISHOP: BISHOP_TABLE, ROOK: ROOK_TABLE,
+                  QUEEN: QUEEN_TABLE, KING: KING_END_TABLE}
+
+    # Values indexed by piece code and then square, see build_tables()
+    MIDDLE_VALUES: list[list[int]] = []
+    END_VALUES: list[list[int]] = []
+    PHASES: list[int] = []
+
+    @staticmethod
+    def build_tables() -> None:
+        """
+        Builds the values of each piece code on each square from the tables above
+
+        Called once when this module is imported
+
+        :return: None
+        """
+        PieceSquareTables.MIDDLE_VALUES = PieceSquareTables.__code_values(PieceSquareTables.MIDDLE_TABLES)
+        PieceSquareTables.END_VALUES = PieceSquareTables.__code_values(PieceSquareTables.END_TABLES)
+        PieceSquareTables.PHASES = [PieceSquareTables.PHASE_WEIGHTS[code % 6] for code in range(12)]
+
+    @staticmethod
+    def __code_values(tables: dict[int, list[int]]) -> list[list[int]]:
+        """
+        Finds the value of each piece code on each square, from tables written like a board from white's point of view
+
+        :param tables: dict mapping piece types to their tables
+        :return: list of 12 lists of 64 values, negated for black
+        """
+        values = []
+        for colour in range(2):
+            for piece_type in range(6):
+                table = tables[piece_type]
+                material = PieceSquareTables.PIECE_VALUES[piece_type]
+                # White reads the table upside down, since square 0 is on the first row. Black reads it as written
+                rows = [7 - (square >> 3) if colour == 0 else square >> 3 for square in range(64)]
+                code_values = [material + table[rows[square] * 8 + (square & 7)] for square in range(64)]
+                values.append(code_values if colour == 0 else [-value for value in code_values])
+        return values
+
+    @staticmethod
+    def scores(mailbox: list[int | None]) -> tuple[int, int, int]:
+        """
+        Works out the middle game score, end game score and phase of a position from scratch
+
+        Slow compared to the sums kept by a BitBoard, useful for checking them
+
+        :param mailbox: list of the piece code on each square, or None for empty squares
+        :return: tuple of (middle game score, end game score, phase) as described
+        """
+        middle, end, phase = 0, 0, 0
+        for square, code in enumerate(mailbox):
+            if code is not None:
+                middle += PieceSquareTables.MIDDLE_VALUES[code][square]
+                end += PieceSquareTables.END_VALUES[code][square]
+                phase += PieceSquareTables.PHASES[code]
+        return middle, end, phase
+
+
+PieceSquareTables.build_tables()
@@ -56,12 +56,32 @@ class Player:
         :param board: Board object for this current game of chess
         :return: bool as described
         """
-        if self.is_in_check(board):
-            for piece in self.pieces:
-                if piece.num_moves(board) > 0:
-                    return False
-            return True
-        return False
+        return self.is_in_check(board) and not self.has_any_legal_move()
+
+    def is_stalemated(self, board: 'Board') -> bool:
+        """
+        Finds out if this Player has no legal moves while not in check
+
+        :param board: Board object for this current game of chess
+        :return: bool as described
+        """
+        return not self.is_in_check(board) and not self.has_any_legal_move()
+
+    def has_any_legal_move(self) -> bool:
+        """
+        Finds out if this Player has at least one legal move, stopping at the first one found
+
+        :return: bool as described
+        """
+        return any(piece.has_any_legal_move() for piece in self.pieces)
+
+    def count_legal_moves(self) -> int:
+        """
+        Counts the legal moves that this Player can do, see Piece.num_moves()
+
+        :return: int as described
+        """
+        return sum(piece.move_finder.count_legal_moves() for piece in self.pieces)
 
     @property
     def king(self):
@@ -12,7 +12,7 @@ class Position:
     Represents a Position on a chessboard
     """
 
-    __piece: 'Piece' = None
+    __slots__ = ("__coords", "__piece", "coords_helper")
 
     def __init__(self, coords: tuple[int, int], coords_helper : 'CoordsHelper', piece: 'Piece' = None):
         """
@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import random
+
+
+class SlidingAttacks:
+    """
+    Precomputed attack tables for the ranged pieces, rooks, bishops and queens, using magic bitboards
+
+    For every square, the occupancy of the squares that could block a ranged piece is hashed into an index with a
+    multiplication by a magic number and a shift. That index finds the attacked squares in a table that was built when
+    this module was imported, so finding the squares that a ranged piece attacks is a single lookup rather than a walk
+    along every bearing.
+
+    Attacked squares include the first blocking piece on each bearing, whatever its colour. Callers should mask off
+    friendly pieces themselves.
+    """
+
+    FULL_BOARD = 0xFFFFFFFFFFFFFFFF
+
+    ROOK_DIRECTIONS = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+    BISHOP_DIRECTIONS = [(1, 1), (1, -1), (-1, 1), (-1, -1)]
+
+    # Magic numbers found with SlidingAttacks.find_magic() and random.Random(2021). See regenerate_magics() to find
+    # them again
+    ROOK_MAGICS = [
+        0x7080004004108060, 0x884000A001401000, 0x0900101902200040, 0x0080100081280084,
+        0x9001004080081020, 0x2100283300140006, 0x0080050040800600, 0x0280004023000080,
+        0x0020800240008620, 0xC880401000A00044, 0x200A802005811000, 0x0C29000810010020,
+        0x0008804800440180, 0xA002000200700804, 0x4804004188061004, 0x3091001882004300,
+        0x6240608008400480, 0x2003010040002082, 0x0100820012004021, 0x0B02020020406911,
+        0x001C808024007800, 0x01A0808022000400, 0x0200040002100801, 0x0200E200010048B4,
+        0x8040004880048220, 0x0040100020080064, 0x44C2200080100080, 0x1048304200220008,
+        0x2100780080040280, 0x809A008080520400, 0x4402010400701822, 0x040100C20021008C,
+        0x2002400080800220, 0xD010084000402004, 0x01020040A2001080, 0x0000100080800800,
+        0x5080040080800800, 0x1814800200804400, 0x0008010224005008, 0x00020080D200040D,
+        0x0000208040088002, 0x5000200250004000, 0x00C0200091010045, 0x015A008940220010,
+        0x0209014800110005, 0x088A001008020004, 0x0400100211040048, 0x08081401CC8A0003,
+        0x5107005201802200, 0x2002400108208100, 0x4040A00051004100, 0x0011025000082100,
+        0x0200040008008080, 0x4100800201040080, 0x002100241A000900, 0x0004495081040200,
+        0x0800430010800021, 0x0040220080104102, 0x64081038E001C101, 0x0013009000242009,
+        0x0007001014228801, 0x0003002400A20801, 0x0190020850010084, 0x0408004084010022,
+    ]
+
+    BISHOP_MAGICS = [
+        0x00032810010200A0, 0x0484304202002080, 0x2008008502020800, 0x0848208C20000000,
+        0x0402021010004284, 0x0001040241128900, 0x040B029050382880, 0x0042002C82082000,
+        0x8040400282020200, 0x0020485204240029, 0x0000100448404200, 0x0000040420800000,
+        0x3400031040454801, 0x200002080C451000, 0x2100320821041000, 0x020002008A291000,
+        0x0012042082020808, 0x012020A202020200, 0x2208001001404488, 0x1C20800802014218,
+        0x0204800400A00010, 0x018E000020842000, 0x220041020A362000, 0x4208A00B11880400,
+        0x000A208040080204, 0x00901000D4090208, 0x000A8A0010040810, 0x040D004014040082,
+        0x80208C0040816001, 0x0012020048881100, 0x0084041000828C00, 0x20010A0000406400,
+        0x100A180406202000, 0x0008010820101680, 0x1000241000010100, 0x20409008A0040400,
+        0x80820600A40A0080, 0x401410C600041100, 0x4182008410220204, 0x0004010830C20180,
+        0x2808010C92002044, 0x102300A210112020, 0x000304002E000401, 0x0080104201800800,
+        0x0320300600800812, 0x0450013001000160, 0xB0200408820000A1, 0x8404040092000022,
+        0x2004008248201011, 0x0002248804501400, 0x0800002128180100, 0x0804010084043840,
+        0x4080001002020002, 0x680204A004090208, 0x0120881020908400, 0x0024B04408408400,
+        0x3401040102880404, 0x0900402401481803, 0x1320036900C15000, 0x0000000021420200,
+        0xA0001080E0204100, 0x400004A004015200, 0x0201208802008400, 0x0040080288820048,
+    ]
+
+    # (mask, magic, shift, table) for each square, built by build_tables()
+    __rook_entries: list[tuple] = []
+    __bishop_entries: list[tuple] = []
+
+    @staticmethod
+    def rook_attacks(square: int, occupied: int) -> int:
+        """
+        Finds the squares that a rook attacks
+
+        :param square: int from 0-63 for the square of the rook
+        :param occupied: int for the occupancy bitboard of the whole board
+        :return: int for a bitboard of the attacked squares
+        """
+        mask, magic, shift, table = SlidingAttacks.__rook_entries[square]
+        return table[((occupied & mask) * magic & 0xFFFFFFFFFFFFFFFF) >> shift]
+
+    @staticmethod
+    def bishop_attacks(square: int, occupied: int) -> int:
+        """
+        Finds the squares that a bishop attacks
+
+        :param square: int from 0-63 for the square of the bishop
+        :param occupied: int for the occupancy bitboard of the whole board
+        :return: int for a bitboard of the attacked squares
+        """
+        mask, magic, shift, table = SlidingAttacks.__bishop_entries[square]
+        return table[((occupied & mask) * magic & 0xFFFFFFFFFFFFFFFF) >> shift]
+
+    @staticmethod
+    def queen_attacks(square: int, occupied: int) -> int:
+        """
+        Finds the squares that a queen attacks
+
+        :param square: int from 0-63 for the square of the queen
+        :param occupied: int for the occupancy bitboard of the whole board
+        :return: int for a bitboard of the attacked squares
+        """
+        return SlidingAttacks.rook_attacks(square, occupied) | SlidingAttacks.bishop_attacks(square, occupied)
+
+    @staticmethod
+    def attacks(piece_type: str, square: int, occupied: int) -> int:
+        """
+        Finds the squares that a ranged piece attacks
+
+        :param piece_type: str for the type of the ranged piece, either 'ROOK', 'BISHOP' or 'QUEEN'
+        :param square: int from 0-63 for the square of the piece
+        :param occupied: int for the occupancy bitboard of the whole board
+        :return: int for a bitboard of the attacked squares
+        """
+        if piece_type == "ROOK":
+            return SlidingAttacks.rook_attacks(square, occupied)
+        elif piece_type == "BISHOP":
+            return SlidingAttacks.bishop_attacks(square, occupied)
+        elif piece_type == "QUEEN":
+            return SlidingAttacks.queen_attacks(square, occupied)
+        raise ValueError("Piece type must be one of 'ROOK', 'BISHOP' or 'QUEEN'")
+
+    @staticmethod
+    def build_tables() -> None:
+        """
+        Builds the attack tables for every square from the magic numbers
+
+        Called once when this module is imported
+
+        :return: None
+        """
+        SlidingAttacks.__rook_entries = [
+            SlidingAttacks.__build_entry(square, SlidingAttacks.ROOK_MAGICS[square], SlidingAttacks.ROOK_DIRECTIONS)
+            for square in range(64)]
+        SlidingAttacks.__bishop_entries = [
+            SlidingAttacks.__build_entry(square, SlidingAttacks.BISHOP_MAGICS[square],
+                                         SlidingAttacks.BISHOP_DIRECTIONS)
+            for square in range(64)]
+
+    @staticmethod
+    def __build_entry(square: int, magic: int, directions: list[tuple[int, int]]) -> tuple:
+        """
+        Builds the lookup entry for a single square
+
+        :param square: int from 0-63 for a square
+        :param magic: int for the magic number of this square
+        :param directions: list of (row, col) increments that the piece travels in
+        :return: tuple of (mask, magic, shift, table)
+        """
+        mask = SlidingAttacks.relevant_mask(square, directions)
+        shift = 64 - bin(mask).count("1")
+        table = [0] * (1 << (64 - shift))
+        for occupied in SlidingAttacks.__occupancy_subsets(mask):
+            table[(occupied * magic & SlidingAttacks.FULL_BOARD) >> shift] = \
+                SlidingAttacks.slow_attacks(square, occupied, directions)
+        return mask, magic, shift, table
+
+    @staticmethod
+    def relevant_mask(square: int, directions: list[tuple[int, int]]) -> int:
+        """
+        Finds the squares whose occupancy can change the attacks of a piece travelling in the given directions
+
+        The last square on each bearing is left out, since there is nothing behind it to block
+
+        :param square: int from 0-63 for a square
+        :param directions: list of (row, col) increments that the piece travels in
+        :return: int for a bitboard as described
+        """
+        mask = 0
+        for row_incr, col_incr in directions:
+            row, col = (square >> 3) + row_incr, (square & 7) + col_incr
+            while 0 <= row + row_incr <= 7 and 0 <= col + col_incr <= 7:
+                mask |= 1 << (row * 8 + col)
+                row, col = row + row_incr, col + col_incr
+        return mask
+
+    @staticmethod
+    def slow_attacks(square: int, occupied: int, directions: list[tuple[int, int]]) -> int:
+        """
+        Finds attacked squares by walking along each bearing until a piece or the edge of the board is reached
+
+        Used to fill the attack tables, and as a reference for them
+
+        :param square: int from 0-63 for a square
+        :param occupied: int for the occupancy bitboard of the whole board
+        :param directions: list of (row, col) increments that the piece travels in
+        :return: int for a bitboard of the attacked squares
+        """
+        attacks = 0
+        for row_incr, col_incr in directions:
+            row, col = (square >> 3) + row_incr, (square & 7) + col_incr
+            while 0 <= row <= 7 and 0 <= col <= 7:
+                attacks |= 1 << (row * 8 + col)
+                if occupied >> (row * 8 + col) & 1:
+                    break
+                row, col = row + row_incr, col + col_incr
+        return attacks
+
+    @staticmethod
+    def __occupancy_subsets(mask: int) -> list[int]:
+        """
+        Finds every subset of the bits of a mask, using the carry-rippler trick
+
+        :param mask: int for a bitboard
+        :return: list of ints as described, starting with 0
+        """
+        subsets = []
+        subset = 0
+        while True:
+            subsets.append(subset)
+            subset = (subset - mask) & mask
+            if subset == 0:
+                return subsets
+
+    @staticmethod
+    def find_magic(square: int, directions: list[tuple[int, int]], rng: random.Random) -> int:
+        """
+        Finds a magic number for a square by trial and error
+
+        Random sparse numbers are tried until one maps every occupancy of the relevant mask to an index without a
+        collision between occupancies that have different attacks
+
+        :param square: int from 0-63 for a square
+        :param directions: list of (row, col) increments that the piece travels in
+        :param rng: Random object to draw candidate numbers from
+        :return: int for the magic number as described
+        """
+        mask = SlidingAttacks.relevant_mask(square, directions)
+        shift = 64 - bin(mask).count("1")
+        occupancies = SlidingAttacks.__occupancy_subsets(mask)
+        attacks = [SlidingAttacks.slow_attacks(square, occupied, directions) for occupied in occupancies]
+        while True:
+            magic = rng.getrandbits(64) & rng.getrandbits(64) & rng.getrandbits(64)
+            table = [None] * (1 << (64 - shift))
+            for occupied, attacked in zip(occupancies, attacks):
+                index = (occupied * magic & SlidingAttacks.FULL_BOARD) >> shift
+                if table[index] is None:
+                    table[index] = attacked
+                elif table[index] != attacked:
+                    break
+            else:
+                return magic
+
+    @staticmethod
+    def regenerate_magics(seed: int = 2021) -> tuple[list[int], list[int]]:
+        """
+        Finds a full set of rook and bishop magic numbers. Takes a number of seconds, so the results are kept in
+        ROOK_MAGICS and BISHOP_MAGICS rather than found at import
+
+        :param seed: int to seed the random number generator with
+        :return: tuple of the rook magics and the bishop magics, each a list of 64 ints
+        """
+        rng = random.Random(seed)
+        rook_magics = [SlidingAttacks.find_magic(square, SlidingAttacks.ROOK_DIRECTIONS, rng) for square in range(64)]
+        bishop_magics = [SlidingAttacks.find_magic(square, SlidingAttacks.BISHOP_DIRECTIONS, rng)
+                         for square in range(64)]
+        return rook_magics, bishop_magics
+
+
+SlidingAttacks.build_tables()
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING
+
+from src.game_logic.codes import PAWN
+from src.game_logic.mid_level.support.leaperattacks import LeaperAttacks
+
+if TYPE_CHECKING:
+    from src.game_logic.mid_level.support.bitboard import BitBoard
+    from src.game_logic.mid_level.support.boardsnapshot import BoardSnapshot
+
+
+class Zobrist:
+    """
+    Random 64-bit keys for Zobrist hashing of chess positions
+
+    The key of a position is the XOR of the keys for each piece code on its square, the side to move key if black is
+    to move, the key for the castling rights and the key for the file of the en passant square. Since XOR is its own
+    inverse, a BitBoard keeps the key of its position up to date by XORing in and out only the keys that a move
+    changes.
+
+    Like Polyglot, the en passant file only counts if a pawn of the side to move could actually capture en passant, so
+    that positions that only differ by an unusable en passant square have the same key
+    """
+
+    SEED = 2021
+
+    PIECE_KEYS: list[list[int]] = []
+    SIDE_KEY: int = 0
+    CASTLING_KEYS: list[int] = []
+    EP_FILE_KEYS: list[int] = []
+
+    @staticmethod
+    def build_tables() -> None:
+        """
+        Builds the key tables from a fixed seed, so that keys are the same between runs
+
+        Called once when this module is imported
+
+        :return: None
+        """
+        rng = random.Random(Zobrist.SEED)
+        Zobrist.PIECE_KEYS = [[rng.getrandbits(64) for square in range(64)] for code in range(12)]
+        Zobrist.SIDE_KEY = rng.getrandbits(64)
+        Zobrist.CASTLING_KEYS = [rng.getrandbits(64) for rights in range(16)]
+        Zobrist.EP_FILE_KEYS = [rng.getrandbits(64) for file in range(8)]
+
+    @staticmethod
+    def ep_key(ep_square: int | None, side_to_move: int, pawns: int) -> int:
+        """
+        Finds the key for an en passant square
+
+        :param ep_square: int for the square that a pawn can be captured en passant on, or None if there isn't one
+        :param side_to_move: int for the colour index of the side to move
+        :param pawns: int for a bitboard of the pawns of the side to move
+        :return: int for the key of the file of the en passant square, or 0 if no pawn can capture en passant
+        """
+        if ep_square is None or not LeaperAttacks.PAWN_ATTACKS[side_to_move ^ 1][ep_square] & pawns:
+            return 0
+        return Zobrist.EP_FILE_KEYS[ep_square & 7]
+
+    @staticmethod
+    def full_key(board: 'BitBoard') -> int:
+        """
+        Works out the key of the position on a BitBoard from scratch
+
+        Slow compared to the key kept by a BitBoard, useful for checking it
+
+        :param board: BitBoard object to find the key for
+        :return: int for the key as described
+        """
+        return Zobrist.snapshot_key(board.snapshot())
+
+    @staticmethod
+    def snapshot_key(snapshot: 'BoardSnapshot') -> int:
+        """
+        Works out the key of the position in a BoardSnapshot
+
+        :param snapshot: BoardSnapshot object to find the key for
+        :return: int for the key as described
+        """
+        key = Zobrist.CASTLING_KEYS[snapshot.castling_rights]
+        side = snapshot.side_to_move
+        pawn_code = side * 6 + PAWN
+        pawns = 0
+        for square, code in enumerate(snapshot.mailbox):
+            if code is not None:
+                key ^= Zobrist.PIECE_KEYS[code][square]
+                if code == pawn_code:
+                    pawns |= 1 << square
+        if side:
+            key ^= Zobrist.SIDE_KEY
+        return key ^ Zobrist.ep_key(snapshot.ep_square, side, pawns)
+
+
+Zobrist.build_tables()
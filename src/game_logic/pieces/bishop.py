@@ -11,6 +11,8 @@ class Bishop(RangedPiece):
     Represents a bishop piece in a game of chess
     """
 
+    __slots__ = ()
+
     def __init__(self, colour, move_finder : "MoveFinder", bearing_helper: 'BearingHelper', value=0, king=None):
         """
         Constructor for a Bishop piece, all constructor arguments are passed to Piece
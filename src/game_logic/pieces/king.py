@@ -1,3 +1,5 @@
+from src.game_logic.helpers import BearingHelper, TraverseHelper
+from src.game_logic.mid_level.support.check import Check
 from src.game_logic.pieces.limitedpiece import LimitedPiece
 from typing import TYPE_CHECKING
 
@@ -9,7 +11,7 @@ class King(LimitedPiece):
     Class to represent a King piece in a game of chess
     """
 
-    __king: 'King' = None
+    __slots__ = ("__king",)
 
     def __init__(self, colour : str, move_finder : 'MoveFinder', value=0, king=None):
         """
@@ -70,6 +72,5 @@ class King(LimitedPiece):
         :param board: Board object being used for a chess game
         :return: bool for if this King is in check or not
         """
-        ## TODO fix this bellow
-        return self.in_knight_check(board) or self.in_check_all_directions(board)
+        return Check(self, board, BearingHelper(), TraverseHelper()).king_in_check()
 
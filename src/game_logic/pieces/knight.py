@@ -12,6 +12,8 @@ class Knight(LimitedPiece):
     Represents a Knight piece on a chessboard
     """
 
+    __slots__ = ()
+
     def __init__(self, colour: str, move_finder : 'MoveFinder', value: int = 0, king=None):
         """
         Constructor for a knight piece, all constructor arguments are passed to Piece
@@ -14,5 +14,7 @@ class LimitedPiece(Piece):
     other pieces, on the other hand, their range is limited by the board itself or by other pieces
     """
 
+    __slots__ = ()
+
     def __init__(self, colour: str, move_finder : 'MoveFinder', value: int=0, king : 'King' | None =None, position: 'Position' | None = None):
         super().__init__(colour, move_finder, value, king, position)
\ No newline at end of file
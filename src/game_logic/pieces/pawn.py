@@ -14,6 +14,8 @@ class Pawn(LimitedPiece):
     Represents a pawn piece in a game of chess
     """
 
+    __slots__ = ("__player",)
+
     def __init__(self, colour: str, move_finder: 'MoveFinder', value: int = 0, king: 'King' = None, position: 'Position' = None):
         """
         Constructor for a Pawn piece, all constructor arguments are passed to Piece
@@ -41,9 +43,6 @@ class Pawn(LimitedPiece):
     def str_abr(self) -> str:
         return "P"
 
-    def post_move_updates(self, move : 'Move') -> None:
-        raise NotImplemented
-
     @property
     def just_double_moved(self) -> bool:
         """
@@ -20,9 +20,10 @@ class Piece(ABC):
         #TODO
     """
 
-    __is_captured = False
-    __has_moved : bool = False
-    _completed_moves : list['Move'] =  False
+    # Pieces are made in bulk by searches and replays, so they keep their attributes in slots rather than a __dict__.
+    # Every subclass must declare __slots__ too, even if it is empty
+    __slots__ = ("__colour", "__position", "__value", "__is_captured", "__has_moved", "_completed_moves", "move_finder",
+                 "king")
 
     def __init__(self, colour: str, move_finder : 'MoveFinder', value: int = 0, king: 'King' | None = None, position: 'Position' = None):
         """
@@ -33,11 +34,14 @@ class Piece(ABC):
         :param king: king of this piece in a game of chess
         """
         super().__init__()
+        self.__is_captured = False
+        self.__has_moved = False
         self.colour = colour
         self.move_finder = move_finder
         self.value = value
         self.king = king
         self.position = position
+        self._completed_moves = []
         move_finder.piece = self
 
     def post_move_updates(self, move : 'Move') -> None:
@@ -58,7 +62,15 @@ class Piece(ABC):
         :param board: Board object for current game of chess
         :return: int
         """
-        return len(self.moves(board))
+        return self.move_finder.count_legal_moves()
+
+    def has_any_legal_move(self) -> bool:
+        """
+        Finds out if this piece has at least one legal move, without finding the rest
+
+        :return: bool as described
+        """
+        return self.move_finder.has_any_legal_move()
 
     @property
     def position(self):
@@ -257,4 +269,4 @@ class Piece(ABC):
     @has_moved.setter
     def has_moved(self, val) -> None:
         assert isinstance(val, bool)
-        self.has_moved = val
\ No newline at end of file
+        self.__has_moved = val
\ No newline at end of file
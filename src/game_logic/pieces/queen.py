@@ -15,6 +15,8 @@ class Queen(RangedPiece):
     Represents a chess piece on a chessboard
     """
 
+    __slots__ = ()
+
     def __init__(self, colour: str, move_finder : 'MoveFinder', bearing_helper : 'BearingHelper', value: int = 0, king: 'King' | None = None, position: 'Position' | None = None):
         """
         Constructor for a queen piece, all constructor arguments are passed to Piece
@@ -18,6 +18,8 @@ class RangedPiece(Piece):
     Namely, this includes rook, bishops and queen pieces
     """
 
+    __slots__ = ("bearing_helper",)
+
     def __init__(self, colour: str, move_finder: 'MoveFinder', bearing_helper : 'BearingHelper', value : int =0, king: 'King' | None = None, position: 'Position' | None = None):
         """
         Constructor for a RangedPiece object
@@ -11,6 +11,8 @@ class Rook(RangedPiece):
     Represents a rook piece in a game of chess
     """
 
+    __slots__ = ()
+
     is_castleable : bool = False
 
     def __init__(self, colour : str, move_finder : 'MoveFinder', bearing_helper : 'BearingHelper', value=0, king=None):
@@ -1,3 +1,6 @@
+from __future__ import annotations
+
+from src.game_logic.codes import CodeHelper, WHITE
 from src.game_logic.top_level.setup import Setup
 from src.game_logic.mid_level.moves.move import Move
 
@@ -11,15 +14,38 @@ class Game:
     __curr_player: 'Player' = None  # Player whose turn it currently is
 
     def __init__(self, setup: Setup):
+        self.setup = setup
         self.white_player = setup.players['white_player']
         self.black_player = setup.players['black_player']
         self.board = setup.board
+        self.moves = []
+        self.next_turn()
+
+    @property
+    def curr_player(self) -> 'Player':
+        """
+        The player whose turn it currently is
+
+        :return: Player object as described
+        """
+        return self.__curr_player
+
+    def start_game(self) -> None:
+        """
+        Starts this game, giving the turn to the side to move on the board
 
-    def start_game(self):
-        pass
+        :return: None
+        """
+        self.moves = []
+        self.next_turn()
+
+    def next_turn(self) -> None:
+        """
+        Gives the turn to the player of the side to move on the board, called after each move is executed
 
-    def next_turn(self):
-        pass
+        :return: None
+        """
+        self.__curr_player = self.white_player if self.board.side_to_move == WHITE else self.black_player
 
     def curr_player_in_check(self, board: 'Board') -> bool:
         """
@@ -61,11 +87,80 @@ class Game:
         """
         return self.__curr_player.is_checkmated(board)
 
+    def draw_reason(self) -> str | None:
+        """
+        Finds out why the game on the board is drawn, if it is
+
+        Checks are done from the cheapest to the most expensive, so this is quick enough to run after every move. A
+        stalemate isn't covered, see Player.is_stalemated()
+
+        :return: str for the reason, either "REPETITION" for a threefold repetition, "FIFTY_MOVE" for the fifty-move rule
+        or "INSUFFICIENT_MATERIAL", otherwise None if the game isn't drawn
+        """
+        if self.board.is_fifty_move_draw():
+            return "FIFTY_MOVE"
+        if self.board.has_insufficient_material():
+            return "INSUFFICIENT_MATERIAL"
+        if self.board.is_repetition():
+            return "REPETITION"
+        return None
+
+    def is_draw(self) -> bool:
+        """
+        Finds out if the game on the board is drawn by repetition, the fifty-move rule or insufficient material
+
+        :return: bool as described
+        """
+        return self.draw_reason() is not None
+
     def game_state(self) -> str:
-        pass
+        """
+        Finds the state of this game for the current player
+
+        :return: str, one of "CHECKMATE", "STALEMATE", "DRAW", "CHECK" or "IN_PROGRESS"
+        """
+        in_check = self.curr_player_in_check(self.board)
+        if not self.__curr_player.has_any_legal_move():
+            return "CHECKMATE" if in_check else "STALEMATE"
+        if self.is_draw():
+            return "DRAW"
+        return "CHECK" if in_check else "IN_PROGRESS"
 
     def moves_for_coords(self, coords: tuple[int, int]) -> list['Move']:
-        pass
+        """
+        Finds the legal moves of the piece of the current player at some coordinates
+
+        :param coords: tuple for the coordinates of a position on the board
+        :return: list of Move objects, empty if there isn't a piece of the current player there
+        """
+        piece = self.board.get_position(coords).piece
+        if piece is None or piece.colour != self.__curr_player.colour:
+            return []
+        return piece.moves()
+
+    def execute_move(self, moves: list['Move'], destination: str, promotion: str = "QUEEN") -> 'Move':
+        """
+        Executes the move to a destination out of the moves of a piece, and gives the turn to the other player
 
-    def execute_move(self, moves: list['Move'], destination: str):
-        pass
+        :param moves: list of Move objects of a piece, as found by moves_for_coords()
+        :param destination: str for the name of the square the piece moves to, e.g. 'e4'
+        :param promotion: str for the type of piece that a pawn reaching the last row is promoted to, default "QUEEN"
+        :return: Move object that was executed
+        :raises ValueError: if none of the moves go to the destination, or a pawn can't be promoted to the piece
+        """
+        dest = CodeHelper.name_square(destination)
+        found = [move for move in moves if move.compact()[1] == dest]
+        if not found:
+            raise ValueError(f"No move to '{destination}'")
+        promotions = [move for move in found if move.type() == "STANDARD" and move.promotion is not None]
+        if promotions:
+            found = [move for move in promotions if move.promotion.type == promotion]
+            if not found:
+                raise ValueError(f"Can't promote to '{promotion}'")
+        move = found[0]
+        if move.type() == "STANDARD" and move.promotion is not None:
+            self.__curr_player.pieces.append(move.promotion)
+        move.execute()
+        self.moves.append(move)
+        self.next_turn()
+        return move
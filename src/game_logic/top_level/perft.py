@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import argparse
+import time
+
+from src.game_logic.codes import CodeHelper
+from src.game_logic.top_level.setup import Setup
+
+
+class Perft:
+    """
+    Counts the leaf nodes of the move tree from a position down to a given depth, known as perft
+
+    Used to check move generation against the known node counts of reference positions, and to time it. Runs on a
+    BitBoard set up by Setup, making and unmaking the moves found by its LegalMoveGenerator.
+
+    With objects set, the tree is walked the way a game is played instead, with the Move objects of each piece, see
+    Piece.moves(), executed and reversed. This is much slower. The board is still a BitBoard, so the moves are still
+    found by its LegalMoveGenerator and only made into Move objects by MoveFinder._create_move(). So this checks the
+    Move objects and the upkeep of the board as they execute and reverse, not the rules of the matrix move finders,
+    see MoveFinder._possible_moves()
+
+    Can be run from the command line, e.g. python -m src.game_logic.top_level.perft --depth 4 --divide
+    """
+
+    # Standard reference positions, with their known node counts from depth 1 onwards
+    REFERENCE_POSITIONS = {
+        "START": (Setup.STARTING_FEN, [20, 400, 8902, 197281, 4865609]),
+        "KIWIPETE": ("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+                     [48, 2039, 97862, 4085603]),
+        # En passant captures that expose the king to a check along a row, and pinned pawns
+        "EN_PASSANT": ("8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1", [14, 191, 2812, 43238, 674624]),
+        # Castling out of, through and into check, along with promotions that capture
+        "CASTLING": ("r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1", [6, 264, 9467, 422333]),
+        "PROMOTION": ("rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8", [44, 1486, 62379, 2103487]),
+        "MIDDLE_GAME": ("r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10",
+                        [46, 2079, 89890, 3894594]),
+    }
+
+    def __init__(self, fen: str = Setup.STARTING_FEN, objects: bool = False):
+        """
+        Constructor for a Perft object
+
+        :param fen: str for the position to count from in Forsyth-Edwards Notation, default the initial position
+        :param objects: bool for if the moves should be found through the MoveFinders of the pieces and executed as
+        Move objects, rather than made as compact moves, see Perft. Default False
+        """
+        self.setup = Setup.from_fen(fen, backend="BITBOARD")
+        self.board = self.setup.board
+        self.objects = objects
+
+    def count(self, depth: int) -> int:
+        """
+        Counts the leaf nodes of the move tree from the position of this Perft
+
+        :param depth: int for the number of plies to search, must be at least 0
+        :return: int for the number of leaf nodes
+        """
+        assert depth >= 0, "Perft depth can't be negative"
+        if depth == 0:
+            return 1
+        if self.objects:
+            return self.__count_objects(depth)
+        moves = self.board.move_generator.generate(self.board.side_to_move)
+        if depth == 1:
+            return len(moves)
+        nodes = 0
+        for move in moves:
+            self.board.make_move(move)
+            nodes += self.count(depth - 1)
+            self.board.unmake_move()
+        return nodes
+
+    def __count_objects(self, depth: int) -> int:
+        """
+        Counts the leaf nodes of the move tree by executing and reversing Move objects, see Perft
+
+        :param depth: int for the number of plies to search, must be at least 1
+        :return: int for the number of leaf nodes
+        """
+        moves = self.__object_moves()
+        if depth == 1:
+            return len(moves)
+        nodes = 0
+        for move in moves:
+            move.execute(check_legal=False)
+            nodes += self.count(depth - 1)
+            move._reverse()
+        return nodes
+
+    def __object_moves(self) -> list['Move']:
+        """
+        Finds the moves of the side to move with the MoveFinders of its pieces on the board
+
+        :return: list of Move objects
+        """
+        colour = CodeHelper.code_colour(self.board.side_to_move * 6)
+        moves = []
+        for square in range(64):
+            piece = self.board.get_position(CodeHelper.coords(square)).piece
+            if piece is not None and piece.colour == colour:
+                moves += piece.moves()
+        return moves
+
+    def divide(self, depth: int) -> dict[str, int]:
+        """
+        Counts the leaf nodes under each move from the position of this Perft, useful for finding which move a wrong
+        count comes from
+
+        :param depth: int for the number of plies to search, must be at least 1
+        :return: dict mapping the long algebraic names of moves to the number of leaf nodes under them
+        """
+        assert depth >= 1, "Perft divide depth must be at least 1"
+        counts = {}
+        if self.objects:
+            for move in self.__object_moves():
+                name = CodeHelper.move_name(move.compact())
+                move.execute(check_legal=False)
+                counts[name] = self.count(depth - 1)
+                move._reverse()
+            return counts
+        for move in self.board.move_generator.generate(self.board.side_to_move):
+            self.board.make_move(move)
+            counts[CodeHelper.move_name(move)] = self.count(depth - 1)
+            self.board.unmake_move()
+        return counts
+
+    def run(self, depth: int, divide: bool = False) -> tuple[int, float]:
+        """
+        Counts the leaf nodes from the position of this Perft and prints a report of the count and the nodes searched
+        per second
+
+        :param depth: int for the number of plies to search
+        :param divide: bool for if the count under each move should be printed as well, default False
+        :return: tuple for the number of leaf nodes and the nodes per second
+        """
+        start = time.perf_counter()
+        if divide:
+            counts = self.divide(depth)
+            for name, nodes in sorted(counts.items()):
+                print(f"{name}: {nodes}")
+            nodes = sum(counts.values())
+        else:
+            nodes = self.count(depth)
+        elapsed = time.perf_counter() - start
+        nodes_per_second = nodes / elapsed if elapsed > 0 else float("inf")
+        print(f"Depth {depth}: {nodes} nodes in {elapsed:.3f}s ({nodes_per_second:,.0f} nodes/s)")
+        return nodes, nodes_per_second
+
+    @staticmethod
+    def check_reference_positions(max_nodes: int = 100000, objects: bool = False) -> list[str]:
+        """
+        Checks the counts for each of the reference positions, up to the deepest known count that is at most max_nodes
+
+        :param max_nodes: int for the largest known count to check, so that the check stays quick. Default 100000
+        :param objects: bool for if the counts should be found with Move objects, see Perft. Default False
+        :return: list of descriptions of each count that doesn't match, empty if all match
+        """
+        mismatches = []
+        for name, (fen, known_counts) in Perft.REFERENCE_POSITIONS.items():
+            perft = Perft(fen, objects)
+            for depth, known in enumerate(known_counts, start=1):
+                if known > max_nodes:
+                    break
+                nodes = perft.count(depth)
+                if nodes != known:
+                    mismatches.append(f"{name} depth {depth}: expected {known}, found {nodes}")
+        return mismatches
+
+
+def main(args: list[str] | None = None) -> None:
+    """
+    Command line entry point for perft
+
+    :param args: list of command line arguments, leave as None to use sys.argv
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description="Count the leaf nodes of the move tree from a chess position")
+    parser.add_argument("--depth", type=int, default=4, help="number of plies to search, default 4")
+    parser.add_argument("--fen", default=None, help="position to search from, default the initial position")
+    parser.add_argument("--position", choices=sorted(Perft.REFERENCE_POSITIONS), default=None,
+                        help="reference position to search from, instead of --fen")
+    parser.add_argument("--divide", action="store_true", help="print the count under each move")
+    parser.add_argument("--objects", action="store_true",
+                        help="execute and reverse the moves as Move objects, made by the move finders of the pieces")
+    parser.add_argument("--check", action="store_true",
+                        help="check the reference positions against their known counts and exit")
+    parsed = parser.parse_args(args)
+
+    if parsed.check:
+        mismatches = Perft.check_reference_positions(objects=parsed.objects)
+        for mismatch in mismatches:
+            print(mismatch)
+        print("All reference counts match" if not mismatches else f"{len(mismatches)} counts don't match")
+        raise SystemExit(1 if mismatches else 0)
+
+    fen = parsed.fen or Setup.STARTING_FEN
+    known = None
+    if parsed.position is not None:
+        fen, known_counts = Perft.REFERENCE_POSITIONS[parsed.position]
+        known = known_counts[parsed.depth - 1] if 0 < parsed.depth <= len(known_counts) else None
+    nodes, _ = Perft(fen, parsed.objects).run(parsed.depth, parsed.divide)
+    if known is not None:
+        print("Matches the known count" if nodes == known else f"Expected {known} nodes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Callable, Iterator, TextIO
+
+from src.game_logic.codes import CodeHelper
+from src.game_logic.top_level.setup import Setup
+
+if TYPE_CHECKING:
+    from src.game_logic.mid_level.moves.move import Move
+
+
+class PgnGame:
+    """
+    A game of chess read from a PGN file, made up of its headers and its move text
+
+    The move text is kept as it was read, and only split into SAN moves when san_moves() is called
+    """
+
+    RESULTS = ["1-0", "0-1", "1/2-1/2", "*"]
+    MOVE_NUMBER = re.compile(r"^\d+\.+")
+
+    def __init__(self, headers: dict[str, str], movetext: str):
+        """
+        Constructor for a PgnGame
+
+        :param headers: dict mapping the header tags of the game to their values, e.g. {"White": "Hugo"}
+        :param movetext: str for the move text of the game, including any comments, variations and the result
+        """
+        self.headers = headers
+        self.movetext = movetext
+
+    @property
+    def fen(self) -> str:
+        """
+        The position that this game starts from, from its FEN header if it has one
+
+        :return: str for the position in Forsyth-Edwards Notation
+        """
+        return self.headers.get("FEN", Setup.STARTING_FEN)
+
+    def san_moves(self) -> Iterator[str]:
+        """
+        Yields the moves of the main line of this game in Standard Algebraic Notation, e.g. 'Nf3', 'exd5' or 'O-O'
+
+        Comments, variations, numeric annotation glyphs, move numbers and the result are left out
+
+        :return: iterator of str as described
+        """
+        comment_depth, variation_depth = 0, 0
+        for token in re.findall(r"\{|\}|\(|\)|;[^\n]*|[^\s{}()]+", self.movetext):
+            if comment_depth:
+                comment_depth -= token == "}"
+            elif token == "{":
+                comment_depth = 1
+            elif token == "(":
+                variation_depth += 1
+            elif token == ")":
+                variation_depth -= 1
+            elif variation_depth or token.startswith(";") or token.startswith("$") or token in self.RESULTS:
+                continue
+            else:
+                token = self.MOVE_NUMBER.sub("", token)
+                if token:
+                    yield token
+
+
+class PgnReader:
+    """
+    Reads games from a PGN file one at a time, so that files of any size are read with bounded memory
+
+    Games can be skipped by their headers with a filter. The move text of a skipped game is read past line by line
+    without being kept or parsed
+    """
+
+    HEADER = re.compile(r'^\[\s*(\w+)\s+"((?:[^"\\]|\\.)*)"\s*\]\s*$')
+
+    def __init__(self, source: str | TextIO, header_filter: Callable[[dict[str, str]], bool] | None = None):
+        """
+        Constructor for a PgnReader
+
+        :param source: str for the path of a PGN file, or an open text file to read from
+        :param header_filter: function that takes the headers of a game and returns if the game should be read, leave as
+        None to read every game
+        """
+        self.source = source
+        self.header_filter = header_filter
+
+    def __iter__(self) -> Iterator[PgnGame]:
+        """
+        Yields the games in the PGN file that pass the header filter, in order
+
+        :return: iterator of PgnGame objects
+        """
+        if isinstance(self.source, str):
+            with open(self.source, encoding="utf-8", errors="replace") as file:
+                yield from self.__read(file)
+        else:
+            yield from self.__read(self.source)
+
+    def __read(self, file: TextIO) -> Iterator[PgnGame]:
+        """
+        Yields the games in an open PGN file that pass the header filter
+
+        :param file: open text file to read from
+        :return: iterator of PgnGame objects
+        """
+        headers, movetext, wanted, in_movetext, comment_depth = {}, [], True, False, 0
+        for line in file:
+            stripped = line.strip()
+            if not comment_depth and stripped.startswith("["):
+                if in_movetext:
+                    if wanted:
+                        yield PgnGame(headers, "".join(movetext))
+                    headers, movetext, wanted, in_movetext = {}, [], True, False
+                match = self.HEADER.match(stripped)
+                if match:
+                    headers[match.group(1)] = match.group(2).replace('\\"', '"')
+                continue
+            if not stripped and not in_movetext:
+                continue
+            if not in_movetext:
+                in_movetext = True
+                wanted = self.header_filter is None or self.header_filter(headers)
+            if wanted:
+                movetext.append(line)
+            comment_depth = max(0, comment_depth + line.count("{") - line.count("}"))
+        if in_movetext and wanted:
+            yield PgnGame(headers, "".join(movetext))
+
+
+class PgnReplayer:
+    """
+    Replays games read from PGN files, resolving their SAN moves into StandardMove and Castle objects on a live Board
+    and executing them
+    """
+
+    SAN_MOVE = re.compile(r"^([NBRQK])?([a-h])?([1-8])?x?([a-h][1-8])(?:=?([NBRQ]))?$")
+    SAN_PIECE_TYPES = {"N": "KNIGHT", "B": "BISHOP", "R": "ROOK", "Q": "QUEEN", "K": "KING"}
+
+    def __init__(self, backend: str = "BITBOARD"):
+        """
+        Constructor for a PgnReplayer
+
+        :param backend: str for the type of Board to replay games on, see Setup. Default "BITBOARD"
+        """
+        self.backend = backend
+
+    def replay(self, game: PgnGame) -> tuple[Setup, list['Move']]:
+        """
+        Replays the main line of a game from its starting position
+
+        :param game: PgnGame object to replay
+        :return: tuple of the Setup with the final position of the game, and the list of moves that were executed
+        :raises ValueError: if a move of the game is illegal, ambiguous or can't be read
+        """
+        setup = Setup.from_fen(game.fen, {"white_name": game.headers.get("White", "White"),
+                                          "black_name": game.headers.get("Black", "Black")}, self.backend)
+        moves = []
+        for san in game.san_moves():
+            move = self.resolve(setup, san)
+            move.execute(check_legal=False)
+            moves.append(move)
+        return setup, moves
+
+    def replay_all(self, reader: PgnReader) -> Iterator[tuple[PgnGame, Setup, list['Move']]]:
+        """
+        Replays each game read by a PgnReader in turn
+
+        :param reader: PgnReader object to read games from
+        :return: iterator of tuples of each game, with the Setup and moves from replaying it, see replay()
+        """
+        for game in reader:
+            setup, moves = self.replay(game)
+            yield game, setup, moves
+
+    def resolve(self, setup: Setup, san: str) -> 'Move':
+        """
+        Finds the move object for a move in Standard Algebraic Notation, for the side to move in the current position
+
+        Only legal moves are considered. A promotion has its promoted piece added to the pieces of the player, ready for
+        the move to be executed
+
+        :param setup: Setup object for the game being played
+        :param san: str for the move in SAN, e.g. 'Nbd7', 'exd6', 'e8=Q+' or 'O-O-O'
+        :return: Move object as described
+        :raises ValueError: if the move is illegal, ambiguous or can't be read
+        """
+        board = setup.board
+        player = setup.players["white_player" if board.side_to_move == 0 else "black_player"]
+        token = san.rstrip("+#!?")
+        if token.replace("0", "O") in ["O-O", "O-O-O"]:
+            dest_col = 6 if token.replace("0", "O") == "O-O" else 2
+            candidates = [move for move in player.king.moves()
+                          if move.type() == "CASTLE" and move.king_dest_coords[1] == dest_col]
+            return self.__single(candidates, san)
+
+        match = self.SAN_MOVE.match(token)
+        if match is None:
+            raise ValueError(f"Can't read SAN move '{san}'")
+        letter, source_file, source_rank, dest, promotion = match.groups()
+        piece_type = self.SAN_PIECE_TYPES.get(letter, "PAWN")
+        dest_coords = CodeHelper.coords(CodeHelper.name_square(dest))
+        candidates = []
+        for piece in player.pieces:
+            if piece.type != piece_type or piece.position is None:
+                continue
+            if source_file is not None and piece.coords[1] != "abcdefgh".index(source_file):
+                continue
+            if source_rank is not None and piece.coords[0] != int(source_rank) - 1:
+                continue
+            candidates += [move for move in piece.moves() if move.type() == "STANDARD" and move.dest.coords == dest_coords]
+        if piece_type == "PAWN" and dest_coords[0] in [0, 7]:
+            if promotion is None:
+                raise ValueError(f"SAN move '{san}' must say what the pawn is promoted to")
+            candidates = [move for move in candidates if move.promotion.type == self.SAN_PIECE_TYPES[promotion]]
+            move = self.__single(candidates, san)
+            player.pieces.append(move.promotion)
+            return move
+        if promotion is not None:
+            raise ValueError(f"SAN move '{san}' can't be a promotion")
+        return self.__single(candidates, san)
+
+    @staticmethod
+    def __single(candidates: list['Move'], san: str) -> 'Move':
+        """
+        Finds the only move that matches a SAN move
+
+        :param candidates: list of Move objects that match the SAN move
+        :param san: str for the SAN move, for error messages
+        :return: Move object as described
+        :raises ValueError: if there isn't exactly one candidate
+        """
+        if not candidates:
+            raise ValueError(f"SAN move '{san}' is not legal in this position")
+        if len(candidates) > 1:
+            raise ValueError(f"SAN move '{san}' is ambiguous in this position")
+        return candidates[0]
@@ -1,12 +1,17 @@
+from __future__ import annotations
+
 from src.game_logic.mid_level.move_finders.kingmovefinder import KingMoveFinder
 from src.game_logic.mid_level.move_finders.knightmovefinder import KnightMoveFinder
 from src.game_logic.mid_level.move_finders.pawnmovefinder import PawnMoveFinder
 from src.game_logic.mid_level.move_finders.rangedmovefinder import RangedMoveFinder
+from src.game_logic.mid_level.move_finders.legalmovegenerator import LegalMoveGenerator
 from src.game_logic.mid_level.support.position import Position
 from src.game_logic.mid_level.support.board import Board
+from src.game_logic.mid_level.support.bitboard import BitBoard
 from src.game_logic.mid_level.support.player import Player
 from src.game_logic.pieces import *
 from src.game_logic.helpers import CoordsHelper, TraverseHelper, BearingHelper
+from src.game_logic.codes import CodeHelper, WHITE, BLACK, CASTLING_LETTERS, PIECE_TYPES, PIECE_SCORES
 
 
 class Setup:
@@ -16,15 +21,30 @@ class Setup:
 
     coords_helper: 'CoordsHelper' = CoordsHelper
 
-    def __init__(self, player_names: dict):
+    STARTING_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+    DEFAULT_PLAYER_NAMES = {"white_name": "White", "black_name": "Black"}
+
+    def __init__(self, player_names: dict, backend: str = "MATRIX", fen: str | None = None):
         """
         Creates an instance of a setup class
 
         :param player_names: dict containing the two names for the players of this game of chess, should have keys
         'white_name' and 'black_name'
+        :param backend: str for the type of Board to create, either "MATRIX" for a Board or "BITBOARD" for a BitBoard.
+        Default "MATRIX"
+        :param fen: str for a position in Forsyth-Edwards Notation to set the board up with, leave as None to set up
+        the initial position of a game of chess. See from_fen()
         """
+        assert backend in ["MATRIX", "BITBOARD"], "Board backend must be either 'MATRIX' or 'BITBOARD'"
+        self.backend = backend
         self.board = self.__create_board()
-        self.players = self.__create_players(player_names, self.__fill_board())
+        self.board.piece_factory = self.create_piece
+        self.__traverse_helper = TraverseHelper()
+        self.__bearing_helper = BearingHelper()
+        pieces = self.__fill_board() if fen is None else self.__fill_from_fen(fen)
+        for piece in pieces["white_pieces"] + pieces["black_pieces"]:
+            piece.value = Setup.piece_value(piece.type)
+        self.players = self.__create_players(player_names, pieces)
 
     @staticmethod
     def __create_players(names: dict, pieces: dict) -> dict:
@@ -43,8 +63,12 @@ class Setup:
         """
         Creates a board for a game of chess
 
-        :return: Board object
+        :return: Board object, a BitBoard if this Setup uses the bitboard backend
         """
+        if self.backend == "BITBOARD":
+            board = BitBoard(self.coords_helper)
+            board.move_generator = LegalMoveGenerator(board)
+            return board
         board_mat = [[None] * 8 for i in range(8)]
         for row in range(8):
             for col in range(8):
@@ -61,6 +85,149 @@ class Setup:
         return {"white_pieces": self.__fill_colour("WHITE"),
                 "black_pieces": self.__fill_colour("BLACK")}
 
+    @staticmethod
+    def from_fen(fen: str, player_names: dict | None = None, backend: str = "MATRIX") -> 'Setup':
+        """
+        Sets up a game of chess from a position in Forsyth-Edwards Notation, without replaying any moves
+
+        The pieces, players, side to move, castling rights, en passant square and clocks all come from the FEN string.
+        The clocks may be left off, in which case they start at 0 and 1. See Board.to_fen() for the reverse
+
+        :param fen: str for the position in Forsyth-Edwards Notation
+        :param player_names: dict containing the two names for the players, should have keys 'white_name' and
+        'black_name'. Leave as None for DEFAULT_PLAYER_NAMES
+        :param backend: str for the type of Board to create, either "MATRIX" or "BITBOARD". Default "MATRIX"
+        :return: Setup object as described
+        :raises ValueError: if the FEN string isn't a valid position
+        """
+        return Setup(Setup.DEFAULT_PLAYER_NAMES if player_names is None else player_names, backend, fen)
+
+    @staticmethod
+    def __parse_fen(fen: str) -> tuple[list[str], int, int, int | None, int, int]:
+        """
+        Splits a FEN string into its fields, checking that each is valid
+
+        :param fen: str for a position in Forsyth-Edwards Notation
+        :return: tuple of (list of 8 FEN rows from the eighth row down, side to move, castling rights, en passant square
+        or None, halfmove clock, fullmove number)
+        :raises ValueError: if the FEN string isn't valid
+        """
+        fields = fen.split()
+        if len(fields) == 4:
+            fields += ["0", "1"]
+        if len(fields) != 6:
+            raise ValueError(f"FEN string must have 4 or 6 fields: '{fen}'")
+        placement, side_to_move, castling, ep_square, halfmove_clock, fullmove_number = fields
+        rows = placement.split("/")
+        if len(rows) != 8:
+            raise ValueError(f"FEN piece placement must have 8 rows: '{placement}'")
+        if side_to_move not in ["w", "b"]:
+            raise ValueError(f"FEN side to move must be 'w' or 'b': '{side_to_move}'")
+        if castling != "-" and (not castling or any(letter not in CASTLING_LETTERS for letter in castling)):
+            raise ValueError(f"Invalid FEN castling rights: '{castling}'")
+        castling_rights = 0 if castling == "-" else sum(CASTLING_LETTERS[letter] for letter in set(castling))
+        if ep_square != "-" and not (len(ep_square) == 2 and ep_square[0] in "abcdefgh"
+                                     and ep_square[1] == ("6" if side_to_move == "w" else "3")):
+            raise ValueError(f"Invalid FEN en passant square: '{ep_square}'")
+        if not (halfmove_clock.isdigit() and fullmove_number.isdigit() and int(fullmove_number) > 0):
+            raise ValueError(f"Invalid FEN clocks: '{halfmove_clock} {fullmove_number}'")
+        return rows, WHITE if side_to_move == "w" else BLACK, castling_rights, \
+            None if ep_square == "-" else CodeHelper.name_square(ep_square), int(halfmove_clock), int(fullmove_number)
+
+    def __fill_from_fen(self, fen: str) -> dict:
+        """
+        Fills a board for a game of chess with the pieces of a position in Forsyth-Edwards Notation, and sets the game
+        state of the board
+
+        Kings and rooks that have lost their castling rights, and pawns off their starting rows, are marked as having
+        moved
+
+        :param fen: str for a position in Forsyth-Edwards Notation
+        :return: dict containing the pieces that were created, has keys for each colour, "white_pieces" and "black_pieces"
+        :raises ValueError: if the FEN string isn't a valid position
+        """
+        rows, side_to_move, castling_rights, ep_square, halfmove_clock, fullmove_number = self.__parse_fen(fen)
+        kings = {colour: King(colour, king=None, move_finder=KingMoveFinder(self.board)) for colour in ["WHITE", "BLACK"]}
+        pieces = {"white_pieces": [], "black_pieces": []}
+        for i, fen_row in enumerate(rows):
+            row, col = 7 - i, 0
+            for letter in fen_row:
+                if letter.isdigit():
+                    col += int(letter)
+                    continue
+                if col > 7:
+                    raise ValueError(f"Each FEN row must have 8 squares: '{fen_row}'")
+                colour, piece_type = CodeHelper.letter_piece(letter)
+                if piece_type == "PAWN" and row in [0, 7]:
+                    raise ValueError(f"FEN string can't have pawns on the first or last row: '{fen}'")
+                piece = kings[colour] if piece_type == "KING" else self.create_piece(colour, piece_type, kings[colour])
+                if piece.position is not None:
+                    raise ValueError(f"FEN string must have exactly one king for each colour: '{fen}'")
+                piece.swap_position(self.board.get_position((row, col)))
+                piece.has_moved = self.__has_moved(piece, castling_rights)
+                pieces[colour.lower() + "_pieces"].append(piece)
+                col += 1
+            if col != 8:
+                raise ValueError(f"Each FEN row must have 8 squares: '{fen_row}'")
+        if any(king.position is None for king in kings.values()):
+            raise ValueError(f"FEN string must have exactly one king for each colour: '{fen}'")
+        self.board.side_to_move = side_to_move
+        self.board.castling_rights = castling_rights
+        self.board.ep_square = ep_square
+        self.board.halfmove_clock = halfmove_clock
+        self.board.fullmove_number = fullmove_number
+        return pieces
+
+    def create_piece(self, colour: str, piece_type: str, king: 'King') -> 'Piece':
+        """
+        Creates a chess piece object that isn't a king, with a MoveFinder for the board of this Setup
+
+        Useful for creating the pieces that pawns are promoted to, see StandardMove.promotion
+
+        :param colour: str for colour
+        :param piece_type: str for the type of the piece, one of "PAWN", "KNIGHT", "BISHOP", "ROOK" or "QUEEN"
+        :param king: King object that the piece is on the same side as
+        :return: Piece object as described
+        """
+        value = Setup.piece_value(piece_type)
+        if piece_type == "PAWN":
+            return Pawn(colour, king=king, move_finder=PawnMoveFinder(self.board), value=value)
+        if piece_type == "KNIGHT":
+            return Knight(colour, king=king, move_finder=KnightMoveFinder(self.board), value=value)
+        ranged_pieces = {"BISHOP": Bishop, "ROOK": Rook, "QUEEN": Queen}
+        assert piece_type in ranged_pieces, "Kings are created separately"
+        return ranged_pieces[piece_type](colour, king=king, move_finder=RangedMoveFinder(self.board, self.__traverse_helper),
+                                     bearing_helper=self.__bearing_helper, value=value)
+
+    @staticmethod
+    def piece_value(piece_type: str) -> int:
+        """
+        Finds the value that pieces of a type are given, what they count for in the scores of the players,
+        see PIECE_SCORES
+
+        :param piece_type: str for the type of the piece, e.g. "PAWN"
+        :return: int as described, 0 for a king
+        """
+        return PIECE_SCORES[PIECE_TYPES.index(piece_type)]
+
+    def __has_moved(self, piece: 'Piece', castling_rights: int) -> bool:
+        """
+        Works out if a piece placed from a FEN string should be marked as having moved
+
+        :param piece: Piece object that has been placed on the board
+        :param castling_rights: int for the castling rights of the position, see BitBoard
+        :return: bool as described
+        """
+        home_row, pawn_row = self.__colour_for_rows(piece.colour)
+        if piece.type == "PAWN":
+            return piece.coords[0] != pawn_row
+        if piece.type in ["KING", "ROOK"]:
+            letters = "KQ" if piece.colour == "WHITE" else "kq"
+            if piece.type == "ROOK":
+                letters = {0: letters[1], 7: letters[0]}.get(piece.coords[1], "") if piece.coords[0] == home_row else ""
+            return not any(castling_rights & CASTLING_LETTERS[letter] for letter in letters)
+        return False
+
     @staticmethod
     def __colour_for_rows(colour: str) -> tuple[int, int]:
         """
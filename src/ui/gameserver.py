@@ -0,0 +1,367 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from concurrent.futures import Executor, ThreadPoolExecutor
+
+from src.game_logic.codes import CodeHelper
+from src.game_logic.top_level.game import Game
+from src.game_logic.top_level.setup import Setup
+
+
+class GameServer:
+    """
+    Hosts games of chess for clients connected over a local socket, with asyncio
+
+    Clients send requests as JSON objects, one per line, and get JSON objects back the same way. Each request has an
+    "action", one of:
+
+    - "new_game", with optional "white", "black" and "fen", starts a game and subscribes the client to it
+    - "join", with a "game_id", subscribes the client to a game
+    - "moves", with a "game_id", lists the legal moves of the side to move
+    - "move", with a "game_id" and a "move" in long algebraic notation like 'e2e4' or 'e7e8q', plays a move
+    - "close_game", with a "game_id", ends a game and frees it
+
+    A request is answered with an "error" event if it can't be carried out, including if its game is closed while it
+    waits on the executor or if the executor fails. Otherwise every client subscribed to the
+    game is sent a "state" event with the position and state of the game, see state(). The "moves" action is answered
+    with a "moves" event to the client that asked.
+
+    Moves are checked and played with the move finders of the pieces, see Game.moves_for_coords(), which can take a
+    while, so this is done in an executor and the event loop keeps serving other games meanwhile. A lock per game
+    makes sure that only one move of a game is worked on at a time
+    """
+
+    ENCODING = "utf-8"
+    # The longest line that a client can send, in bytes
+    LINE_LIMIT = 64 * 1024
+
+    def __init__(self, executor: Executor | None = None, backend: str = "BITBOARD"):
+        """
+        Constructor for a GameServer
+
+        :param executor: Executor object to check and play moves in, leave as None for a thread pool of its own
+        :param backend: str for the storage behind the boards of the games, see Setup. Default "BITBOARD"
+        """
+        self.backend = backend
+        self.__executor = executor
+        self.__owns_executor = executor is None
+        if executor is None:
+            self.__executor = ThreadPoolExecutor()
+        self.__games = {}
+        self.__locks = {}
+        self.__subscribers = {}
+        self.__next_game_id = 1
+        self.__server = None
+
+    @property
+    def num_games(self) -> int:
+        """
+        The number of games being hosted
+
+        :return: int as described
+        """
+        return len(self.__games)
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0, path: str | None = None) -> None:
+        """
+        Starts listening for clients
+
+        :param host: str for the host to listen on, default "127.0.0.1"
+        :param port: int for the TCP port to listen on, default 0 to pick a free port
+        :param path: str for the path of a Unix socket to listen on instead of a TCP port, leave as None for TCP
+        :return: None
+        """
+        if path is not None:
+            self.__server = await asyncio.start_unix_server(self.handle_client, path, limit=self.LINE_LIMIT)
+        else:
+            self.__server = await asyncio.start_server(self.handle_client, host, port, limit=self.LINE_LIMIT)
+
+    @property
+    def address(self):
+        """
+        The address that this server is listening on, ie a (host, port) tuple for TCP or the path of a Unix socket
+
+        :return: address as described, None if the server hasn't been started
+        """
+        if self.__server is None:
+            return None
+        return self.__server.sockets[0].getsockname()
+
+    async def close(self) -> None:
+        """
+        Stops listening for clients and shuts down the executor if this server made it
+
+        :return: None
+        """
+        if self.__server is not None:
+            self.__server.close()
+            await self.__server.wait_closed()
+            self.__server = None
+        if self.__owns_executor:
+            self.__executor.shutdown(wait=False)
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Serves the requests of a client until it disconnects
+
+        :param reader: StreamReader object for the connection of the client
+        :param writer: StreamWriter object for the connection of the client
+        :return: None
+        """
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ValueError, asyncio.LimitOverrunError):
+                    await self.__send(writer, {"event": "error", "message": "Request is too long"})
+                    break
+                if not line:
+                    break
+                try:
+                    request = json.loads(line.decode(self.ENCODING))
+                except (UnicodeDecodeError, json.JSONDecodeError):
+                    await self.__send(writer, {"event": "error", "message": "Request isn't valid JSON"})
+                    continue
+                await self.handle_request(request, writer)
+        except ConnectionError:
+            pass
+        finally:
+            for subscribers in self.__subscribers.values():
+                subscribers.discard(writer)
+            writer.close()
+
+    async def handle_request(self, request: dict, writer: asyncio.StreamWriter) -> None:
+        """
+        Carries out a request of a client, see the actions of GameServer
+
+        :param request: dict for the request
+        :param writer: StreamWriter object for the connection of the client that sent it
+        :return: None
+        """
+        try:
+            if not isinstance(request, dict):
+                raise ValueError("Request must be a JSON object")
+            action = request.get("action")
+            if action == "new_game":
+                game_id = self.new_game(GameServer.__field(request, "white", str, "White"),
+                                        GameServer.__field(request, "black", str, "Black"),
+                                        GameServer.__field(request, "fen", str))
+                self.__subscribers[game_id].add(writer)
+                await self.__send(writer, await self.__locked_state(game_id))
+            elif action == "join":
+                game_id = self.__game_id(request)
+                self.__subscribers[game_id].add(writer)
+                await self.__send(writer, await self.__locked_state(game_id))
+            elif action == "moves":
+                game_id = self.__game_id(request)
+                async with self.__locks[game_id]:
+                    moves = await self.__run(GameServer.legal_moves, self.__games[game_id])
+                self.__check_open(game_id)
+                await self.__send(writer, {"event": "moves", "game_id": game_id, "moves": moves})
+            elif action == "move":
+                game_id = self.__game_id(request)
+                await self.play_move(game_id, GameServer.__field(request, "move", str, ""))
+            elif action == "close_game":
+                game_id = self.__game_id(request)
+                await self.__broadcast(game_id, {"event": "closed", "game_id": game_id})
+                self.close_game(game_id)
+            else:
+                raise ValueError(f"Unknown action '{action}'")
+        except ValueError as error:
+            await self.__send(writer, {"event": "error", "message": str(error)})
+
+    def new_game(self, white_name: str, black_name: str, fen: str | None = None) -> int:
+        """
+        Starts a new game
+
+        :param white_name: str for the name of the white player
+        :param black_name: str for the name of the black player
+        :param fen: str for the position to start from in Forsyth-Edwards Notation, leave as None for the usual start
+        :return: int for the id of the game
+        """
+        game = Game(Setup({'white_name': white_name, 'black_name': black_name}, backend=self.backend, fen=fen))
+        game.start_game()
+        game_id = self.__next_game_id
+        self.__next_game_id += 1
+        self.__games[game_id] = game
+        self.__locks[game_id] = asyncio.Lock()
+        self.__subscribers[game_id] = set()
+        return game_id
+
+    def close_game(self, game_id: int) -> None:
+        """
+        Ends a game, forgetting it and its subscribers
+
+        :param game_id: int for the id of the game
+        :return: None
+        """
+        del self.__games[game_id]
+        del self.__locks[game_id]
+        del self.__subscribers[game_id]
+
+    def game(self, game_id: int) -> Game:
+        """
+        Finds a game being hosted
+
+        :param game_id: int for the id of the game
+        :return: Game object as described
+        """
+        return self.__games[game_id]
+
+    async def play_move(self, game_id: int, move_name: str) -> None:
+        """
+        Plays a move in a game and sends the new state of the game to its subscribers
+
+        :param game_id: int for the id of the game
+        :param move_name: str for the move in long algebraic notation, e.g. 'e2e4' or 'e7e8q'
+        :return: None
+        :raises ValueError: if the move can't be played, or the game is closed while it is played
+        """
+        async with self.__locks[game_id]:
+            await self.__run(GameServer.execute_move_name, self.__games[game_id], move_name)
+            self.__check_open(game_id)
+            state = await self.__run(self.state, game_id)
+        await self.__broadcast(game_id, state)
+
+    def state(self, game_id: int) -> dict:
+        """
+        Describes the state of a game, as sent to clients
+
+        :param game_id: int for the id of the game
+        :return: dict with the event, game id, FEN of the position, colour to move, state of the game as per
+        Game.game_state(), the reason for a draw if there is one, and the last move played
+        """
+        game = self.__games[game_id]
+        last_move = CodeHelper.move_name(game.moves[-1].compact()) if game.moves else None
+        return {"event": "state", "game_id": game_id, "fen": game.board.to_fen(), "to_move": game.curr_player.colour,
+                "state": game.game_state(), "draw_reason": game.draw_reason(), "last_move": last_move}
+
+    @staticmethod
+    def legal_moves(game: Game) -> list[str]:
+        """
+        Finds the legal moves of the current player of a game
+
+        :param game: Game object
+        :return: list of moves in long algebraic notation, with a move for each piece a pawn can promote to, e.g.
+        'e7e8q', 'e7e8r', 'e7e8b' and 'e7e8n'
+        """
+        names = []
+        for piece in game.curr_player.pieces:
+            if piece.position is not None:
+                names += [CodeHelper.move_name(move.compact()) for move in piece.moves()]
+        return names
+
+    @staticmethod
+    def execute_move_name(game: Game, move_name: str) -> None:
+        """
+        Plays a move in a game, checking it with the move finder of the piece that moves
+
+        :param game: Game object
+        :param move_name: str for the move in long algebraic notation, e.g. 'e2e4' or 'e7e8q'
+        :return: None
+        :raises ValueError: if the game is over, the move can't be read, or it isn't legal
+        """
+        if game.game_state() in ["CHECKMATE", "STALEMATE", "DRAW"]:
+            raise ValueError("Game is over")
+        promotions = {"": "QUEEN", "q": "QUEEN", "r": "ROOK", "b": "BISHOP", "n": "KNIGHT"}
+        if len(move_name) not in [4, 5] or move_name[4:] not in promotions:
+            raise ValueError(f"Can't read move '{move_name}'")
+        try:
+            source = CodeHelper.name_square(move_name[:2])
+            CodeHelper.name_square(move_name[2:4])
+        except AssertionError:
+            raise ValueError(f"Can't read move '{move_name}'")
+        moves = game.moves_for_coords(CodeHelper.coords(source))
+        game.execute_move(moves, move_name[2:4], promotions[move_name[4:]])
+
+    def __game_id(self, request: dict) -> int:
+        """
+        Finds the id of the game that a request is for
+
+        :param request: dict for the request
+        :return: int as described
+        :raises ValueError: if there isn't a game with the id
+        """
+        game_id = GameServer.__field(request, "game_id", int)
+        self.__check_open(game_id)
+        return game_id
+
+    @staticmethod
+    def __field(request: dict, name: str, field_type: type, default=None):
+        """
+        Finds a field of a request, checking that it has the right type
+
+        :param request: dict for the request
+        :param name: str for the name of the field
+        :param field_type: type that the field must be, e.g. str
+        :param default: value to use if the request doesn't have the field, default None
+        :return: the value of the field as described
+        :raises ValueError: if the field isn't of the type, bools aren't counted as ints
+        """
+        value = request.get(name, default)
+        if value is not default and (not isinstance(value, field_type) or isinstance(value, bool)):
+            raise ValueError(f"Field '{name}' must be of type {field_type.__name__}")
+        return value
+
+    def __check_open(self, game_id: int) -> None:
+        """
+        Checks that a game is still being hosted, eg after waiting on the executor, during which it could be closed
+
+        :param game_id: int for the id of the game
+        :return: None
+        :raises ValueError: if there isn't a game with the id
+        """
+        if game_id not in self.__games:
+            raise ValueError(f"No game with id {game_id}")
+
+    async def __locked_state(self, game_id: int) -> dict:
+        """
+        Finds the state of a game in the executor, once no move of the game is being worked on, see state()
+
+        :param game_id: int for the id of the game
+        :return: dict as described
+        """
+        async with self.__locks[game_id]:
+            self.__check_open(game_id)
+            return await self.__run(self.state, game_id)
+
+    async def __run(self, function, *args):
+        """
+        Runs a function in the executor of this server, so that the event loop isn't held up
+
+        :return: the result of the function
+        :raises ValueError: if the function raises any exception, so that it is sent to the client as an error rather
+        than closing the connection
+        """
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.__executor, function, *args)
+        except ValueError:
+            raise
+        except Exception as error:
+            raise ValueError(f"Couldn't carry out request: {error!r}") from error
+
+    async def __broadcast(self, game_id: int, message: dict) -> None:
+        """
+        Sends a message to every client subscribed to a game
+
+        :param game_id: int for the id of the game
+        :param message: dict for the message
+        :return: None
+        """
+        for writer in list(self.__subscribers.get(game_id, ())):
+            try:
+                await self.__send(writer, message)
+            except ConnectionError:
+                self.__subscribers[game_id].discard(writer)
+
+    async def __send(self, writer: asyncio.StreamWriter, message: dict) -> None:
+        """
+        Sends a message to a client, as a line of JSON
+
+        :param writer: StreamWriter object for the connection of the client
+        :param message: dict for the message
+        :return: None
+        """
+        writer.write(json.dumps(message).encode(self.ENCODING) + b"\n")
+        await writer.drain()
@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from typing import TextIO
+
+from src.game_logic.codes import CodeHelper
+from src.game_logic.engine.searchengine import SearchEngine
+from src.game_logic.top_level.setup import Setup
+
+
+class UciAdapter:
+    """
+    Plays the engine over the Universal Chess Interface, so that it can be run by GUIs and tournament managers
+
+    Commands are read a line at a time, and the replies are written to an output stream. The commands understood are
+    "uci", "isready", "ucinewgame", "setoption" for the "Hash" option, "position", "go", "stop" and "quit". Positions are
+    set up with Setup on a BitBoard, and the moves after them are played with the LegalMoveGenerator of the board.
+
+    Searches run on a thread of their own with a SearchEngine, so that "isready" and "stop" are answered while a search
+    is going on. The thread writes the "bestmove" line itself when the search ends, on time or when stopped
+    """
+
+    NAME = "Chess"
+    AUTHOR = "Hugo Phibbs"
+
+    # Moves assumed to be left in the game when the clock doesn't say, for sharing out the time left
+    DEFAULT_MOVES_TO_GO = 30
+    # Seconds kept back from every move, for the time it takes to pass the move on
+    MOVE_OVERHEAD = 0.05
+    # Fewest seconds that a search is given
+    MIN_TIME = 0.01
+
+    def __init__(self, output: TextIO = sys.stdout, table_size_mb: int = 16):
+        """
+        Constructor for a UciAdapter
+
+        :param output: TextIO object to write replies to, default sys.stdout
+        :param table_size_mb: int for the size of the transposition table of the engine in megabytes, default 16
+        """
+        self.output = output
+        self.table_size_mb = table_size_mb
+        self.engine = SearchEngine(table_size_mb)
+        self.board = None
+        self.__output_lock = threading.Lock()
+        self.__search_thread = None
+        self.__stop_event = threading.Event()
+        self.set_position(Setup.STARTING_FEN, [])
+
+    @property
+    def searching(self) -> bool:
+        """
+        If a search is going on
+
+        :return: bool as described
+        """
+        return self.__search_thread is not None and self.__search_thread.is_alive()
+
+    def run(self, commands: TextIO = sys.stdin) -> None:
+        """
+        Carries out commands until "quit" or the end of the input
+
+        :param commands: TextIO object to read commands from, default sys.stdin
+        :return: None
+        """
+        for line in commands:
+            if not self.handle(line):
+                return
+        self.stop()
+
+    def handle(self, line: str) -> bool:
+        """
+        Carries out a command. Unknown commands are ignored, as UCI asks
+
+        :param line: str for the line of the command
+        :return: bool for if more commands should be read, False after "quit"
+        """
+        tokens = line.split()
+        if not tokens:
+            return True
+        command, args = tokens[0], tokens[1:]
+        if command == "uci":
+            self.send(f"id name {self.NAME}")
+            self.send(f"id author {self.AUTHOR}")
+            self.send(f"option name Hash type spin default {self.table_size_mb} min 1 max 1024")
+            self.send("uciok")
+        elif command == "isready":
+            self.send("readyok")
+        elif command == "ucinewgame":
+            self.stop()
+            self.engine.table.clear()
+        elif command == "setoption":
+            self.stop()
+            self.__set_option(args)
+        elif command == "position":
+            self.stop()
+            try:
+                self.set_position(*UciAdapter.parse_position(args))
+            except ValueError as error:
+                self.send(f"info string {error}")
+        elif command == "go":
+            self.go(UciAdapter.parse_go(args))
+        elif command == "stop":
+            self.stop()
+        elif command == "quit":
+            self.stop()
+            return False
+        return True
+
+    def send(self, line: str) -> None:
+        """
+        Writes a reply, so that it isn't mixed up with a reply being written by the search thread
+
+        :param line: str for the reply
+        :return: None
+        """
+        with self.__output_lock:
+            self.output.write(line + "\n")
+            self.output.flush()
+
+    def set_position(self, fen: str, move_names: list[str]) -> None:
+        """
+        Sets up the position to search
+
+        :param fen: str for the position to start from in Forsyth-Edwards Notation
+        :param move_names: list of str for moves played from the position in long algebraic notation, e.g. 'e2e4'
+        :return: None
+        :raises ValueError: if the FEN can't be read or a move isn't legal
+        """
+        board = Setup({'white_name': "White", 'black_name': "Black"}, backend="BITBOARD", fen=fen).board
+        for name in move_names:
+            moves = [move for move in board.move_generator.generate(board.side_to_move)
+                     if CodeHelper.move_name(move) == name]
+            if not moves:
+                raise ValueError(f"Illegal move '{name}'")
+            board.make_move(moves[0])
+        self.board = board
+
+    def go(self, params: dict) -> None:
+        """
+        Starts searching the position on a thread of its own, see parse_go() for the params
+
+        :param params: dict of the params of the "go" command
+        :return: None
+        """
+        self.stop()
+        side = "WHITE" if self.board.side_to_move == 0 else "BLACK"
+        self.__stop_event = threading.Event()
+        self.__search_thread = threading.Thread(target=self.__search, args=(
+            side, self.time_budget(params, side), params.get("depth", SearchEngine.MAX_DEPTH),
+            params.get("infinite", False), self.__stop_event), daemon=True)
+        self.__search_thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops the search if there is one, waiting for its best move to be written
+
+        :return: None
+        """
+        self.__stop_event.set()
+        if self.__search_thread is not None:
+            self.__search_thread.join()
+            self.__search_thread = None
+
+    def time_budget(self, params: dict, side: str) -> float:
+        """
+        Works out how long to search for
+
+        A "movetime" is used as given. Otherwise the time left on the clock of the side is shared out over the moves to
+        go, along with most of the increment, and never more than half the time left. Without either the search has no
+        time limit
+
+        :param params: dict of the params of the "go" command, see parse_go()
+        :param side: str for the colour of the side to move
+        :return: float for the number of seconds as described
+        """
+        if "movetime" in params:
+            return max(params["movetime"] / 1000 - self.MOVE_OVERHEAD, self.MIN_TIME)
+        time_left = params.get("wtime" if side == "WHITE" else "btime")
+        if params.get("infinite") or time_left is None:
+            return float("inf")
+        increment = params.get("winc" if side == "WHITE" else "binc", 0)
+        moves_to_go = params.get("movestogo", self.DEFAULT_MOVES_TO_GO)
+        budget = min(time_left / max(moves_to_go, 1) + increment * 3 / 4, time_left / 2)
+        return max(budget / 1000 - self.MOVE_OVERHEAD, self.MIN_TIME)
+
+    @staticmethod
+    def parse_position(args: list[str]) -> tuple[str, list[str]]:
+        """
+        Reads the args of a "position" command, either "startpos" or "fen" and the six fields of a FEN, optionally
+        followed by "moves" and the moves played from the position
+
+        :param args: list of str for the args
+        :return: tuple of the FEN and the list of move names
+        :raises ValueError: if the args can't be read
+        """
+        moves_at = args.index("moves") if "moves" in args else len(args)
+        position, move_names = args[:moves_at], args[moves_at + 1:]
+        if position == ["startpos"]:
+            return Setup.STARTING_FEN, move_names
+        if position[:1] == ["fen"] and len(position) > 1:
+            return " ".join(position[1:]), move_names
+        raise ValueError(f"Can't read position '{' '.join(args)}'")
+
+    @staticmethod
+    def parse_go(args: list[str]) -> dict:
+        """
+        Reads the args of a "go" command
+
+        :param args: list of str for the args
+        :return: dict with "infinite" set to True if it is given, and the int value of any of "movetime", "wtime",
+        "btime", "winc", "binc", "movestogo" and "depth" that are given. Others are left out
+        """
+        params = {}
+        i = 0
+        while i < len(args):
+            if args[i] == "infinite":
+                params["infinite"] = True
+            elif args[i] in ["movetime", "wtime", "btime", "winc", "binc", "movestogo", "depth"] and i + 1 < len(args):
+                try:
+                    params[args[i]] = int(args[i + 1])
+                except ValueError:
+                    pass
+                i += 1
+            i += 1
+        return params
+
+    @staticmethod
+    def score_name(score: int) -> str:
+        """
+        Finds how a score is given in an "info" line
+
+        :param score: int for a score from the engine, in centipawns from the point of view of the side to move
+        :return: str for the score, e.g. 'cp 35', or 'mate 2' for mate in two moves, negative when being mated
+        """
+        if score >= SearchEngine.MATE - SearchEngine.MAX_PLY:
+            return f"mate {(SearchEngine.MATE - score + 1) // 2}"
+        if score <= -SearchEngine.MATE + SearchEngine.MAX_PLY:
+            return f"mate {-(SearchEngine.MATE + score) // 2}"
+        return f"cp {score}"
+
+    def __search(self, side: str, time_budget: float, max_depth: int, infinite: bool,
+                 stop_event: threading.Event) -> None:
+        """
+        Searches the position and writes the best move, run on the search thread
+
+        :param side: str for the colour of the side to move
+        :param time_budget: float for the number of seconds to search for
+        :param max_depth: int for the deepest iteration to search to
+        :param infinite: bool for if the best move should be held back until the search is stopped, as UCI asks of
+        "go infinite"
+        :param stop_event: Event object that is set to stop the search
+        :return: None
+        """
+        start = time.perf_counter()
+        move = self.engine.best_move(self.board, side, time_budget, max(max_depth, 1), stop_event)
+        elapsed = int((time.perf_counter() - start) * 1000)
+        if move is None:
+            self.send("bestmove 0000")
+            return
+        self.send(f"info depth {self.engine.depth} score {UciAdapter.score_name(self.engine.score)} "
+                  f"nodes {self.engine.nodes} time {elapsed} pv {CodeHelper.move_name(move)}")
+        if infinite:
+            stop_event.wait()
+        self.send(f"bestmove {CodeHelper.move_name(move)}")
+
+    def __set_option(self, args: list[str]) -> None:
+        """
+        Sets an option of the engine, from the args of a "setoption" command like 'name Hash value 64'
+
+        :param args: list of str for the args
+        :return: None
+        """
+        if "name" not in args or "value" not in args:
+            return
+        name = " ".join(args[args.index("name") + 1:args.index("value")])
+        value = " ".join(args[args.index("value") + 1:])
+        if name.lower() == "hash" and value.isdigit():
+            self.table_size_mb = max(int(value), 1)
+            self.engine = SearchEngine(self.table_size_mb, self.engine.evaluator)
+
+
+def main() -> None:
+    """
+    Command line entry point for the UCI engine, reading commands from stdin and replying on stdout
+
+    :return: None
+    """
+    UciAdapter().run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import unittest
+
+from src.game_logic.engine.analysispool import AnalysisPool
+from src.game_logic.engine.searchengine import SearchEngine
+from src.game_logic.top_level.setup import Setup
+
+
+class TestAnalysisPool(unittest.TestCase):
+    """
+    Test case for AnalysisPool object
+    """
+
+    @staticmethod
+    def board(fen: str):
+        return Setup({'white_name': 'Hugo', 'black_name': 'Tom'}, backend="BITBOARD", fen=fen).board
+
+    def test_analyse(self):
+        # Test that the mating move is ranked first, with every move given a score
+        board = self.board("6k1/5ppp/8/8/8/8/5PPP/R5K1 w - - 0 1")
+        key = board.zobrist_key
+        with AnalysisPool(processes=0, table_size_mb=1) as pool:
+            ranked = pool.analyse(board, 5, max_depth=2)
+        self.assertEqual(ranked[0][:2], ((0, 56, 0), SearchEngine.MATE - 1))
+        self.assertEqual(len(ranked), len(board.move_generator.generate(board.side_to_move)))
+        self.assertEqual([score for _, score, _ in ranked], sorted([score for _, score, _ in ranked], reverse=True))
+        self.assertEqual(board.zobrist_key, key)
+
+        # Test a move that stalemates
+        board = self.board("k7/8/1Q6/8/8/8/8/7K w - - 0 1")
+        with AnalysisPool(processes=0, table_size_mb=1) as pool:
+            ranked = dict((move, score) for move, score, _ in pool.analyse(board, 5, max_depth=1))
+        self.assertEqual(ranked[(41, 50, 0)], 0)
+        self.assertGreater(ranked[(41, 33, 0)], 0)
+
+    def test_processes(self):
+        # Test that worker processes find the same best move as searching in this process, and score every move
+        board = self.board("4k3/8/8/3q4/8/8/3R4/4K3 w - - 0 1")
+        with AnalysisPool(processes=0, table_size_mb=1) as pool:
+            expected = pool.analyse(board, 5, max_depth=2)
+        with AnalysisPool(processes=2, table_size_mb=1) as pool:
+            ranked = pool.analyse(board, 5, max_depth=2)
+        self.assertEqual(ranked[0][:2], expected[0][:2])
+        self.assertEqual(ranked[0][0], (11, 35, 0))
+        self.assertEqual(sorted(move for move, _, _ in ranked), sorted(move for move, _, _ in expected))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+
+from src.game_logic.codes import QUIET, DOUBLE_PUSH, CASTLE, PROMOTE_QUEEN
+from src.game_logic.engine.evaluator import Evaluator
+from src.game_logic.mid_level.support.piecesquaretables import PieceSquareTables
+from src.game_logic.top_level.setup import Setup
+
+
+class TestEvaluator(unittest.TestCase):
+    """
+    Test case for Evaluator object
+    """
+
+    def setUp(self) -> None:
+        self.evaluator = Evaluator()
+        self.board = self.board_for(Setup.STARTING_FEN)
+
+    @staticmethod
+    def board_for(fen: str):
+        return Setup({'white_name': 'Hugo', 'black_name': 'Tom'}, backend="BITBOARD", fen=fen).board
+
+    def assert_scores_match(self, board):
+        self.assertEqual((board.middle_score, board.end_score, board.phase), PieceSquareTables.scores(board.mailbox))
+
+    def test_evaluate(self):
+        # Test that the initial position is level
+        self.assertEqual(self.evaluator.evaluate(self.board), 0)
+        self.assertEqual(self.board.phase, PieceSquareTables.MAX_PHASE)
+
+        # Test that a central pawn move is good for white, from both points of view
+        self.board.make_move((12, 28, DOUBLE_PUSH))
+        self.assertLess(self.evaluator.evaluate(self.board), 0)
+        self.assertGreater(self.evaluator.evaluate_colour(self.board, "WHITE"), 0)
+        self.assertEqual(self.evaluator.evaluate_colour(self.board, "BLACK"),
+                         -self.evaluator.evaluate_colour(self.board, "WHITE"))
+
+    def test_end_game(self):
+        # Test that the king is better in the centre with no pieces left
+        board = self.board_for("7k/8/8/8/3K4/8/8/8 w - - 0 1")
+        self.assertEqual(board.phase, 0)
+        self.assertGreater(self.evaluator.evaluate(board), 0)
+
+    def test_incremental_scores(self):
+        board = self.board_for("r3k2r/P6p/8/8/8/8/8/R3K2R w KQkq - 0 1")
+        start = (board.middle_score, board.end_score, board.phase)
+        for move in [(4, 6, CASTLE), (60, 58, CASTLE), (48, 56, PROMOTE_QUEEN), (55, 47, QUIET)]:
+            board.make_move(move)
+            self.assert_scores_match(board)
+        for i in range(4):
+            board.unmake_move()
+        self.assertEqual((board.middle_score, board.end_score, board.phase), start)
+
+        # Test with pieces moved through Position objects
+        board.get_position((0, 0)).piece.swap_position(board.get_position((0, 2)))
+        self.assert_scores_match(board)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+
+from src.game_logic.codes import CodeHelper, PROMOTE_KNIGHT, PROMOTE_QUEEN
+from src.game_logic.engine.moveorderer import MoveOrderer
+from src.game_logic.top_level.setup import Setup
+
+
+class TestMoveOrderer(unittest.TestCase):
+    """
+    Test case for MoveOrderer object
+    """
+
+    FEN = "4k3/8/8/3q4/r1P5/8/3R4/4K3 w - - 0 1"
+
+    def setUp(self) -> None:
+        self.orderer = MoveOrderer(max_ply=8)
+        self.setup = Setup({'white_name': 'Hugo', 'black_name': 'Tom'}, backend="BITBOARD", fen=self.FEN)
+        self.board = self.setup.board
+        self.moves = self.board.move_generator.generate(self.board.side_to_move)
+
+    @staticmethod
+    def names(moves) -> list[str]:
+        return [CodeHelper.move_name(move) for move in moves]
+
+    def test_stages(self):
+        ordered = self.names(self.orderer.ordered(self.board, self.moves, 0, (11, 19, 0)))
+        self.assertEqual(sorted(ordered), sorted(self.names(self.moves)))
+
+        # Test the hash move, then the captures of the queen with the least valuable attacker first
+        self.assertEqual(ordered[:3], ["d2d3", "c4d5", "d2d5"])
+
+        # Test that a hash move that isn't one of the moves is left out
+        ordered = self.names(self.orderer.ordered(self.board, self.moves, 0, (0, 1, 0)))
+        self.assertEqual(ordered[:2], ["c4d5", "d2d5"])
+        self.assertEqual(len(ordered), len(self.moves))
+
+    def test_killers_and_history(self):
+        self.orderer.record_cutoff(self.board, (4, 3, 0), 2, 1)
+        self.orderer.record_cutoff(self.board, (11, 8, 0), 3, 1)
+        self.assertEqual(self.orderer.killers[1], [(11, 8, 0), (4, 3, 0)])
+
+        # Test that killers come after the captures, and the rest of the quiet moves by history
+        self.orderer.record_cutoff(self.board, (4, 5, 0), 1, 2)
+        ordered = self.names(self.orderer.ordered(self.board, self.moves, 1))
+        self.assertEqual(ordered[:5], ["c4d5", "d2d5", "d2a2", "e1d1", "e1f1"])
+
+        # Test that captures aren't recorded
+        self.orderer.record_cutoff(self.board, (26, 35, 0), 4, 3)
+        self.assertEqual(self.orderer.killers[3], [None, None])
+
+        # Test that a new search forgets the killers and halves the history
+        king_code = self.board.mailbox[4]
+        self.orderer.new_search()
+        self.assertEqual(self.orderer.killers[1], [None, None])
+        self.assertEqual(self.orderer.history[king_code][3], 2)
+        self.orderer.clear()
+        self.assertEqual(self.orderer.history[king_code][3], 0)
+
+    def test_mvv_lva(self):
+        mailbox = self.board.mailbox
+        self.assertGreater(MoveOrderer.mvv_lva(mailbox, (26, 35, 0)), MoveOrderer.mvv_lva(mailbox, (11, 35, 0)))
+        self.assertGreater(MoveOrderer.mvv_lva(mailbox, (11, 35, 0)), MoveOrderer.mvv_lva(mailbox, (26, 24, 0)))
+
+        # Test that the king is the least favoured attacker
+        board = Setup({'white_name': 'Hugo', 'black_name': 'Tom'}, backend="BITBOARD",
+                      fen="4k3/8/8/8/8/8/3p4/2QK4 w - - 0 1").board
+        self.assertGreater(MoveOrderer.mvv_lva(board.mailbox, (2, 11, 0)), MoveOrderer.mvv_lva(board.mailbox, (3, 11, 0)))
+
+        # Test promotions, which are only tactical to a queen
+        board = Setup({'white_name': 'Hugo', 'black_name': 'Tom'}, backend="BITBOARD",
+                      fen="4k3/P7/8/8/8/8/8/4K3 w - - 0 1").board
+        self.assertTrue(MoveOrderer.is_tactical(board.mailbox, (48, 56, PROMOTE_QUEEN)))
+        self.assertFalse(MoveOrderer.is_tactical(board.mailbox, (48, 56, PROMOTE_KNIGHT)))
+        self.assertEqual(MoveOrderer.mvv_lva(board.mailbox, (48, 56, PROMOTE_QUEEN)), 8 * 16 - 1)
+
+    def test_piece_values(self):
+        # Test that the pieces are given the values that captures are ordered by
+        values = {piece.type: piece.value for piece in self.setup.players["white_player"].pieces}
+        self.assertEqual(values, {"KING": 0, "PAWN": 1, "ROOK": 5})
+        self.assertEqual(self.setup.create_piece("BLACK", "QUEEN", None).value, 9)
+
+
+if __name__ == '__main__':
+    unittest.main()
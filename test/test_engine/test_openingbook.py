@@ -0,0 +1,113 @@
+import os
+import random
+import tempfile
+import unittest
+
+from src.game_logic.codes import CodeHelper, QUIET, DOUBLE_PUSH, EN_PASSANT, CASTLE, PROMOTE_KNIGHT, PROMOTE_QUEEN
+from src.game_logic.engine.openingbook import OpeningBook
+from src.game_logic.top_level.setup import Setup
+
+
+class TestOpeningBook(unittest.TestCase):
+    """
+    Test case for OpeningBook object
+    """
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "book.bin")
+        self.board = Setup.from_fen(Setup.STARTING_FEN, backend="BITBOARD").board
+        self.key = OpeningBook.polyglot_key(self.board)
+        e2, e4, d2, d4, g1, f3 = (CodeHelper.name_square(name) for name in ["e2", "e4", "d2", "d4", "g1", "f3"])
+        entries = [(self.key, (e2, e4, DOUBLE_PUSH), 60), (self.key, (d2, d4, DOUBLE_PUSH), 30),
+                   (self.key, (g1, f3, QUIET), 10)]
+        # Filler positions on either side of the start position, so that it has to be searched for
+        rng = random.Random(1)
+        entries += [(rng.getrandbits(64), (e2, e4, DOUBLE_PUSH), 1) for _ in range(200)]
+        OpeningBook.write(self.path, entries)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_entries(self):
+        with OpeningBook(self.path) as book:
+            self.assertEqual(len(book), 203)
+            self.assertEqual(sorted(weight for _, weight, _ in book.entries(self.key)), [10, 30, 60])
+            self.assertEqual(book.entries(12345), [])
+
+        # Test with an empty book
+        OpeningBook.write(self.path, [])
+        with OpeningBook(self.path) as book:
+            self.assertEqual(len(book), 0)
+            self.assertEqual(book.entries(self.key), [])
+            self.assertIsNone(book.choose(self.board))
+
+    def test_choose(self):
+        with OpeningBook(self.path) as book:
+            # Test picking the move with the highest weight
+            self.assertEqual(CodeHelper.move_name(book.choose_compact(self.board, weighted=False)), "e2e4")
+            move = book.choose(self.board, weighted=False)
+            self.assertEqual((move.source.coords, move.dest.coords), ((1, 4), (3, 4)))
+
+            # Test picking in proportion to the weights
+            rng = random.Random(3)
+            picks = [CodeHelper.move_name(book.choose_compact(self.board, rng=rng)) for _ in range(1000)]
+            self.assertGreater(picks.count("e2e4"), picks.count("d2d4"))
+            self.assertGreater(picks.count("d2d4"), picks.count("g1f3"))
+            self.assertGreater(picks.count("g1f3"), 0)
+
+            # Test that a move picked can be executed
+            move.execute()
+            self.assertEqual(book.compact_moves(self.board), [])
+
+    def test_decode_move(self):
+        # Test castling, en-passant and promotion
+        board = Setup.from_fen("4k3/1P6/8/3Pp3/8/8/8/R3K2R w KQ e6 0 1", backend="BITBOARD").board
+        for move in [(4, 6, CASTLE), (4, 2, CASTLE), (35, 44, EN_PASSANT), (49, 57, PROMOTE_QUEEN), (0, 8, QUIET)]:
+            book_move = OpeningBook.encode_move(move)
+            self.assertEqual(OpeningBook.decode_move(board, book_move), move)
+        self.assertEqual(OpeningBook.encode_move((4, 6, CASTLE)), 4 << 6 | 7)
+        self.assertEqual(OpeningBook.encode_move((49, 57, PROMOTE_QUEEN)), 4 << 12 | 49 << 6 | 57)
+
+        # Test that moves for the wrong side are left out
+        key = OpeningBook.polyglot_key(board)
+        OpeningBook.write(self.path, [(key, (60, 59, QUIET), 1), (key, (4, 6, CASTLE), 1)])
+        with OpeningBook(self.path) as book:
+            self.assertEqual(book.compact_moves(board), [((4, 6, CASTLE), 1)])
+            self.assertEqual(book.choose(board).type(), "CASTLE")
+
+        # Test that illegal moves are left out on a matrix board too, eg castling without the rights
+        for backend in ["MATRIX", "BITBOARD"]:
+            board = Setup.from_fen("4k3/8/8/8/8/8/8/R3K2R w K - 0 1", backend=backend).board
+            key = OpeningBook.polyglot_key(board)
+            OpeningBook.write(self.path, [(key, (4, 6, CASTLE), 1), (key, (4, 2, CASTLE), 1), (key, (0, 9, QUIET), 1)])
+            with OpeningBook(self.path) as book:
+                self.assertEqual(book.compact_moves(board), [((4, 6, CASTLE), 1)])
+
+    def test_polyglot_key(self):
+        # Test against the keys given in the Polyglot book format
+        self.assertEqual(self.key, 0x463b96181691fc9c)
+        fen = "rnbqkbnr/ppp1p1pp/8/3pPp2/8/8/PPPP1PPP/RNBQKBNR w KQkq f6 0 3"
+        self.assertEqual(OpeningBook.polyglot_key(Setup.from_fen(fen, backend="BITBOARD").board), 0x22a48b5a8e47ff78)
+        self.assertEqual(OpeningBook.polyglot_key(Setup.from_fen(fen, backend="MATRIX").board), 0x22a48b5a8e47ff78)
+
+        # Test that an en-passant square that can't be captured on doesn't count
+        fen = "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1"
+        self.assertEqual(OpeningBook.polyglot_key(Setup.from_fen(fen, backend="BITBOARD").board), 0x823c9b50fd114196)
+
+    def test_promotions(self):
+        # Test that under-promotions are kept, and that each move is given the piece promoted to
+        board = Setup.from_fen("4k3/1P6/8/8/8/8/8/4K3 w - - 0 1", backend="BITBOARD").board
+        key = OpeningBook.polyglot_key(board)
+        OpeningBook.write(self.path, [(key, (49, 57, PROMOTE_QUEEN), 2), (key, (49, 57, PROMOTE_KNIGHT), 1)])
+        with OpeningBook(self.path) as book:
+            moves = book.moves(board)
+            self.assertEqual(sorted(move.promotion.type for move, _ in moves), ["KNIGHT", "QUEEN"])
+            move = book.choose(board, weighted=False)
+            self.assertEqual(move.promotion.type, "QUEEN")
+            move.execute()
+            self.assertEqual(board.to_fen(), "1Q2k3/8/8/8/8/8/8/4K3 b - - 0 1")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import threading
+import time
+import unittest
+
+from src.game_logic.engine.searchengine import SearchEngine
+from src.game_logic.top_level.setup import Setup
+
+
+class TestSearchEngine(unittest.TestCase):
+    """
+    Test case for SearchEngine object
+    """
+
+    def setUp(self) -> None:
+        self.engine = SearchEngine(table_size_mb=1)
+
+    @staticmethod
+    def board(fen: str):
+        return Setup({'white_name': 'Hugo', 'black_name': 'Tom'}, backend="BITBOARD", fen=fen).board
+
+    def test_mate_in_one(self):
+        board = self.board("6k1/5ppp/8/8/8/8/5PPP/R5K1 w - - 0 1")
+        key = board.zobrist_key
+        self.assertEqual(self.engine.best_move(board, "WHITE", 5), (0, 56, 0))
+        self.assertEqual(self.engine.score, SearchEngine.MATE - 1)
+
+        # Test that the board is left as it was found
+        self.assertEqual(board.zobrist_key, key)
+
+    def test_wins_material(self):
+        # Test that a hanging queen is taken
+        board = self.board("4k3/8/8/3q4/8/8/3R4/4K3 w - - 0 1")
+        self.assertEqual(self.engine.best_move(board, "WHITE", 5, max_depth=3), (11, 35, 0))
+
+        # Test for black, leaving a rook that is guarded by the king
+        board = self.board("4k3/8/8/3q4/8/8/3R4/4K3 b - - 0 1")
+        self.assertNotEqual(self.engine.best_move(board, "BLACK", 5, max_depth=3)[1], 11)
+
+    def test_no_moves(self):
+        # Test with stalemate
+        board = self.board("k7/2Q5/1K6/8/8/8/8/8 b - - 0 1")
+        self.assertIsNone(self.engine.best_move(board, "BLACK", 1))
+
+        # Test with the wrong side
+        self.assertRaises(AssertionError, self.engine.best_move, board, "WHITE", 1)
+
+    def test_time_budget(self):
+        board = self.board(Setup.STARTING_FEN)
+        move = self.engine.best_move(board, "WHITE", 0.2)
+        self.assertIn(move, board.move_generator.moves())
+        self.assertGreaterEqual(self.engine.depth, 1)
+
+    def test_stop_event(self):
+        # Test that a search that has been stopped returns a move without waiting for its time budget
+        board = self.board(Setup.STARTING_FEN)
+        stop_event = threading.Event()
+        stop_event.set()
+        start = time.perf_counter()
+        move = self.engine.best_move(board, "WHITE", 60, stop_event=stop_event)
+        self.assertLess(time.perf_counter() - start, 10)
+        self.assertIn(move, board.move_generator.moves())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+
+from src.game_logic.codes import CodeHelper, EN_PASSANT
+from src.game_logic.engine.staticexchange import StaticExchange
+from src.game_logic.top_level.setup import Setup
+
+
+class TestStaticExchange(unittest.TestCase):
+    """
+    Test case for StaticExchange object
+    """
+
+    @staticmethod
+    def board(fen: str, backend: str = "BITBOARD"):
+        return Setup({'white_name': 'Hugo', 'black_name': 'Tom'}, backend=backend, fen=fen).board
+
+    @staticmethod
+    def move(name: str, flag: int = 0) -> tuple[int, int, int]:
+        return CodeHelper.name_square(name[:2]), CodeHelper.name_square(name[2:]), flag
+
+    def test_static_exchange(self):
+        d5 = CodeHelper.name_square("d5")
+        # Test a hanging piece, and one that is guarded by a pawn
+        self.assertEqual(StaticExchange.static_exchange(self.board("4k3/8/8/3n4/8/8/8/3RK3 w - - 0 1"), d5), 320)
+        self.assertEqual(StaticExchange.static_exchange(self.board("4k3/8/4p3/3n4/8/8/8/3RK3 w - - 0 1"), d5), 0)
+
+        # Test that it doesn't matter whose turn it is, and that an empty square is safe
+        self.assertEqual(StaticExchange.static_exchange(self.board("4k3/8/8/3n4/8/8/8/3RK3 b - - 0 1"), d5), 320)
+        self.assertEqual(StaticExchange.static_exchange(self.board("4k3/8/8/8/8/8/8/3RK3 w - - 0 1"), d5), 0)
+
+        # Test a Board that isn't a BitBoard
+        self.assertEqual(StaticExchange.static_exchange(self.board("4k3/8/8/3n4/8/8/8/3RK3 w - - 0 1", "MATRIX"),
+                                                        d5), 320)
+
+    def test_x_rays(self):
+        d5 = CodeHelper.name_square("d5")
+        # Test that a rook behind a rook joins in
+        self.assertEqual(StaticExchange.static_exchange(self.board("3rk3/8/8/3n4/8/8/3R4/3RK3 w - - 0 1"), d5), 320)
+        self.assertEqual(StaticExchange.static_exchange(self.board("3rk3/8/8/3n4/8/8/8/3RK3 w - - 0 1"), d5), 0)
+
+        # Test a queen behind a bishop, winning a knight and pawn for the bishop
+        board = self.board("4k3/8/4p3/3n4/8/1B6/Q7/4K3 w - - 0 1")
+        self.assertEqual(StaticExchange.static_exchange(board, d5), 90)
+        self.assertEqual(StaticExchange.move_exchange(board, self.move("b3d5")), 90)
+        self.assertEqual(StaticExchange.static_exchange(self.board("4k3/8/4p3/3n4/8/1B6/8/4K3 w - - 0 1"), d5), 0)
+
+    def test_kings(self):
+        d5 = CodeHelper.name_square("d5")
+        self.assertEqual(StaticExchange.static_exchange(self.board("4k3/8/8/3r4/4K3/8/8/8 w - - 0 1"), d5), 500)
+
+        # Test that a king doesn't capture a guarded piece
+        self.assertEqual(StaticExchange.static_exchange(self.board("4k3/3r4/8/3r4/4K3/8/8/8 w - - 0 1"), d5), 0)
+
+    def test_move_exchange(self):
+        board = self.board("4k3/8/4p3/3n4/8/8/8/3RK3 w - - 0 1")
+        self.assertEqual(StaticExchange.move_exchange(board, self.move("d1d5")), 320 - 500)
+
+        # Test a quiet move onto an attacked square
+        board = self.board("4k3/8/8/4p3/8/8/8/3RK3 w - - 0 1")
+        self.assertEqual(StaticExchange.move_exchange(board, self.move("d1d4")), -500)
+        self.assertEqual(StaticExchange.move_exchange(board, self.move("d1d2")), 0)
+
+        # Test en passant, where the captured pawn isn't on the dest square
+        board = self.board("4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 1")
+        self.assertEqual(StaticExchange.move_exchange(board, self.move("e5d6", EN_PASSANT)), 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import tempfile
+import unittest
+
+from src.game_logic.engine.tablebase import Tablebase
+from src.game_logic.engine.tablebasegenerator import TablebaseGenerator
+from src.game_logic.top_level.setup import Setup
+
+
+class TestTablebase(unittest.TestCase):
+    """
+    Test case for Tablebase and TablebaseGenerator objects
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.path = TablebaseGenerator(cls.directory.name).generate("KQK")
+        cls.tablebase = Tablebase(cls.directory.name)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.tablebase.close()
+        cls.directory.cleanup()
+
+    def probe(self, fen: str, backend: str = "BITBOARD"):
+        return self.tablebase.probe(Setup.from_fen(fen, backend=backend).board)
+
+    def test_probe(self):
+        # Test a mate in one, a mate and a stalemate
+        self.assertEqual(self.probe("7k/8/6K1/8/8/8/8/5Q2 w - - 0 1"), ("WIN", 1))
+        self.assertEqual(self.probe("7k/6Q1/6K1/8/8/8/8/8 b - - 0 1"), ("LOSS", 0))
+        self.assertEqual(self.probe("7k/5Q2/6K1/8/8/8/8/8 b - - 0 1"), ("DRAW", 0))
+        self.assertEqual(self.probe("7k/5Q2/6K1/8/8/8/8/8 b - - 0 1", backend="MATRIX"), ("DRAW", 0))
+
+        # Test with the queen on the other side, where it can be taken
+        self.assertEqual(self.probe("7k/8/8/8/8/8/1q6/K7 w - - 0 1"), ("DRAW", 0))
+        self.assertEqual(self.probe("7k/8/8/8/4q3/8/8/K7 b - - 0 1")[0], "WIN")
+
+        # Test positions that aren't covered
+        self.assertIsNone(self.probe("7k/8/6K1/8/8/8/8/5R2 w - - 0 1"))
+        self.assertIsNone(self.probe("r3k3/8/8/8/8/8/8/4K1Q1 w q - 0 1"))
+        self.assertFalse(self.tablebase.has_table("KRK"))
+        self.assertTrue(self.tablebase.has_table("KKQ"))
+
+    def test_table(self):
+        with open(self.path, "rb") as file:
+            table = file.read()
+        self.assertEqual(len(table), Tablebase.size("KQK"))
+        white_to_move = table[:len(table) // 2]
+        # Test that white always wins with the move, in at most ten moves
+        self.assertNotIn(Tablebase.DRAW, white_to_move)
+        self.assertEqual(Tablebase.decode(max(code for code in white_to_move if code != Tablebase.ILLEGAL)),
+                         ("WIN", 19))
+
+    def test_materials(self):
+        self.assertEqual(Tablebase.swap_material("KQK"), "KKQ")
+        self.assertEqual(Tablebase.material_name(["N", "B"], []), "KBNK")
+        self.assertEqual(TablebaseGenerator.sub_materials("KPK"), ["KK", "KQK", "KRK", "KBK", "KNK"])
+        self.assertEqual(TablebaseGenerator.sub_materials("KBNK"), ["KNK", "KBK"])
+        self.assertTrue(TablebaseGenerator.is_insufficient("KNK"))
+        self.assertFalse(TablebaseGenerator.is_insufficient("KPK"))
+
+        # Test encoding results
+        for result in [("WIN", 1), ("WIN", 55), ("LOSS", 0), ("LOSS", 56), ("DRAW", 0)]:
+            self.assertEqual(Tablebase.decode(Tablebase.encode(*result)), result)
+        self.assertIsNone(Tablebase.decode(Tablebase.ILLEGAL))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+
+from src.game_logic.engine.transpositiontable import TranspositionTable
+
+
+class TestTranspositionTable(unittest.TestCase):
+    """
+    Test case for TranspositionTable object
+    """
+
+    def setUp(self) -> None:
+        self.table = TranspositionTable(1)
+
+    def test_size(self):
+        self.assertEqual(self.table.size, 1 << 16)
+        self.assertEqual(TranspositionTable(3).size, 1 << 17)
+        self.assertRaises(AssertionError, TranspositionTable, 0)
+
+    def test_store_probe(self):
+        # Test normally
+        self.table.store(12345, (12, 28, 1), 5, TranspositionTable.EXACT, -250)
+        self.assertEqual(self.table.probe(12345), ((12, 28, 1), 5, TranspositionTable.EXACT, -250))
+
+        # Test with a missing entry, and a key that shares the slot
+        self.assertIsNone(self.table.probe(54321))
+        self.assertIsNone(self.table.probe(12345 + self.table.size))
+
+        # Test with no best move, which keeps the best move of the position
+        self.table.store(12345, None, 6, TranspositionTable.UPPER, 30)
+        self.assertEqual(self.table.probe(12345), ((12, 28, 1), 6, TranspositionTable.UPPER, 30))
+
+        self.table.clear()
+        self.assertIsNone(self.table.probe(12345))
+
+    def test_replacement(self):
+        other_key = 12345 + self.table.size
+        self.table.store(12345, (12, 28, 1), 5, TranspositionTable.EXACT, 10)
+
+        # Test that a shallower entry for another position doesn't replace a deeper one
+        self.table.store(other_key, (8, 16, 0), 2, TranspositionTable.LOWER, 20)
+        self.assertIsNone(self.table.probe(other_key))
+
+        # Test that entries from an older search are replaced
+        self.table.new_search()
+        self.table.store(other_key, (8, 16, 0), 2, TranspositionTable.LOWER, 20)
+        self.assertEqual(self.table.probe(other_key), ((8, 16, 0), 2, TranspositionTable.LOWER, 20))
+        self.assertIsNone(self.table.probe(12345))
+
+
+if __name__ == '__main__':
+    unittest.main()
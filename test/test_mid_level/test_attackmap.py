@@ -0,0 +1,88 @@
+import unittest
+
+from src.game_logic.codes import CodeHelper, WHITE, BLACK
+from src.game_logic.helpers import BearingHelper, TraverseHelper
+from src.game_logic.mid_level.move_finders.kingmovefinder import KingMoveFinder
+from src.game_logic.mid_level.support.attackmap import AttackMap
+from src.game_logic.mid_level.support.check import Check
+from src.game_logic.top_level.perft import Perft
+from src.game_logic.top_level.setup import Setup
+
+
+class TestAttackMap(unittest.TestCase):
+    """
+    Test case for AttackMap object
+    """
+
+    def test_attacked(self):
+        # Test initial position
+        board = Setup.from_fen(Setup.STARTING_FEN, backend="BITBOARD").board
+        attack_map = board.attack_map
+        self.assertEqual(attack_map.attacked(WHITE), 0xFFFF7E)
+        self.assertEqual(attack_map.attacked(BLACK), 0x7EFFFF << 40)
+        self.assertTrue(attack_map.is_attacked(CodeHelper.name_square("f3"), WHITE))
+        self.assertFalse(attack_map.is_attacked(CodeHelper.name_square("e4"), WHITE))
+
+    def test_attackers(self):
+        # Test that every square matches the attackers found by the board, in each reference position
+        for fen, _ in Perft.REFERENCE_POSITIONS.values():
+            board = Setup.from_fen(fen, backend="BITBOARD").board
+            attack_map = AttackMap(board)
+            for side in range(2):
+                for square in range(64):
+                    self.assertEqual(attack_map.attackers(square, side), board.attackers(square, side))
+                    self.assertEqual(attack_map.is_attacked(square, side), board.square_attacked(square, side))
+
+    def test_cache(self):
+        # Test that a position keeps its map, and that making and unmaking moves finds the right map
+        board = Setup.from_fen("4k3/8/8/8/8/8/8/R3K3 w - - 0 1", backend="BITBOARD").board
+        start_map = board.attack_map
+        self.assertIs(board.attack_map, start_map)
+        self.assertFalse(board.is_in_check("BLACK"))
+        board.make_move((0, 56, 0))
+        self.assertIsNot(board.attack_map, start_map)
+        self.assertTrue(board.is_in_check("BLACK"))
+        board.unmake_move()
+        self.assertIs(board.attack_map, start_map)
+        self.assertFalse(board.is_in_check("BLACK"))
+
+        # Test that the cache is bounded
+        for _ in range(board.ATTACK_MAP_CACHE_SIZE):
+            board.make_move((0, 8, 0))
+            board.attack_map
+            board.unmake_move()
+            board.make_move((4, 5, 0))
+            board.attack_map
+            board.unmake_move()
+        self.assertIs(board.attack_map, start_map)
+
+    def test_check(self):
+        for backend in ["BITBOARD", "MATRIX"]:
+            # Test with a king in check by a bishop
+            setup = Setup.from_fen("4k3/8/8/1B6/8/8/8/4K3 b - - 0 1", backend=backend)
+            black_king = setup.players["black_player"].king
+            self.assertTrue(Check(black_king, setup.board, BearingHelper(), TraverseHelper()).king_in_check())
+            self.assertTrue(black_king.is_in_check(setup.board))
+            white_king = setup.players["white_player"].king
+            self.assertFalse(Check(white_king, setup.board, BearingHelper(), TraverseHelper()).king_in_check())
+            self.assertFalse(white_king.is_in_check(setup.board))
+
+            # Test checks by a knight and pawn, and pieces that don't give check
+            for fen, in_check in [("4k3/8/3N4/8/8/8/8/4K3 b - - 0 1", True), ("4k3/3P4/8/8/8/8/8/4K3 b - - 0 1", True),
+                                  ("4k3/4P3/8/8/8/8/8/4K3 b - - 0 1", False), ("4k3/3p4/8/8/8/8/8/4K3 b - - 0 1", False),
+                                  ("4k3/4p3/8/8/8/8/8/4R1K1 b - - 0 1", False), ("4k3/8/8/8/8/8/8/4R1K1 b - - 0 1", True),
+                                  ("8/8/8/8/8/8/3p4/4K2k w - - 0 1", True), ("8/8/8/8/8/8/8/4kB1K b - - 0 1", False)]:
+                setup = Setup.from_fen(fen, backend=backend)
+                player = setup.players["black_player" if "b" in fen.split()[1] else "white_player"]
+                self.assertEqual(player.king.is_in_check(setup.board), in_check, f"{fen} on {backend}")
+
+    def test_castle_causes_check(self):
+        for backend in ["BITBOARD", "MATRIX"]:
+            # Test with a rook covering f1 but not d1
+            setup = Setup.from_fen("5rk1/8/8/8/8/8/8/R3K2R w KQ - 0 1", backend=backend)
+            finder = KingMoveFinder(setup.board, setup.players["white_player"].king)
+            self.assertTrue(finder._castle_causes_check("king-side"))
+            self.assertFalse(finder._castle_causes_check("queen-side"))
+
+if __name__ == '__main__':
+    unittest.main()
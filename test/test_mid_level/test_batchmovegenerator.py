@@ -0,0 +1,88 @@
+import random
+import unittest
+
+from src.game_logic.mid_level.move_finders import batchmovegenerator
+from src.game_logic.mid_level.move_finders.batchmovegenerator import BatchMoveGenerator
+from src.game_logic.top_level.perft import Perft
+from src.game_logic.top_level.setup import Setup
+
+
+class TestBatchMoveGenerator(unittest.TestCase):
+    """
+    Test case for BatchMoveGenerator object
+    """
+
+    def setUp(self) -> None:
+        # Reference positions, along with the positions of a random game from each of them
+        self.boards = []
+        rng = random.Random(7)
+        for fen, _ in Perft.REFERENCE_POSITIONS.values():
+            self.boards.append(Setup.from_fen(fen, backend="BITBOARD").board)
+            board = Setup.from_fen(fen, backend="BITBOARD").board
+            for _ in range(30):
+                moves = board.move_generator.generate(board.side_to_move)
+                if not moves:
+                    break
+                board.make_move(rng.choice(moves))
+                self.boards.append(board.clone())
+
+    def test_moves(self):
+        # Test that each board gets the same moves as generating them on its own
+        batch = BatchMoveGenerator.moves(self.boards)
+        self.assertEqual(len(batch), len(self.boards))
+        for board, moves in zip(self.boards, batch):
+            self.assertEqual(moves, board.move_generator.generate(board.side_to_move))
+        self.assertEqual(BatchMoveGenerator.moves([]), [])
+
+        # Test that the moves match the move finders of the pieces
+        fen = Perft.REFERENCE_POSITIONS["KIWIPETE"][0]
+        board = Setup.from_fen(fen, backend="BITBOARD").board
+        colour = "WHITE" if board.side_to_move == 0 else "BLACK"
+        found = set()
+        for row in range(8):
+            for position in board.get_row(row):
+                if position.piece is not None and position.piece.colour == colour:
+                    found.update(position.piece.move_finder.compact_moves())
+        self.assertEqual(set(BatchMoveGenerator.moves([board])[0]), found)
+
+        # Test with a matrix board
+        self.assertEqual(BatchMoveGenerator.moves([Setup.from_fen(fen).board]), BatchMoveGenerator.moves([board]))
+
+    def test_danger_squares(self):
+        # Test against looking up the attackers of each square with the king taken off
+        dangers = BatchMoveGenerator.danger_squares(self.boards, vectorised=False)
+        for board, danger in zip(self.boards, dangers):
+            side = board.side_to_move
+            without_king = board.occupied ^ (1 << board.king_square(side))
+            expected = sum(1 << square for square in range(64) if board.attackers(square, side ^ 1, without_king))
+            self.assertEqual(danger, expected)
+
+            # Test that the king moves found with them are the same
+            self.assertEqual(board.move_generator.generate(side, danger=danger), board.move_generator.generate(side))
+
+    def test_legality_stages(self):
+        # Test that the check masks and pins give the same moves as the generator finds them itself, without NumPy
+        stages = BatchMoveGenerator.legality_stages(self.boards, vectorised=False)
+        for board, (danger, check_mask, pins) in zip(self.boards, stages):
+            side = board.side_to_move
+            self.assertEqual(board.move_generator.generate(side, danger=danger, check_mask=check_mask, pins=pins),
+                             board.move_generator.generate(side))
+
+        # Test a double check, a single check by a knight and a pinned bishop
+        board = Setup.from_fen("4k3/8/8/8/8/3n4/8/r3K3 w - - 0 1", backend="BITBOARD").board
+        self.assertEqual(BatchMoveGenerator.legality_stages([board], vectorised=False)[0][1], 0)
+        board = Setup.from_fen("4k3/8/8/8/8/3n4/8/4K3 w - - 0 1", backend="BITBOARD").board
+        self.assertEqual(BatchMoveGenerator.legality_stages([board], vectorised=False)[0][1], 1 << 19)
+        board = Setup.from_fen("4k3/8/8/b7/8/8/3B4/4K3 w - - 0 1", backend="BITBOARD").board
+        _, check_mask, (pinned, pin_rays) = BatchMoveGenerator.legality_stages([board], vectorised=False)[0]
+        self.assertEqual(check_mask, BatchMoveGenerator.FULL_BOARD)
+        self.assertEqual(pinned, 1 << 11)
+        self.assertEqual(pin_rays, {11: 1 << 11 | 1 << 18 | 1 << 25 | 1 << 32})
+
+    @unittest.skipIf(batchmovegenerator.numpy is None, "NumPy isn't installed")
+    def test_vectorised(self):
+        self.assertEqual(BatchMoveGenerator.legality_stages(self.boards, vectorised=True),
+                         BatchMoveGenerator.legality_stages(self.boards, vectorised=False))
+
+if __name__ == '__main__':
+    unittest.main()
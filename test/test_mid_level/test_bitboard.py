@@ -0,0 +1,240 @@
+import unittest
+
+from src.game_logic.codes import CodeHelper, WHITE, BLACK, QUIET, DOUBLE_PUSH, EN_PASSANT, CASTLE, PROMOTE_QUEEN, \
+    WHITE_KING_SIDE, WHITE_QUEEN_SIDE, BLACK_KING_SIDE, BLACK_QUEEN_SIDE
+from src.game_logic.helpers import CoordsHelper
+from src.game_logic.mid_level.moves.standardmove import StandardMove
+from src.game_logic.mid_level.support.bitboard import BitBoard
+from src.game_logic.mid_level.support.zobrist import Zobrist
+from src.game_logic.top_level.setup import Setup
+
+
+class TestBitBoard(unittest.TestCase):
+    """
+    Test case for BitBoard object
+    """
+
+    def setUp(self) -> None:
+        self.setup = Setup({'white_name': 'Hugo', 'black_name': 'Tom'}, backend="BITBOARD")
+        self.board = self.setup.board
+
+    def test_backend(self):
+        self.assertEqual(self.board.backend, "BITBOARD")
+        self.assertEqual(Setup({'white_name': 'Hugo', 'black_name': 'Tom'}).board.backend, "MATRIX")
+
+    def test_get_position(self):
+        # Test with valid coords
+        self.assertEqual(self.board.board_mat[0][0], self.board.get_position((0, 0)))
+        self.assertEqual(self.board.get_position((0, 4)).piece.type, "KING")
+
+        # Test with invalid coords
+        self.assertRaises(AssertionError, self.board.get_position, (-1, '1'))
+
+    def test_get_row(self):
+        row = self.board.get_row(1)
+        self.assertEqual(len(row), 8)
+        self.assertTrue(all(pos.has_piece_type("PAWN") for pos in row))
+
+    def test_occupancy(self):
+        # Test initial position
+        self.assertEqual(self.board.colour_occupancy("WHITE"), 0xFFFF)
+        self.assertEqual(self.board.colour_occupancy("BLACK"), 0xFFFF << 48)
+        self.assertEqual(self.board.occupied, 0xFFFF | 0xFFFF << 48)
+        self.assertEqual(self.board.piece_bitboard("WHITE", "PAWN"), 0xFF00)
+        self.assertEqual(self.board.piece_bitboard("BLACK", "KING"), 1 << 60)
+        self.assertEqual(self.board.piece_bitboard("WHITE", "KNIGHT"), 1 << 1 | 1 << 6)
+
+    def test_position_updates_bitboards(self):
+        # Test moving a piece onto an empty position
+        pawn = self.board.get_position((1, 4)).piece
+        pawn.swap_position(self.board.get_position((3, 4)))
+        self.assertEqual(self.board.piece_bitboard("WHITE", "PAWN"), 0xFF00 ^ 1 << 12 | 1 << 28)
+        self.assertEqual(self.board.piece_code_at(28), CodeHelper.piece_code("WHITE", "PAWN"))
+        self.assertIsNone(self.board.piece_code_at(12))
+
+        # Test capturing by replacing the piece on a position
+        knight = self.board.get_position((7, 1)).piece
+        self.board.get_position((3, 4)).piece.reset_position()
+        knight.swap_position(self.board.get_position((3, 4)))
+        self.assertEqual(self.board.piece_bitboard("WHITE", "PAWN"), 0xFF00 ^ 1 << 12)
+        self.assertEqual(self.board.piece_bitboard("BLACK", "KNIGHT"), 1 << 62 | 1 << 28)
+        self.assertEqual(self.board.colour_occupancy("BLACK") & 1 << 57, 0)
+
+        # Test clearing a position directly
+        self.board.get_position((3, 4)).piece = None
+        self.assertEqual(self.board.occupied & 1 << 28, 0)
+
+    def test_squares(self):
+        self.assertEqual(CodeHelper.squares(self.board.piece_bitboard("WHITE", "ROOK")), [0, 7])
+        self.assertEqual(CodeHelper.squares(0), [])
+
+
+    @staticmethod
+    def snapshot(board):
+        return (tuple(board.piece_bitboards), tuple(board.colour_bitboards), board.occupied, tuple(board.mailbox),
+                board.side_to_move, board.castling_rights, board.ep_square, board.halfmove_clock,
+                board.fullmove_number)
+
+    @staticmethod
+    def empty_board(pieces: dict):
+        board = BitBoard(CoordsHelper)
+        for square, (colour, piece_type) in pieces.items():
+            board.set_square(square, CodeHelper.piece_code(colour, piece_type))
+        return board
+
+    def test_make_unmake_move(self):
+        start = self.snapshot(self.board)
+        moves = [(12, 28, DOUBLE_PUSH), (51, 35, DOUBLE_PUSH), (28, 35, QUIET), (59, 35, QUIET)]
+        for move in moves:
+            self.board.make_move(move)
+        self.assertEqual(self.board.piece_code_at(35), CodeHelper.piece_code("BLACK", "QUEEN"))
+        self.assertEqual(self.board.piece_bitboard("WHITE", "PAWN"), 0xFF00 ^ 1 << 12)
+        self.assertEqual(self.board.side_to_move, WHITE)
+        self.assertEqual(self.board.fullmove_number, 3)
+        self.assertEqual(self.board.halfmove_clock, 0)
+
+        # Test that unmaking every move restores the initial position
+        for move in moves:
+            self.board.unmake_move()
+        self.assertEqual(self.snapshot(self.board), start)
+
+    def test_castle(self):
+        board = self.empty_board({4: ("WHITE", "KING"), 0: ("WHITE", "ROOK"), 7: ("WHITE", "ROOK"),
+                                  60: ("BLACK", "KING"), 56: ("BLACK", "ROOK")})
+        start = self.snapshot(board)
+        board.make_move((4, 6, CASTLE))
+        self.assertEqual(board.piece_bitboard("WHITE", "ROOK"), 1 << 0 | 1 << 5)
+        self.assertEqual(board.piece_code_at(6), CodeHelper.piece_code("WHITE", "KING"))
+        self.assertEqual(board.castling_rights, BLACK_KING_SIDE | BLACK_QUEEN_SIDE)
+
+        # Test queen side castling for black
+        board.make_move((60, 58, CASTLE))
+        self.assertEqual(board.piece_bitboard("BLACK", "ROOK"), 1 << 59)
+        self.assertEqual(board.castling_rights, 0)
+
+        board.unmake_move()
+        board.unmake_move()
+        self.assertEqual(self.snapshot(board), start)
+
+        # Test that capturing a rook removes its castling right
+        board.make_move((56, 0, QUIET))
+        self.assertEqual(board.castling_rights, WHITE_KING_SIDE | BLACK_KING_SIDE)
+
+    def test_en_passant(self):
+        board = self.empty_board({4: ("WHITE", "KING"), 36: ("WHITE", "PAWN"), 60: ("BLACK", "KING"),
+                                  51: ("BLACK", "PAWN")})
+        board.side_to_move = BLACK
+        board.make_move((51, 35, DOUBLE_PUSH))
+        self.assertEqual(board.ep_square, 43)
+        start = self.snapshot(board)
+        board.make_move((36, 43, EN_PASSANT))
+        self.assertIsNone(board.piece_code_at(35))
+        self.assertEqual(board.piece_bitboard("BLACK", "PAWN"), 0)
+        self.assertIsNone(board.ep_square)
+        board.unmake_move()
+        self.assertEqual(self.snapshot(board), start)
+
+    def test_promotion(self):
+        board = self.empty_board({4: ("WHITE", "KING"), 48: ("WHITE", "PAWN"), 60: ("BLACK", "KING"),
+                                  57: ("BLACK", "KNIGHT")})
+        start = self.snapshot(board)
+        board.make_move((48, 57, PROMOTE_QUEEN))
+        self.assertEqual(board.piece_bitboard("WHITE", "QUEEN"), 1 << 57)
+        self.assertEqual(board.piece_bitboard("WHITE", "PAWN"), 0)
+        self.assertEqual(board.piece_bitboard("BLACK", "KNIGHT"), 0)
+        self.assertTrue(board.side_in_check(BLACK))
+        board.unmake_move()
+        self.assertEqual(self.snapshot(board), start)
+
+    def test_square_attacked(self):
+        # Test initial position
+        self.assertTrue(self.board.square_attacked(20, WHITE))
+        self.assertFalse(self.board.square_attacked(28, WHITE))
+        self.assertFalse(self.board.square_attacked(21, BLACK))
+        self.assertFalse(self.board.is_in_check("WHITE"))
+
+        # Test with a check from a bishop, once the pawn blocking it moves
+        self.board.make_move((61, 25, QUIET))
+        self.assertFalse(self.board.is_in_check("WHITE"))
+        self.board.make_move((11, 19, QUIET))
+        self.assertTrue(self.board.is_in_check("WHITE"))
+        self.assertTrue(self.board.get_position((0, 4)).piece.is_in_check(self.board))
+
+    def test_move_is_legal(self):
+        # Pin the pawn in front of the queen to the king with a bishop
+        self.board.get_position((7, 5)).piece.swap_position(self.board.get_position((3, 1)))
+        self.assertFalse(self.board.move_is_legal((11, 19, QUIET)))
+        self.assertTrue(self.board.move_is_legal((8, 16, QUIET)))
+        self.assertFalse(StandardMove(self.board, (1, 3), (2, 3)).is_legal())
+        self.assertTrue(StandardMove(self.board, (1, 0), (2, 0)).is_legal())
+
+        # Test that probing doesn't touch the pieces
+        self.assertFalse(self.board.get_position((1, 3)).piece.has_moved)
+        self.assertEqual(self.board.get_position((1, 3)).piece.coords, (1, 3))
+
+    def test_object_moves_update_state(self):
+        start = self.snapshot(self.board)
+        move = StandardMove(self.board, (1, 4), (3, 4))
+        move.execute()
+        self.assertEqual(self.board.ep_square, 20)
+        self.assertEqual(self.board.side_to_move, BLACK)
+        self.assertTrue(move.piece.has_moved)
+
+        # Test that reversing the move restores the state
+        move._reverse()
+        self.assertEqual(self.snapshot(self.board), start)
+        self.assertFalse(move.piece.has_moved)
+
+        # Test that moving a rook removes its castling right
+        self.board.get_position((1, 0)).piece.reset_position()
+        StandardMove(self.board, (0, 0), (2, 0)).execute()
+        self.assertEqual(self.board.castling_rights, WHITE_KING_SIDE | BLACK_KING_SIDE | BLACK_QUEEN_SIDE)
+
+    def test_zobrist_key(self):
+        start_key = self.board.zobrist_key
+        self.assertEqual(start_key, Zobrist.full_key(self.board))
+
+        # Test that moving the knights out and back gives back the same key
+        moves = [(6, 21, QUIET), (62, 45, QUIET), (21, 6, QUIET), (45, 62, QUIET)]
+        for move in moves:
+            self.board.make_move(move)
+            self.assertEqual(self.board.zobrist_key, Zobrist.full_key(self.board))
+        self.assertEqual(self.board.zobrist_key, start_key)
+
+        # Test that losing castling rights changes the key
+        self.board.castling_rights = BLACK_KING_SIDE | BLACK_QUEEN_SIDE
+        self.assertNotEqual(self.board.zobrist_key, start_key)
+        self.assertEqual(self.board.zobrist_key, Zobrist.full_key(self.board))
+
+    def test_zobrist_en_passant(self):
+        board = self.empty_board({4: ("WHITE", "KING"), 36: ("WHITE", "PAWN"), 60: ("BLACK", "KING"),
+                                  51: ("BLACK", "PAWN"), 49: ("BLACK", "PAWN")})
+        board.side_to_move = BLACK
+        # Test that the en passant file counts only when a pawn can capture en passant
+        board.make_move((51, 35, DOUBLE_PUSH))
+        with_ep = board.zobrist_key
+        board.ep_square = None
+        self.assertNotEqual(board.zobrist_key, with_ep)
+        board.ep_square = 43
+        self.assertEqual(board.zobrist_key, with_ep)
+        board.unmake_move()
+        board.make_move((49, 33, DOUBLE_PUSH))
+        without_ep = board.zobrist_key
+        board.ep_square = None
+        self.assertEqual(board.zobrist_key, without_ep)
+
+    def test_zobrist_object_moves(self):
+        start_key = self.board.zobrist_key
+        move = StandardMove(self.board, (1, 4), (3, 4))
+        move.execute()
+        self.assertEqual(self.board.zobrist_key, Zobrist.full_key(self.board))
+        self.board.make_move((51, 35, DOUBLE_PUSH))
+        self.board.make_move((28, 35, QUIET))
+        self.board.unmake_move()
+        self.board.unmake_move()
+        move._reverse()
+        self.assertEqual(self.board.zobrist_key, start_key)
+
+
+if __name__ == '__main__':
+    unittest.main()
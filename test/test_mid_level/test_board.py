@@ -1,6 +1,9 @@
 import unittest
 
+from src.game_logic.codes import DOUBLE_PUSH, EN_PASSANT, CASTLE, PROMOTE_KNIGHT
 from src.game_logic.mid_level.support.board import Board
+from src.game_logic.mid_level.support.zobrist import Zobrist
+from src.game_logic.top_level.setup import Setup
 from test import test_game
 
 
@@ -78,5 +81,30 @@ class TestBoard(unittest.TestCase):
         self.assertFalse(Board.coords_are_valid("str"))
 
 
+    def test_position_key(self):
+        # Test that the key is kept up to date through double pushes, en passant, castling and under-promotion
+        fen = "r3k3/1P6/8/8/5p2/8/4P3/R3K2R w KQq - 0 1"
+        board = Setup.from_fen(fen, backend="MATRIX").board
+        bit_board = Setup.from_fen(fen, backend="BITBOARD").board
+        self.assertEqual(board.position_key, bit_board.position_key)
+        moves = []
+        for compact_move in [(12, 28, DOUBLE_PUSH), (29, 20, EN_PASSANT), (4, 6, CASTLE), (60, 58, CASTLE),
+                             (49, 57, PROMOTE_KNIGHT)]:
+            move = board.get_position((compact_move[0] >> 3, compact_move[0] & 7)).piece.move_finder._create_move(
+                compact_move)
+            move.execute(check_legal=False)
+            bit_board.make_move(compact_move)
+            moves.append(move)
+            self.assertEqual(board.position_key, Zobrist.snapshot_key(board.snapshot()))
+            self.assertEqual(board.position_key, bit_board.position_key)
+
+        # Test that reversing the moves brings back each key
+        for move in reversed(moves):
+            move._reverse()
+            bit_board.unmake_move()
+            self.assertEqual(board.position_key, bit_board.position_key)
+        self.assertEqual(board.to_fen(), fen)
+
+
 if __name__ == '__main__':
     unittest.main()
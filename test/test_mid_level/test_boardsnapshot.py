@@ -0,0 +1,68 @@
+import pickle
+import unittest
+
+from src.game_logic.helpers import CoordsHelper
+from src.game_logic.mid_level.support.bitboard import BitBoard
+from src.game_logic.mid_level.support.zobrist import Zobrist
+from src.game_logic.mid_level.support.piecesquaretables import PieceSquareTables
+from src.game_logic.top_level.perft import Perft
+from src.game_logic.top_level.setup import Setup
+
+
+class TestBoardSnapshot(unittest.TestCase):
+    """
+    Test case for BoardSnapshot objects, and cloning BitBoards from them
+    """
+
+    def setUp(self) -> None:
+        self.fen = Perft.REFERENCE_POSITIONS["KIWIPETE"][0]
+        self.board = Setup.from_fen(self.fen, backend="BITBOARD").board
+
+    def test_snapshot(self):
+        # Test that both backends take the same snapshot
+        snapshot = self.board.snapshot()
+        self.assertEqual(Setup.from_fen(self.fen).board.snapshot(), snapshot)
+        self.assertEqual(snapshot.mailbox, tuple(self.board.mailbox))
+        self.assertEqual(snapshot.castling_rights, self.board.castling_rights)
+
+        # Test that a snapshot doesn't change with the board
+        self.board.make_move(self.board.move_generator.generate(self.board.side_to_move)[0])
+        self.assertNotEqual(self.board.snapshot(), snapshot)
+        self.board.unmake_move()
+        self.assertEqual(self.board.snapshot(), snapshot)
+
+        # Test pickling
+        self.assertEqual(pickle.loads(pickle.dumps(snapshot)), snapshot)
+
+    def test_from_snapshot(self):
+        # Test that the keys and scores are the same as the board the snapshot came from
+        clone = BitBoard.from_snapshot(self.board.snapshot(), CoordsHelper())
+        self.assertEqual(clone.zobrist_key, self.board.zobrist_key)
+        self.assertEqual(clone.zobrist_key, Zobrist.full_key(clone))
+        self.assertEqual((clone.middle_score, clone.end_score, clone.phase),
+                         PieceSquareTables.scores(self.board.mailbox))
+        self.assertEqual(clone.piece_bitboards, self.board.piece_bitboards)
+        self.assertEqual(clone.to_fen(), self.fen)
+        self.assertIsNone(clone.move_generator)
+        self.assertIsNone(clone.get_position((0, 0)).piece)
+
+    def test_clone(self):
+        # Test that a clone can be searched on without changing the original
+        clone = self.board.clone()
+        self.assertIsNot(clone.move_generator, self.board.move_generator)
+        moves = clone.move_generator.generate(clone.side_to_move)
+        self.assertEqual(len(moves), 48)
+        nodes = 0
+        for move in moves:
+            clone.make_move(move)
+            nodes += len(clone.move_generator.generate(clone.side_to_move))
+            clone.unmake_move()
+        self.assertEqual(nodes, 2039)
+        for _ in range(5):
+            clone.make_move(clone.move_generator.generate(clone.side_to_move)[0])
+        self.assertEqual(self.board.snapshot(), Setup.from_fen(self.fen, backend="BITBOARD").board.snapshot())
+        self.assertNotEqual(clone.zobrist_key, self.board.zobrist_key)
+
+
+if __name__ == '__main__':
+    unittest.main()
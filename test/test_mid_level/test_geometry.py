@@ -0,0 +1,76 @@
+import unittest
+
+from src.game_logic.codes import CodeHelper
+from src.game_logic.helpers import TraverseHelper
+from src.game_logic.mid_level.support.geometry import Geometry
+from src.game_logic.mid_level.support.leaperattacks import LeaperAttacks
+from src.game_logic.top_level.setup import Setup
+
+
+class TestGeometry(unittest.TestCase):
+    """
+    Test case for the Geometry tables
+    """
+
+    def test_rays(self):
+        # Test from a corner
+        self.assertEqual(Geometry.RAYS["N"][0], (8, 16, 24, 32, 40, 48, 56))
+        self.assertEqual(Geometry.RAYS["NE"][0], (9, 18, 27, 36, 45, 54, 63))
+        self.assertEqual(Geometry.RAYS["S"][0], ())
+        self.assertEqual(Geometry.RAY_COORDS["W"][(3, 2)], ((3, 1), (3, 0)))
+
+        # Test that each ray matches stepping with a TraverseHelper
+        traverse_helper = TraverseHelper()
+        for bearing, rays in Geometry.RAY_COORDS.items():
+            for coords, ray in rays.items():
+                stepped = []
+                next_coords = traverse_helper.next_coords(coords, bearing)
+                while next_coords in Geometry.SQUARES:
+                    stepped.append(next_coords)
+                    next_coords = traverse_helper.next_coords(next_coords, bearing)
+                self.assertEqual(ray, tuple(stepped))
+
+        # Test with an invalid bearing
+        self.assertRaises(Exception, traverse_helper.next_coords, (0, 0), "UP")
+
+    def test_neighbours(self):
+        # Test that the neighbour tables match the leaper attack tables
+        for square in range(64):
+            self.assertEqual(sum(1 << other for other in Geometry.KNIGHT_SQUARES[square]),
+                             LeaperAttacks.KNIGHT_ATTACKS[square])
+            self.assertEqual(sum(1 << other for other in Geometry.KING_SQUARES[square]),
+                             LeaperAttacks.KING_ATTACKS[square])
+        self.assertEqual(set(Geometry.KNIGHT_COORDS[(0, 0)]), {(1, 2), (2, 1)})
+
+    def test_between_and_line(self):
+        a1, c3, h8, a8, b3 = (CodeHelper.name_square(name) for name in ["a1", "c3", "h8", "a8", "b3"])
+        # Test squares in line
+        self.assertEqual(Geometry.BETWEEN[a1][c3], 1 << CodeHelper.name_square("b2"))
+        self.assertEqual(Geometry.BETWEEN[c3][a1], Geometry.BETWEEN[a1][c3])
+        self.assertEqual(Geometry.LINE[a1][c3], 0x8040201008040201)
+        self.assertEqual(Geometry.LINE[c3][h8], Geometry.LINE[a1][c3])
+        self.assertEqual(Geometry.LINE[a1][a8], 0x0101010101010101)
+
+        # Test squares next to each other
+        self.assertEqual(Geometry.BETWEEN[a1][a1 + 1], 0)
+        self.assertEqual(Geometry.LINE[a1][a1 + 1], 0xFF)
+
+        # Test squares not in line
+        self.assertEqual(Geometry.BETWEEN[a1][b3], 0)
+        self.assertEqual(Geometry.LINE[a1][b3], 0)
+        self.assertEqual(Geometry.LINE[a1][a1], 0)
+
+    def test_move_finder_coords(self):
+        # Test the destination coords found from the tables on a matrix board
+        setup = Setup.from_fen("4k3/8/8/8/3R4/8/1N6/K7 w - - 0 1")
+        board = setup.board
+        rook = board.get_position((3, 3)).piece
+        self.assertEqual(len(rook.move_finder._dest_coords_list()), 14)
+        knight = board.get_position((1, 1)).piece
+        self.assertEqual(set(knight.move_finder._dest_coords_list()), {(3, 0), (3, 2), (2, 3), (0, 3)})
+        king = board.get_position((0, 0)).piece
+        self.assertEqual(set(king.move_finder._dest_coords_list()), {(1, 0), (0, 1)})
+
+
+if __name__ == '__main__':
+    unittest.main()
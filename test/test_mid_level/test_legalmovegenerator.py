@@ -0,0 +1,177 @@
+import unittest
+
+from src.game_logic.codes import CodeHelper, WHITE, BLACK, QUIET, DOUBLE_PUSH, EN_PASSANT, CASTLE
+from src.game_logic.helpers import CoordsHelper
+from src.game_logic.mid_level.move_finders.legalmovegenerator import LegalMoveGenerator
+from src.game_logic.mid_level.moves.standardmove import StandardMove
+from src.game_logic.mid_level.support.bitboard import BitBoard
+from src.game_logic.top_level.setup import Setup
+
+
+class TestLegalMoveGenerator(unittest.TestCase):
+    """
+    Test case for LegalMoveGenerator object
+    """
+
+    def setUp(self) -> None:
+        self.setup = Setup({'white_name': 'Hugo', 'black_name': 'Tom'}, backend="BITBOARD")
+        self.board = self.setup.board
+        self.generator = self.board.move_generator
+
+    @staticmethod
+    def empty_board(pieces: dict, side_to_move: int = WHITE):
+        board = BitBoard(CoordsHelper)
+        for square, (colour, piece_type) in pieces.items():
+            board.set_square(square, CodeHelper.piece_code(colour, piece_type))
+        board.side_to_move = side_to_move
+        board.move_generator = LegalMoveGenerator(board)
+        return board
+
+    def perft(self, depth: int) -> int:
+        if depth == 0:
+            return 1
+        nodes = 0
+        for move in self.generator.moves():
+            self.board.make_move(move)
+            nodes += self.perft(depth - 1)
+            self.board.unmake_move()
+        return nodes
+
+    def test_perft(self):
+        # Test against the known counts for the initial position
+        self.assertEqual(self.perft(1), 20)
+        self.assertEqual(self.perft(2), 400)
+        self.assertEqual(self.perft(3), 8902)
+
+    def test_pinned_piece(self):
+        board = self.empty_board({4: ("WHITE", "KING"), 12: ("WHITE", "ROOK"), 60: ("BLACK", "ROOK"),
+                                  56: ("BLACK", "KING")})
+        # Test that a pinned rook can only move along the pin
+        self.assertEqual(sorted(dest for _, dest, _ in board.move_generator.moves_from(12)), [20, 28, 36, 44, 52, 60])
+
+        # Test ignoring friendly check
+        self.assertEqual(len(board.move_generator.moves_from(12, legal=False)), 13)
+
+    def test_check_evasion(self):
+        board = self.empty_board({4: ("WHITE", "KING"), 8: ("WHITE", "ROOK"), 60: ("BLACK", "ROOK"),
+                                  63: ("BLACK", "KING")})
+        # Test that the only rook move blocks the check
+        self.assertEqual(board.move_generator.moves_from(8), [(8, 12, QUIET)])
+        self.assertEqual(sorted(dest for _, dest, _ in board.move_generator.moves_from(4)), [3, 5, 11, 13])
+
+        # Test with a double check, only the king can move
+        board.set_square(19, CodeHelper.piece_code("BLACK", "KNIGHT"))
+        self.assertTrue(all(source == 4 for source, _, _ in board.move_generator.moves()))
+
+    def test_en_passant_discovered_check(self):
+        board = self.empty_board({32: ("WHITE", "KING"), 36: ("WHITE", "PAWN"), 51: ("BLACK", "PAWN"),
+                                  39: ("BLACK", "ROOK"), 63: ("BLACK", "KING")}, side_to_move=BLACK)
+        board.make_move((51, 35, DOUBLE_PUSH))
+        # Test that en passant is illegal when it leaves the king open on its row
+        self.assertEqual(board.move_generator.moves_from(36), [(36, 44, QUIET)])
+
+        # Test normally, with the rook out of the way
+        board.unmake_move()
+        board.set_square(39, None)
+        board.make_move((51, 35, DOUBLE_PUSH))
+        self.assertIn((36, 43, EN_PASSANT), board.move_generator.moves_from(36))
+
+    def test_castling_through_check(self):
+        board = self.empty_board({4: ("WHITE", "KING"), 0: ("WHITE", "ROOK"), 7: ("WHITE", "ROOK"),
+                                  26: ("BLACK", "BISHOP"), 60: ("BLACK", "KING")})
+        king_moves = board.move_generator.moves_from(4)
+        self.assertNotIn((4, 6, CASTLE), king_moves)
+        self.assertIn((4, 2, CASTLE), king_moves)
+
+    def test_move_finders(self):
+        # Test that pieces find their moves with the generator
+        self.assertEqual(self.board.get_position((0, 1)).piece.num_moves(self.board), 2)
+        self.assertEqual(len(self.board.get_position((0, 0)).piece.moves()), 0)
+        self.assertTrue(self.board.get_position((7, 6)).piece.can_attack_coords((5, 5)))
+        self.assertFalse(self.board.get_position((7, 6)).piece.can_attack_coords((4, 5)))
+
+        # Test checkmate with the fool's mate
+        for source, dest in [((1, 5), (2, 5)), ((6, 4), (4, 4)), ((1, 6), (3, 6)), ((7, 3), (3, 7))]:
+            StandardMove(self.board, source, dest).execute()
+        self.assertTrue(self.setup.players['white_player'].is_checkmated(self.board))
+        self.assertFalse(self.setup.players['black_player'].is_checkmated(self.board))
+        self.assertFalse(self.setup.players['white_player'].has_any_legal_move())
+        self.assertEqual(self.setup.players['black_player'].count_legal_moves(),
+                         len(self.generator.moves(BLACK)))
+
+    def test_lazy_moves(self):
+        # Test that moves are made one at a time, and match the list from moves()
+        knight = self.board.get_position((0, 1)).piece
+        lazy_moves = knight.move_finder.iter_moves()
+        self.assertEqual(next(lazy_moves).dest.coords, (2, 0))
+        self.assertEqual(next(lazy_moves).dest.coords, (2, 2))
+        self.assertIsNone(next(lazy_moves, None))
+        self.assertEqual(list(knight.move_finder.compact_moves()), [(1, 16, QUIET), (1, 18, QUIET)])
+        self.assertTrue(knight.has_any_legal_move())
+        self.assertFalse(self.board.get_position((0, 0)).piece.has_any_legal_move())
+
+        # Test that each promotion of a pawn is a move of its own, with the piece promoted to
+        setup = Setup.from_fen("4k3/1P6/8/8/8/8/8/4K3 w - - 0 1", backend="BITBOARD")
+        pawn = setup.board.get_position((6, 1)).piece
+        self.assertEqual(len(list(pawn.move_finder.compact_moves())), 4)
+        self.assertEqual(pawn.num_moves(setup.board), len(pawn.moves()))
+        self.assertEqual(pawn.num_moves(setup.board), 4)
+        self.assertEqual(sorted(move.compact() for move in pawn.moves()), sorted(pawn.move_finder.compact_moves()))
+        queen_move = [move for move in pawn.moves() if move.promotion.type == "QUEEN"][0]
+        queen_move.execute()
+        self.assertEqual(setup.board.to_fen(), "1Q2k3/8/8/8/8/8/8/4K3 b - - 0 1")
+        queen_move._reverse()
+        self.assertEqual(setup.board.to_fen(), "4k3/1P6/8/8/8/8/8/4K3 w - - 0 1")
+
+        # Test stalemate
+        setup = Setup.from_fen("k7/2Q5/8/8/8/8/8/7K b - - 0 1", backend="BITBOARD")
+        self.assertTrue(setup.players['black_player'].is_stalemated(setup.board))
+        self.assertFalse(setup.players['black_player'].is_checkmated(setup.board))
+        self.assertFalse(setup.players['white_player'].is_stalemated(setup.board))
+
+    def test_generate_from(self):
+        # Test that the moves of a single piece match those found for the whole side
+        for square in range(64):
+            for legal in [True, False]:
+                self.assertEqual(self.generator.generate_from(square, legal), self.generator.moves_from(square, legal))
+
+    def test_move_dependencies(self):
+        board = self.empty_board({4: ("WHITE", "KING"), 20: ("WHITE", "KNIGHT"), 44: ("BLACK", "ROOK"),
+                                  60: ("BLACK", "KING"), 9: ("WHITE", "PAWN")})
+        generator = board.move_generator
+        # Test a knight, which depends on its own square, the squares it attacks and the line to its king
+        self.assertEqual(generator.move_dependencies(20, legal=False), 1 << 20 | generator.attacks_from(20))
+        self.assertEqual(generator.move_dependencies(20), 1 << 20 | generator.attacks_from(20) | 0x1010101010101010)
+
+        # Test a pawn, which depends on the squares it pushes to as well
+        self.assertEqual(generator.move_dependencies(9, legal=False), 1 << 9 | 1 << 17 | 1 << 25 | 1 << 16 | 1 << 18)
+
+        # Test the king, which depends on every square
+        self.assertEqual(generator.move_dependencies(4), LegalMoveGenerator.FULL_BOARD)
+
+    def test_move_cache(self):
+        # Test that cached moves are kept after moves elsewhere
+        setup = Setup.from_fen("4k3/2b5/8/8/8/8/3N3P/4K3 w - - 0 1", backend="BITBOARD")
+        board = setup.board
+        knight = board.get_position((1, 3)).piece
+        self.assertEqual(knight.num_moves(board), 6)
+        StandardMove(board, (1, 7), (2, 7)).execute()
+        StandardMove(board, (7, 4), (7, 3)).execute()
+        self.assertEqual(knight.num_moves(board), 6)
+
+        # Test that a pin from a piece moving onto the line through the knight and its king is seen
+        StandardMove(board, (2, 7), (3, 7)).execute()
+        StandardMove(board, (6, 2), (4, 0)).execute()
+        self.assertEqual(knight.num_moves(board), 0)
+
+        # Test that the king moving off the line frees the knight, and that a square it attacks being vacated is seen
+        StandardMove(board, (0, 4), (0, 5)).execute()
+        self.assertEqual(knight.num_moves(board), 5)
+        StandardMove(board, (4, 0), (3, 1)).execute()
+        self.assertEqual(knight.num_moves(board), 5)
+        StandardMove(board, (0, 5), (0, 6)).execute()
+        self.assertEqual(knight.num_moves(board), 6)
+        self.assertEqual(knight.num_moves(board), len(board.move_generator.moves_from(11)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -70,6 +70,18 @@ class TestPosition(unittest.TestCase):
         # Test with None input
         self.assertFalse(self.position2.has_piece_type(None))
 
+    def test_slots(self):
+        # Test that positions, pieces and moves don't carry a __dict__, on both backends
+        for backend in ["MATRIX", "BITBOARD"]:
+            board = Setup({'white_name': 'Hugo', 'black_name': 'Tom'}, backend=backend).board
+            objects = [board.get_position((row, col)) for row in range(8) for col in range(8)]
+            objects += [pos.piece for pos in objects if pos.piece is not None]
+            if backend == "BITBOARD":
+                objects += board.get_position((0, 1)).piece.moves() + board.get_position((1, 4)).piece.moves()
+            for obj in objects:
+                self.assertFalse(hasattr(obj, "__dict__"), type(obj).__name__)
+            self.assertRaises(AttributeError, setattr, objects[0], "colour", "WHITE")
+
 
 if __name__ == '__main__':
     unittest.main()
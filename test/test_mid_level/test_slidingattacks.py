@@ -0,0 +1,72 @@
+import random
+import unittest
+
+from src.game_logic.mid_level.support.slidingattacks import SlidingAttacks
+from src.game_logic.top_level.setup import Setup
+
+
+class TestSlidingAttacks(unittest.TestCase):
+    """
+    Test case for the SlidingAttacks tables
+    """
+
+    def test_rook_attacks(self):
+        # Test on an empty board
+        self.assertEqual(SlidingAttacks.rook_attacks(0, 0), 0x01010101010101FE)
+
+        # Test with blockers, which are included in the attacks
+        occupied = 1 << 3 | 1 << 16
+        self.assertEqual(SlidingAttacks.rook_attacks(0, occupied), 1 << 1 | 1 << 2 | 1 << 3 | 1 << 8 | 1 << 16)
+
+    def test_bishop_attacks(self):
+        # Test on an empty board
+        self.assertEqual(SlidingAttacks.bishop_attacks(0, 0), 0x8040201008040200)
+
+        # Test with a blocker
+        self.assertEqual(SlidingAttacks.bishop_attacks(0, 1 << 18), 1 << 9 | 1 << 18)
+
+    def test_queen_attacks(self):
+        self.assertEqual(SlidingAttacks.queen_attacks(27, 0),
+                         SlidingAttacks.rook_attacks(27, 0) | SlidingAttacks.bishop_attacks(27, 0))
+        self.assertRaises(ValueError, SlidingAttacks.attacks, "KNIGHT", 27, 0)
+
+    def test_tables_match_slow_attacks(self):
+        rng = random.Random(0)
+        for i in range(2000):
+            square = rng.randrange(64)
+            occupied = rng.getrandbits(64) & rng.getrandbits(64)
+            self.assertEqual(SlidingAttacks.rook_attacks(square, occupied),
+                             SlidingAttacks.slow_attacks(square, occupied, SlidingAttacks.ROOK_DIRECTIONS))
+            self.assertEqual(SlidingAttacks.bishop_attacks(square, occupied),
+                             SlidingAttacks.slow_attacks(square, occupied, SlidingAttacks.BISHOP_DIRECTIONS))
+
+
+class TestRangedMoveFinderBackends(unittest.TestCase):
+    """
+    Checks that RangedMoveFinder finds the same destination coords on a Board and a BitBoard
+    """
+
+    def setUp(self) -> None:
+        names = {'white_name': 'Hugo', 'black_name': 'Tom'}
+        self.boards = [Setup(names).board, Setup(names, backend="BITBOARD").board]
+        for board in self.boards:
+            # Open lines for the queen and bishop, and put an enemy pawn in their path
+            board.get_position((1, 3)).piece.swap_position(board.get_position((3, 3)))
+            board.get_position((1, 4)).piece.swap_position(board.get_position((2, 4)))
+            board.get_position((6, 6)).piece.swap_position(board.get_position((3, 6)))
+
+    def dest_coords(self, board, coords):
+        return sorted(board.get_position(coords).piece.move_finder._dest_coords_list())
+
+    def test_dest_coords(self):
+        for coords in [(0, 3), (0, 5), (0, 0), (7, 5)]:
+            matrix, bitboard = [self.dest_coords(board, coords) for board in self.boards]
+            self.assertEqual(matrix, bitboard)
+
+        # Test that the queen stops at the enemy pawn on the diagonal
+        self.assertEqual(self.dest_coords(self.boards[1], (0, 3)),
+                         [(1, 3), (1, 4), (2, 3), (2, 5), (3, 6)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,8 @@
 import unittest
 
+from src.game_logic.codes import CodeHelper
 from src.game_logic.pieces import Bishop, Rook, Queen
+from src.game_logic.top_level.setup import Setup
 from test import test_game
 
 
@@ -34,5 +36,13 @@ class TestRangedPiece(unittest.TestCase):
         self.assertEqual([], self.bishop1._RangedPiece__move_coords(self.board))
         pass
 
+    def test_capture_blocks(self):
+        # Test that a slider can capture the first enemy piece in a bearing, but not move past it to the ones behind
+        for backend in ["MATRIX", "BITBOARD"]:
+            board = Setup.from_fen("4k3/p7/8/8/p7/8/8/R3K3 w - - 0 1", backend=backend).board
+            rook = board.get_position((0, 0)).piece
+            self.assertEqual(sorted(CodeHelper.move_name(move.compact()) for move in rook.moves()),
+                             ["a1a2", "a1a3", "a1a4", "a1b1", "a1c1", "a1d1"])
+
 if __name__ == '__main__':
     unittest.main()
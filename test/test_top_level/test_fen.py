@@ -0,0 +1,62 @@
+import unittest
+
+from src.game_logic.codes import BLACK, WHITE_KING_SIDE, BLACK_QUEEN_SIDE
+from src.game_logic.mid_level.moves.standardmove import StandardMove
+from src.game_logic.top_level.perft import Perft
+from src.game_logic.top_level.setup import Setup
+
+
+class TestFen(unittest.TestCase):
+    """
+    Test case for loading positions with Setup.from_fen() and describing them with Board.to_fen()
+    """
+
+    def test_from_fen(self):
+        for backend in ["MATRIX", "BITBOARD"]:
+            setup = Setup.from_fen("r3k3/8/8/8/3pP3/8/8/4K2R b Kq e3 0 12", backend=backend)
+            board = setup.board
+            self.assertEqual(board.backend, backend)
+            self.assertEqual(board.side_to_move, BLACK)
+            self.assertEqual(board.castling_rights, WHITE_KING_SIDE | BLACK_QUEEN_SIDE)
+            self.assertEqual(board.ep_square, 20)
+            self.assertEqual(board.fullmove_number, 12)
+            self.assertEqual(len(setup.players["white_player"].pieces), 3)
+            self.assertEqual(setup.players["black_player"].name, "Black")
+            self.assertTrue(board.get_position((3, 4)).piece.has_moved)
+            self.assertFalse(board.get_position((0, 7)).piece.has_moved)
+
+        # Test without clocks
+        self.assertEqual(Setup.from_fen("4k3/8/8/8/8/8/8/4K3 w - -").board.fullmove_number, 1)
+
+    def test_invalid_fen(self):
+        invalid = ["8/8/8/8/8/8/8/4K3 w - - 0 1",  # Missing king
+                   "4k3/8/8/8/8/8/8/4KK2 w - - 0 1",  # Two kings
+                   "4k3/8/8/8/8/8/8/4K3 x - - 0 1",  # Side to move
+                   "4k3/8/8/8/8/8/8/4K3 w KX - 0 1",  # Castling rights
+                   "4k3/8/8/8/8/8/8/4K3 w - e4 0 1",  # En passant square
+                   "4k3/8/8/8/8/8/8/4K3 w - - x 1",  # Clocks
+                   "4k3/8/8/8/8/8/8/4K3p w - - 0 1",  # Row too long
+                   "4k3/8/8/8/8/8/4K3 w - - 0 1",  # Too few rows
+                   "4k3/8/8/8/8/8/8/P3K3 w - - 0 1",  # Pawn on the first row
+                   "4k3/8/8/8/8/8/8/4K2X w - - 0 1"]  # Piece letter
+        for fen in invalid:
+            self.assertRaises(ValueError, Setup.from_fen, fen)
+
+    def test_to_fen(self):
+        # Test that the reference positions come back the same
+        for fen, counts in Perft.REFERENCE_POSITIONS.values():
+            self.assertEqual(Setup.from_fen(fen).board.to_fen(), fen)
+            self.assertEqual(Setup.from_fen(fen, backend="BITBOARD").board.to_fen(), fen)
+
+        # Test that the game state follows moves and their reversal
+        for backend in ["MATRIX", "BITBOARD"]:
+            board = Setup.from_fen(Setup.STARTING_FEN, backend=backend).board
+            move = StandardMove(board, (1, 4), (3, 4))
+            move.execute(check_legal=False)
+            self.assertEqual(board.to_fen(), "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1")
+            move._reverse()
+            self.assertEqual(board.to_fen(), Setup.STARTING_FEN)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,10 +1,131 @@
 import unittest
 
+from src.game_logic.codes import CodeHelper
+from src.game_logic.mid_level.moves.standardmove import StandardMove
+from src.game_logic.top_level.game import Game
+from src.game_logic.top_level.setup import Setup
+
 
 class MyTestCase(unittest.TestCase):
     def test_something(self):
         self.assertEqual(True, False)  # add assertion here
 
 
+class TestGame(unittest.TestCase):
+    """
+    Test case for the draw detection of a Game object
+    """
+
+    @staticmethod
+    def game(fen: str = None, backend: str = "BITBOARD") -> Game:
+        return Game(Setup({'white_name': 'Hugo', 'black_name': 'Tom'}, backend=backend, fen=fen))
+
+    @staticmethod
+    def shuffle_knights(board, check_legal: bool = True) -> list:
+        moves = []
+        for source, dest in [((0, 6), (2, 5)), ((7, 6), (5, 5)), ((2, 5), (0, 6)), ((5, 5), (7, 6))]:
+            move = StandardMove(board, source, dest)
+            move.execute(check_legal=check_legal)
+            moves.append(move)
+        return moves
+
+    def test_repetition(self):
+        for backend in ["BITBOARD", "MATRIX"]:
+            game = self.game(backend=backend)
+            board = game.board
+            start_key = board.position_key
+
+            # Test that the start position comes up again after the knights go out and back
+            self.shuffle_knights(board, check_legal=backend == "BITBOARD")
+            self.assertEqual(board.position_key, start_key)
+            self.assertEqual(board.repetition_count(), 2)
+            self.assertFalse(game.is_draw())
+            moves = self.shuffle_knights(board, check_legal=backend == "BITBOARD")
+            self.assertEqual(board.repetition_count(), 3)
+            self.assertEqual(game.draw_reason(), "REPETITION")
+
+            # Test that reversing moves takes their keys off the history
+            moves[-1]._reverse()
+            self.assertEqual(len(board.key_history), 7)
+            self.assertEqual(board.repetition_count(), 2)
+            self.assertFalse(game.is_draw())
+
+        # Test that both backends give the same keys
+        self.assertEqual(self.game(backend="MATRIX").board.position_key, self.game().board.position_key)
+
+        # Test that positions before a pawn move aren't searched
+        game = self.game()
+        board = game.board
+        self.shuffle_knights(board)
+        StandardMove(board, (1, 0), (2, 0)).execute()
+        StandardMove(board, (6, 0), (5, 0)).execute()
+        self.shuffle_knights(board)
+        self.shuffle_knights(board)
+        self.assertEqual(board.repetition_count(), 3)
+        self.assertEqual(len(board.key_history), 14)
+
+    def test_repetition_search(self):
+        # Test that moves played with make_move() are on the same history as executed moves
+        game = self.game()
+        board = game.board
+        self.shuffle_knights(board)
+        g1, f3, g8, f6 = (CodeHelper.name_square(name) for name in ["g1", "f3", "g8", "f6"])
+        for move in [(g1, f3, 0), (g8, f6, 0), (f3, g1, 0), (f6, g8, 0)]:
+            board.make_move(move)
+        self.assertTrue(game.is_draw())
+        board.unmake_move()
+        self.assertEqual(board.repetition_count(), 2)
+        self.assertEqual(len(board.key_history), 7)
+
+    def test_fifty_move(self):
+        game = self.game("4k3/8/8/8/8/8/4P3/R3K3 w - - 99 80")
+        self.assertFalse(game.is_draw())
+        StandardMove(game.board, (0, 0), (1, 0)).execute()
+        self.assertEqual(game.draw_reason(), "FIFTY_MOVE")
+
+        # Test that a pawn move resets the clock
+        game = self.game("4k3/8/8/8/8/8/4P3/R3K3 w - - 99 80")
+        StandardMove(game.board, (1, 4), (2, 4)).execute()
+        self.assertEqual(game.board.halfmove_clock, 0)
+        self.assertFalse(game.is_draw())
+
+    def test_turns(self):
+        game = self.game()
+        game.start_game()
+        self.assertEqual(game.curr_player.colour, "WHITE")
+        self.assertEqual(game.moves_for_coords((6, 4)), [])
+        self.assertEqual(len(game.moves_for_coords((0, 6))), 2)
+
+        # Test that executing a move passes the turn
+        move = game.execute_move(game.moves_for_coords((1, 4)), "e4")
+        self.assertEqual(move.dest.coords, (3, 4))
+        self.assertEqual(game.curr_player.colour, "BLACK")
+        self.assertEqual(game.game_state(), "IN_PROGRESS")
+        self.assertRaises(ValueError, game.execute_move, game.moves_for_coords((6, 4)), "e3")
+
+        # Test states
+        self.assertEqual(self.game("7k/6Q1/6K1/8/8/8/8/8 b - - 0 1").game_state(), "CHECKMATE")
+        self.assertEqual(self.game("7k/5Q2/6K1/8/8/8/8/8 b - - 0 1").game_state(), "STALEMATE")
+        self.assertEqual(self.game("7k/8/6K1/8/8/8/8/7Q b - - 0 1").game_state(), "CHECK")
+
+    def test_insufficient_material(self):
+        fens = {
+            "4k3/8/8/8/8/8/8/4K3 w - - 0 1": True,
+            "4k3/8/8/8/8/8/8/2B1K3 w - - 0 1": True,
+            "4k3/8/8/8/8/8/8/1N2K3 w - - 0 1": True,
+            "2b1k3/8/8/8/8/8/8/2B1K3 w - - 0 1": False,
+            "3bk3/8/8/8/8/8/8/2B1K3 w - - 0 1": True,
+            "4k3/8/8/8/8/8/8/1NB1K3 w - - 0 1": False,
+            "4k3/8/8/8/8/8/8/1N1NK3 w - - 0 1": False,
+            "4k3/8/8/8/8/8/P7/4K3 w - - 0 1": False,
+            "4k3/8/8/8/8/8/8/3RK3 w - - 0 1": False,
+        }
+        for fen, expected in fens.items():
+            for backend in ["BITBOARD", "MATRIX"]:
+                game = self.game(fen, backend)
+                self.assertEqual(game.board.has_insufficient_material(), expected, (fen, backend))
+            self.assertEqual(self.game(fen).draw_reason() == "INSUFFICIENT_MATERIAL", expected)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+
+from src.game_logic.top_level.perft import Perft
+
+
+class TestPerft(unittest.TestCase):
+    """
+    Test case for Perft object
+    """
+
+    def test_count(self):
+        # Test normally
+        self.assertEqual(Perft().count(3), 8902)
+        self.assertEqual(Perft().count(0), 1)
+
+        # Test with a negative depth
+        self.assertRaises(AssertionError, Perft().count, -1)
+
+    def test_divide(self):
+        fen, known_counts = Perft.REFERENCE_POSITIONS["KIWIPETE"]
+        counts = Perft(fen).divide(2)
+        self.assertEqual(len(counts), known_counts[0])
+        self.assertEqual(sum(counts.values()), known_counts[1])
+        self.assertEqual(counts["e1g1"], 43)
+
+    def test_reference_positions(self):
+        self.assertEqual(Perft.check_reference_positions(max_nodes=10000), [])
+
+    def test_objects(self):
+        # Test executing and reversing Move objects against the reference positions
+        self.assertEqual(Perft.check_reference_positions(max_nodes=3000, objects=True), [])
+
+        # Test that each move is reversed, leaving the board as it was
+        fen, known_counts = Perft.REFERENCE_POSITIONS["PROMOTION"]
+        perft = Perft(fen, objects=True)
+        counts = perft.divide(2)
+        self.assertEqual(counts, Perft(fen).divide(2))
+        self.assertEqual(sum(counts.values()), known_counts[1])
+        self.assertEqual(perft.board.to_fen(), fen)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import io
+import unittest
+
+from src.game_logic.top_level.pgn import PgnGame, PgnReader, PgnReplayer
+
+PGN = '''[Event "Paris"]
+[White "Paul Morphy"]
+[Black "Duke Karl / Count Isouard"]
+[Result "1-0"]
+
+1. e4 e5 2. Nf3 d6 3. d4 Bg4 {This is a weak move
+[already].} 4. dxe5 Bxf3 5. Qxf3 dxe5 6. Bc4 Nf6 7. Qb3 Qe7
+8. Nc3 c6 9. Bg5 (9. Be3 $1) b5 10. Nxb5 cxb5 11. Bxb5+ Nbd7 12. O-O-O Rd8
+13. Rxd7 Rxd7 14. Rd1 Qe6 15. Bxd7+ Nxd7 16. Qb8+ Nxb8 17. Rd8# 1-0
+
+[Event "Endgame"]
+[White "Hugo"]
+[Black "Tom"]
+[FEN "8/1P2k3/8/3pP3/8/8/8/4K3 w - d6 0 1"]
+[SetUp "1"]
+[Result "*"]
+
+1. exd6+ Kxd6 2. b8=Q+ Kc5 *
+'''
+
+
+class TestPgn(unittest.TestCase):
+    """
+    Test case for PgnReader, PgnGame and PgnReplayer objects
+    """
+
+    def setUp(self) -> None:
+        self.replayer = PgnReplayer()
+
+    def test_read(self):
+        games = list(PgnReader(io.StringIO(PGN)))
+        self.assertEqual(len(games), 2)
+        self.assertEqual(games[0].headers["White"], "Paul Morphy")
+        self.assertEqual(games[1].fen, "8/1P2k3/8/3pP3/8/8/8/4K3 w - d6 0 1")
+
+        # Test with a header filter
+        games = list(PgnReader(io.StringIO(PGN), header_filter=lambda headers: headers["White"] == "Hugo"))
+        self.assertEqual([game.headers["Event"] for game in games], ["Endgame"])
+
+    def test_san_moves(self):
+        game = PgnGame({}, "1. e4 {a comment (with brackets)} e5 (1... c5 2. Nf3) 2. Nf3 $2 Nc6 ; rest of line\n3. Bb5 1/2-1/2")
+        self.assertEqual(list(game.san_moves()), ["e4", "e5", "Nf3", "Nc6", "Bb5"])
+
+    def test_replay(self):
+        games = list(PgnReader(io.StringIO(PGN)))
+        setup, moves = self.replayer.replay(games[0])
+        self.assertEqual(len(moves), 33)
+        self.assertEqual(setup.board.to_fen(), "1n1Rkb1r/p4ppp/4q3/4p1B1/4P3/8/PPP2PPP/2K5 b k - 1 17")
+        self.assertTrue(setup.players["black_player"].is_checkmated(setup.board))
+
+        # Test with en passant and promotion
+        setup, moves = self.replayer.replay(games[1])
+        self.assertEqual(setup.board.to_fen(), "1Q6/8/8/2k5/8/8/8/4K3 w - - 1 3")
+        self.assertEqual(setup.board.get_position((7, 1)).piece.type, "QUEEN")
+        self.assertEqual(len(setup.players["white_player"].pieces), 4)
+
+        # Test that reversing the moves gets back to the start
+        for move in reversed(moves):
+            move._reverse()
+        self.assertEqual(setup.board.to_fen(), games[1].fen)
+
+    def test_resolve_errors(self):
+        setup, moves = self.replayer.replay(PgnGame({}, "1. Nf3 d5 2. Ng5 e5 3. Nc3 h6"))
+        self.assertRaises(ValueError, self.replayer.resolve, setup, "Ne4")  # Ambiguous
+        self.assertRaises(ValueError, self.replayer.resolve, setup, "Ke3")  # Illegal
+        self.assertRaises(ValueError, self.replayer.resolve, setup, "Zz9")  # Unreadable
+        self.assertEqual(self.replayer.resolve(setup, "Nge4").source.coords, (4, 6))
+
+    def test_replay_all(self):
+        results = list(self.replayer.replay_all(PgnReader(io.StringIO(PGN))))
+        self.assertEqual([len(moves) for game, setup, moves in results], [33, 4])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+import asyncio
+import json
+import threading
+import unittest
+from unittest import mock
+
+from src.ui.gameserver import GameServer
+
+
+class TestGameServer(unittest.IsolatedAsyncioTestCase):
+    """
+    Test case for GameServer object
+    """
+
+    async def asyncSetUp(self) -> None:
+        self.server = GameServer()
+        await self.server.start()
+
+    async def asyncTearDown(self) -> None:
+        await self.server.close()
+
+    async def connect(self):
+        return await asyncio.open_connection(*self.server.address)
+
+    @staticmethod
+    async def request(reader, writer, request: dict) -> dict:
+        writer.write(json.dumps(request).encode() + b"\n")
+        await writer.drain()
+        return json.loads(await asyncio.wait_for(reader.readline(), 10))
+
+    async def test_play(self):
+        white = await self.connect()
+        black = await self.connect()
+        state = await self.request(*white, {"action": "new_game", "white": "Hugo", "black": "Tom"})
+        game_id = state["game_id"]
+        self.assertEqual(state["state"], "IN_PROGRESS")
+        self.assertEqual(state["to_move"], "WHITE")
+        self.assertEqual((await self.request(*black, {"action": "join", "game_id": game_id}))["fen"], state["fen"])
+
+        # Test that a move is pushed to every client of the game
+        state = await self.request(*white, {"action": "move", "game_id": game_id, "move": "e2e4"})
+        self.assertEqual(state["last_move"], "e2e4")
+        self.assertEqual(state["to_move"], "BLACK")
+        pushed = json.loads(await asyncio.wait_for(black[0].readline(), 10))
+        self.assertEqual(pushed, state)
+
+        # Test a fool's mate
+        for move in ["f7f6", "d2d3", "g7g5", "d1h5"]:
+            state = await self.request(*white, {"action": "move", "game_id": game_id, "move": move})
+        self.assertEqual(state["state"], "CHECKMATE")
+        error = await self.request(*white, {"action": "move", "game_id": game_id, "move": "a7a6"})
+        self.assertEqual(error, {"event": "error", "message": "Game is over"})
+
+        for _, writer in [white, black]:
+            writer.close()
+
+    async def test_errors(self):
+        reader, writer = await self.connect()
+        state = await self.request(reader, writer, {"action": "new_game"})
+        game_id = state["game_id"]
+
+        # Test illegal and badly formed moves
+        for move in ["e2e5", "e7e5", "e2", "z9z9"]:
+            response = await self.request(reader, writer, {"action": "move", "game_id": game_id, "move": move})
+            self.assertEqual(response["event"], "error")
+        response = await self.request(reader, writer, {"action": "move", "game_id": 99, "move": "e2e4"})
+        self.assertEqual(response["message"], "No game with id 99")
+        writer.write(b"not json\n")
+        self.assertEqual(json.loads(await reader.readline())["message"], "Request isn't valid JSON")
+        self.assertEqual((await self.request(reader, writer, {"action": "dance"}))["event"], "error")
+
+        # Test requests that aren't objects, or have fields of the wrong type, keeping the connection open
+        for request in [5, [1], {"action": "join", "game_id": [1]}, {"action": "join", "game_id": True},
+                        {"action": "new_game", "fen": 5}, {"action": "new_game", "white": {}},
+                        {"action": "move", "game_id": game_id, "move": 5}]:
+            self.assertEqual((await self.request(reader, writer, request))["event"], "error")
+        response = await self.request(reader, writer, {"action": "new_game", "fen": "garbage"})
+        self.assertEqual(response["event"], "error")
+        self.assertEqual(self.server.num_games, 1)
+
+        # Test listing moves and closing the game
+        moves = await self.request(reader, writer, {"action": "moves", "game_id": game_id})
+        self.assertEqual(len(moves["moves"]), 20)
+        self.assertIn("g1f3", moves["moves"])
+        self.assertEqual(self.server.num_games, 1)
+        self.assertEqual((await self.request(reader, writer, {"action": "close_game", "game_id": game_id}))["event"],
+                         "closed")
+        self.assertEqual(self.server.num_games, 0)
+        writer.close()
+
+    async def test_promotion(self):
+        reader, writer = await self.connect()
+        state = await self.request(reader, writer, {"action": "new_game", "fen": "8/1P2k3/8/8/8/8/8/4K3 w - - 0 1"})
+        state = await self.request(reader, writer, {"action": "move", "game_id": state["game_id"], "move": "b7b8n"})
+        self.assertEqual(state["fen"], "1N6/4k3/8/8/8/8/8/4K3 b - - 0 1")
+        self.assertEqual(state["draw_reason"], "INSUFFICIENT_MATERIAL")
+        self.assertEqual(state["state"], "DRAW")
+
+        # Test that every promotion is listed
+        state = await self.request(reader, writer, {"action": "new_game", "fen": "8/1P2k3/8/8/8/8/8/4K3 w - - 0 1"})
+        moves = await self.request(reader, writer, {"action": "moves", "game_id": state["game_id"]})
+        self.assertEqual(sorted(move for move in moves["moves"] if move.startswith("b7")),
+                         ["b7b8b", "b7b8n", "b7b8q", "b7b8r"])
+        writer.close()
+
+    async def test_close_while_moving(self):
+        first = await self.connect()
+        second = await self.connect()
+        game_id = (await self.request(*first, {"action": "new_game"}))["game_id"]
+        await self.request(*second, {"action": "join", "game_id": game_id})
+
+        started, release = threading.Event(), threading.Event()
+
+        def execute_move_name(game, move_name):
+            started.set()
+            release.wait(10)
+
+        # Test closing a game while a move of it is in the executor
+        with mock.patch.object(GameServer, "execute_move_name", side_effect=execute_move_name):
+            first[1].write(json.dumps({"action": "move", "game_id": game_id, "move": "e2e4"}).encode() + b"\n")
+            await first[1].drain()
+            await asyncio.get_running_loop().run_in_executor(None, started.wait, 10)
+            self.assertEqual((await self.request(*second, {"action": "close_game", "game_id": game_id}))["event"],
+                             "closed")
+            release.set()
+            self.assertEqual(json.loads(await asyncio.wait_for(first[0].readline(), 10))["event"], "closed")
+            error = json.loads(await asyncio.wait_for(first[0].readline(), 10))
+            self.assertEqual(error, {"event": "error", "message": f"No game with id {game_id}"})
+
+        # Test that an unexpected error in the executor is sent as an error, keeping the connection open
+        game_id = (await self.request(*first, {"action": "new_game"}))["game_id"]
+        with mock.patch.object(GameServer, "execute_move_name", side_effect=RuntimeError("broken")):
+            error = await self.request(*first, {"action": "move", "game_id": game_id, "move": "e2e4"})
+            self.assertEqual(error["event"], "error")
+            self.assertIn("broken", error["message"])
+        self.assertEqual((await self.request(*first, {"action": "move", "game_id": game_id, "move": "e2e4"}))["event"],
+                         "state")
+
+        for _, writer in [first, second]:
+            writer.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+import io
+import time
+import unittest
+
+from src.game_logic.engine.searchengine import SearchEngine
+from src.game_logic.top_level.setup import Setup
+from src.ui.uci import UciAdapter
+
+
+class TestUciAdapter(unittest.TestCase):
+    """
+    Test case for UciAdapter object
+    """
+
+    def setUp(self) -> None:
+        self.output = io.StringIO()
+        self.adapter = UciAdapter(self.output, table_size_mb=1)
+
+    def tearDown(self) -> None:
+        self.adapter.stop()
+
+    def lines(self) -> list[str]:
+        return self.output.getvalue().splitlines()
+
+    def wait(self) -> None:
+        while self.adapter.searching:
+            time.sleep(0.01)
+
+    def test_handshake(self):
+        self.assertTrue(self.adapter.handle("uci"))
+        self.assertEqual(self.lines()[-1], "uciok")
+        self.adapter.handle("isready")
+        self.assertEqual(self.lines()[-1], "readyok")
+
+        # Test that unknown commands and blank lines are ignored
+        self.assertTrue(self.adapter.handle("debug on"))
+        self.assertTrue(self.adapter.handle(""))
+        self.assertFalse(self.adapter.handle("quit"))
+
+    def test_position(self):
+        self.adapter.handle("position startpos moves e2e4 e7e5 g1f3")
+        self.assertEqual(self.adapter.board.to_fen(),
+                         "rnbqkbnr/pppp1ppp/8/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R b KQkq - 1 2")
+
+        fen = "4k3/8/8/8/8/8/8/R3K2R w KQ - 0 1"
+        self.adapter.handle(f"position fen {fen} moves e1g1")
+        self.assertEqual(self.adapter.board.to_fen(), "4k3/8/8/8/8/8/8/R4RK1 b - - 1 1")
+
+        # Test that an illegal move leaves the position as it was
+        self.adapter.handle("position startpos moves e2e5")
+        self.assertEqual(self.lines()[-1], "info string Illegal move 'e2e5'")
+        self.assertEqual(self.adapter.board.to_fen(), "4k3/8/8/8/8/8/8/R4RK1 b - - 1 1")
+
+    def test_parse_position(self):
+        self.assertEqual(UciAdapter.parse_position(["startpos"]), (Setup.STARTING_FEN, []))
+        self.assertEqual(UciAdapter.parse_position("fen 8/8/8/8/8/8/8/K6k w - - 0 1 moves a1a2".split()),
+                         ("8/8/8/8/8/8/8/K6k w - - 0 1", ["a1a2"]))
+        with self.assertRaises(ValueError):
+            UciAdapter.parse_position(["moves", "e2e4"])
+
+    def test_parse_go(self):
+        self.assertEqual(UciAdapter.parse_go("wtime 1000 btime 2000 winc 10 binc 20 movestogo 5".split()),
+                         {"wtime": 1000, "btime": 2000, "winc": 10, "binc": 20, "movestogo": 5})
+        self.assertEqual(UciAdapter.parse_go(["infinite"]), {"infinite": True})
+
+        # Test that unknown and unreadable params are skipped
+        self.assertEqual(UciAdapter.parse_go("ponder movetime x depth 3".split()), {"depth": 3})
+
+    def test_time_budget(self):
+        self.assertAlmostEqual(self.adapter.time_budget({"movetime": 1000}, "WHITE"), 1 - UciAdapter.MOVE_OVERHEAD)
+        params = {"wtime": 60000, "btime": 3000, "binc": 1000}
+        self.assertAlmostEqual(self.adapter.time_budget(params, "WHITE"), 2 - UciAdapter.MOVE_OVERHEAD)
+        self.assertAlmostEqual(self.adapter.time_budget(params, "BLACK"), 0.85 - UciAdapter.MOVE_OVERHEAD)
+
+        # Test that no more than half of the time left is used
+        params = {"wtime": 1000, "movestogo": 1}
+        self.assertAlmostEqual(self.adapter.time_budget(params, "WHITE"), 0.5 - UciAdapter.MOVE_OVERHEAD)
+
+        self.assertEqual(self.adapter.time_budget({"depth": 3}, "WHITE"), float("inf"))
+        self.assertEqual(self.adapter.time_budget({"infinite": True, "wtime": 1000}, "WHITE"), float("inf"))
+
+    def test_go(self):
+        self.adapter.handle("position fen 6k1/5ppp/8/8/8/8/5PPP/R5K1 w - - 0 1")
+        self.adapter.handle("go movetime 5000")
+        self.wait()
+        self.assertEqual(self.lines()[-1], "bestmove a1a8")
+        self.assertIn("score mate 1", self.lines()[-2])
+
+        # Test with no legal moves
+        self.adapter.handle("position fen k7/2Q5/1K6/8/8/8/8/8 b - - 0 1")
+        self.adapter.handle("go depth 3")
+        self.wait()
+        self.assertEqual(self.lines()[-1], "bestmove 0000")
+
+    def test_stop(self):
+        self.adapter.handle("position startpos")
+        self.adapter.handle("go infinite")
+
+        # Test that commands are answered while searching
+        self.adapter.handle("isready")
+        self.assertEqual(self.lines()[-1], "readyok")
+        self.assertTrue(self.adapter.searching)
+
+        self.adapter.handle("stop")
+        self.assertFalse(self.adapter.searching)
+        self.assertTrue(self.lines()[-1].startswith("bestmove "))
+        self.assertEqual(len([line for line in self.lines() if line.startswith("bestmove")]), 1)
+
+    def test_score_name(self):
+        self.assertEqual(UciAdapter.score_name(35), "cp 35")
+        self.assertEqual(UciAdapter.score_name(SearchEngine.MATE - 3), "mate 2")
+        self.assertEqual(UciAdapter.score_name(-SearchEngine.MATE + 2), "mate -1")
+
+
+if __name__ == '__main__':
+    unittest.main()